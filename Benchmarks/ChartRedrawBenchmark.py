@@ -0,0 +1,138 @@
+"""
+Sales chart redraw benchmark
+Compares the old clear-and-redraw plot_sales_chart against SalesTrendChart
+for 7/30/365-day and 3-year series, headless on the Agg backend
+(no Qt or database needed)
+
+Usage (from the project root):
+    python Benchmarks/ChartRedrawBenchmark.py
+    python Benchmarks/ChartRedrawBenchmark.py --repeat 50
+"""
+
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from Utilities.TimeSeries import lttb
+from View.AdminGUI.SalesTrendChart import SalesTrendChart
+
+
+SERIES_DAYS = (7, 30, 365, 3 * 365)
+
+
+def make_series(days: int, seed: int = 0):
+    """Date labels and random daily sales ending today"""
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    dates = [today - datetime.timedelta(days=days - 1 - i) for i in range(days)]
+    return [d.strftime('%b %d') for d in dates], [rng.uniform(5000, 50000) for _ in dates]
+
+
+def legacy_plot(figure, canvas, dates, sales, title):
+    """The original AdminDashboardView.plot_sales_chart"""
+    figure.clear()
+    ax = figure.add_subplot(111)
+    ax.plot(dates, sales, marker='o', linewidth=2, color='#1a4d2e', markersize=6)
+    ax.fill_between(dates, sales, alpha=0.2, color='#1a4d2e')
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
+    ax.set_xlabel('Date', fontsize=11)
+    ax.set_ylabel('Sales (PHP)', fontsize=11)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.tick_params(axis='x', rotation=45)
+    figure.tight_layout()
+    canvas.draw()
+
+
+def _timed(func, repeat: int) -> float:
+    """Median milliseconds over repeat calls"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _new_canvas():
+    figure = Figure(figsize=(10, 4))
+    return figure, FigureCanvasAgg(figure)
+
+
+def benchmark(days: int, repeat: int) -> dict:
+    labels, sales = make_series(days)
+    other_labels, other_sales = make_series(days, seed=1)
+    title = f"Sales Trend - Last {days} Days"
+    results = {}
+
+    figure, canvas = _new_canvas()
+    results['legacy redraw'] = _timed(
+        lambda: legacy_plot(figure, canvas, labels, sales, title), repeat)
+
+    # Every call is a new series, so nothing can come from the background cache
+    figure, canvas = _new_canvas()
+    chart = SalesTrendChart(figure, canvas)
+    counter = iter(range(10 ** 9))
+    results['set_series (uncached)'] = _timed(
+        lambda: chart.set_series(labels, sales, f"{title} #{next(counter)}"), repeat)
+
+    # Switching back and forth between two filters already rendered once
+    figure, canvas = _new_canvas()
+    chart = SalesTrendChart(figure, canvas)
+    chart.set_series(labels, sales, title)
+    chart.set_series(other_labels, other_sales, "Other filter")
+    toggle = iter(range(10 ** 9))
+
+    def switch():
+        if next(toggle) % 2:
+            chart.set_series(labels, sales, title)
+        else:
+            chart.set_series(other_labels, other_sales, "Other filter")
+    results['set_series (cached filter)'] = _timed(switch, repeat)
+
+    # Live sale on today's point, within the current y-limits
+    figure, canvas = _new_canvas()
+    chart = SalesTrendChart(figure, canvas)
+    chart.set_series(labels, sales, title)
+    results['update_last_point (blit)'] = _timed(
+        lambda: chart.update_last_point(sales[-1] * 0.9), repeat)
+
+    # What the dashboard plots for long ranges: LTTB-downsampled series
+    if days > len(lttb(sales)):
+        figure, canvas = _new_canvas()
+        chart = SalesTrendChart(figure, canvas)
+        counter = iter(range(10 ** 9))
+
+        def downsampled():
+            keep = lttb(sales)
+            chart.set_series([labels[i] for i in keep], [sales[i] for i in keep],
+                             f"{title} #{next(counter)}")
+        results['lttb + set_series'] = _timed(downsampled, repeat)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sales chart redraw benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case (default: 20)")
+    args = parser.parse_args()
+
+    print(f"Median redraw time over {args.repeat} calls (ms)")
+    for days in SERIES_DAYS:
+        results = benchmark(days, args.repeat)
+        baseline = results['legacy redraw']
+        print(f"\n{days}-day series")
+        for name, ms in results.items():
+            print(f"  {name:<28} {ms:>9.2f} ms  {baseline / ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Checkout path load generator and benchmark
+Drives CheckoutService (the same scan and checkout code the cashier window
+runs) from N simulated lanes against the local database and reports
+p50/p95/p99 scan and checkout latency plus throughput.
+
+Each lane scans a random cart of products (1..--max-items), then pays and
+checks out. Scans and checkouts arrive at the configured per-lane rates
+(exponential think time); --scan-rate 0 / --checkout-rate 0 drive a lane as
+fast as it can go.
+
+Each lane registers as its own terminal (BENCH-LANE-01, ...), as separate
+tills would. Benchmark sales are real completed transactions numbered
+BENCH-...; run against a scratch copy of the database and use --cleanup
+afterwards.
+
+Usage (from the project root):
+    python Benchmarks/CheckoutBenchmark.py --lanes 4 --duration 30
+    python Benchmarks/CheckoutBenchmark.py --lanes 8 --scan-rate 0 --checkout-rate 0 --pooled
+    python Benchmarks/CheckoutBenchmark.py --lanes 4 --max-p95-checkout-ms 150   # exit 1 if slower
+    python Benchmarks/CheckoutBenchmark.py --lanes 4 --pooled --query-stats     # prepares vs executes
+    python Benchmarks/CheckoutBenchmark.py --cleanup
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mysql.connector import Error
+
+from Utilities.CheckoutService import create_transaction, find_product
+from Utilities.DatabaseConnection import getConnection, getPooledConnection
+from Utilities.Payments import CASH, allocate_tenders
+from Utilities.QueryStats import get_query_stats
+from Utilities.Settings import compute_tax
+from Utilities.Terminals import register_terminal
+
+
+BENCH_PREFIX = "BENCH"
+
+
+def percentile(sorted_samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = min(len(sorted_samples), max(1, math.ceil(fraction * len(sorted_samples)))) - 1
+    return sorted_samples[rank]
+
+
+class LaneStats:
+    """Latency samples (ms) and error counts collected by one lane"""
+
+    def __init__(self):
+        self.scan_ms = []
+        self.checkout_ms = []
+        self.scan_errors = 0
+        self.checkout_errors = 0
+        self.items = 0
+
+
+def load_fixture():
+    """Active product reference numbers and a cashier to sell as"""
+    try:
+        conn = getConnection()
+    except Error as e:
+        sys.exit(f"Database connection error: {e}")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT reference_number FROM products WHERE is_active = TRUE")
+        references = [row[0] for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT user_id FROM users
+            WHERE role = 'cashier' AND is_active = TRUE
+            ORDER BY user_id LIMIT 1
+        """)
+        cashier = cursor.fetchone()
+        cursor.close()
+    finally:
+        conn.close()
+
+    if not references:
+        sys.exit("No active products to scan.")
+    if cashier is None:
+        sys.exit("No active cashier to check out as (use --cashier-id).")
+    return references, cashier[0]
+
+
+def build_payment(cart_items: list, rng: random.Random) -> dict:
+    """Payment data as PaymentPopup.get_payment_data() returns it (cash, sometimes split)"""
+    subtotal = sum(item['subtotal'] for item in cart_items)
+    tax = compute_tax(subtotal)
+    total = subtotal + tax
+    if rng.random() < 0.2:
+        gcash = round(total * rng.uniform(0.2, 0.8), 2)
+        tenders = [("GCash", gcash), (CASH, round(total - gcash, 2) + 100)]
+    else:
+        tenders = [(CASH, round(total, -2) + 100)]
+    payments, change = allocate_tenders(total, tenders)
+    return {
+        'subtotal': subtotal, 'tax': tax, 'discount': 0.0, 'total': total,
+        'tendered': sum(p['tendered'] for p in payments), 'change': change,
+        'payments': payments, 'discount_type': "None",
+    }
+
+
+def run_lane(lane: int, args, references: list, cashier_id: int, deadline: float,
+             stats: LaneStats):
+    rng = random.Random(args.seed + lane)
+    connect = (lambda: getPooledConnection(pool_size=args.lanes)) if args.pooled else getConnection
+    terminal = register_terminal(f"{BENCH_PREFIX}-LANE-{lane + 1:02d}")
+
+    def think(rate: float):
+        if rate > 0:
+            time.sleep(rng.expovariate(rate))
+
+    while time.perf_counter() < deadline:
+        cart_items = []
+        for _ in range(rng.randint(1, args.max_items)):
+            think(args.scan_rate)
+            started = time.perf_counter()
+            try:
+                conn = connect()
+                try:
+                    product = find_product(rng.choice(references), conn=conn)
+                finally:
+                    if conn:
+                        conn.close()
+            except Exception:
+                stats.scan_errors += 1
+                continue
+            stats.scan_ms.append((time.perf_counter() - started) * 1000)
+            if product:
+                qty = rng.randint(1, 3)
+                cart_items.append({
+                    'product_id': product['product_id'],
+                    'product_name': product['product_name'],
+                    'price': float(product['price']),
+                    'qty': qty,
+                    'subtotal': float(product['price']) * qty,
+                })
+            if time.perf_counter() >= deadline:
+                break
+
+        if not cart_items or time.perf_counter() >= deadline:
+            continue
+
+        think(args.checkout_rate)
+        payment_data = build_payment(cart_items, rng)
+        started = time.perf_counter()
+        try:
+            conn = connect()
+            try:
+                create_transaction(cashier_id, payment_data, cart_items, conn=conn,
+                                   number_prefix=f"{BENCH_PREFIX}-{terminal.number_prefix}",
+                                   terminal=terminal)
+            finally:
+                if conn:
+                    conn.close()
+        except Exception as e:
+            stats.checkout_errors += 1
+            if stats.checkout_errors <= 3:
+                print(f"lane {lane}: checkout failed: {e}")
+            continue
+        stats.checkout_ms.append((time.perf_counter() - started) * 1000)
+        stats.items += len(cart_items)
+
+
+def report(name: str, samples: list, errors: int, wall: float):
+    samples = sorted(samples)
+    print(f"{name:<10} {len(samples):>8} {errors:>7} {len(samples) / wall:>9.1f} "
+          f"{percentile(samples, 0.50):>8.1f} {percentile(samples, 0.95):>8.1f} "
+          f"{percentile(samples, 0.99):>8.1f} {samples[-1] if samples else 0:>8.1f}")
+    return percentile(samples, 0.95)
+
+
+def cleanup():
+    """
+    Remove every BENCH- transaction, take it back out of the product counters
+    and unregister the BENCH- terminals
+    """
+    try:
+        conn = getConnection()
+    except Error as e:
+        sys.exit(f"Database connection error: {e}")
+    try:
+        cursor = conn.cursor()
+        like = (f"{BENCH_PREFIX}-%",)
+        # Plain statements only, so cleanup works on the MySQL and SQLite backends
+        cursor.execute("""
+            SELECT DATE(t.transaction_date), ti.product_id, COALESCE(t.terminal_id, 0),
+                   SUM(ti.quantity), SUM(ti.total_price)
+            FROM transaction_items ti
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
+            WHERE t.transaction_number LIKE %s
+            GROUP BY DATE(t.transaction_date), ti.product_id, COALESCE(t.terminal_id, 0)
+        """, like)
+        counters = [(quantity, revenue, sale_date, product_id, terminal_id)
+                    for sale_date, product_id, terminal_id, quantity, revenue
+                    in cursor.fetchall()]
+        if counters:
+            cursor.executemany("""
+                UPDATE product_daily_sales
+                SET quantity = quantity - %s, revenue = revenue - %s
+                WHERE sale_date = %s AND product_id = %s AND terminal_id = %s
+            """, counters)
+        for table in ("sales_events", "payments", "transaction_items"):
+            cursor.execute(f"""
+                DELETE FROM {table}
+                WHERE transaction_id IN (
+                    SELECT transaction_id FROM transactions WHERE transaction_number LIKE %s
+                )
+            """, like)
+        cursor.execute("DELETE FROM transactions WHERE transaction_number LIKE %s", like)
+        removed = cursor.rowcount
+        cursor.execute("DELETE FROM product_daily_sales WHERE quantity <= 0 AND revenue <= 0")
+        cursor.execute("DELETE FROM terminals WHERE terminal_code LIKE %s", like)
+        conn.commit()
+        cursor.close()
+    finally:
+        conn.close()
+    print(f"Removed {removed} benchmark transactions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkout path load generator")
+    parser.add_argument("--lanes", type=int, default=4, help="concurrent simulated lanes")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--scan-rate", type=float, default=2.0,
+                        help="scans per second per lane (0 = no think time)")
+    parser.add_argument("--checkout-rate", type=float, default=0.5,
+                        help="payment think time as a rate per second (0 = none)")
+    parser.add_argument("--max-items", type=int, default=8, help="largest cart (distinct scans)")
+    parser.add_argument("--cashier-id", type=int, help="cashier to sell as (default: first active)")
+    parser.add_argument("--pooled", action="store_true", help="use the shared connection pool")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-p95-checkout-ms", type=float,
+                        help="exit with status 1 when checkout p95 exceeds this")
+    parser.add_argument("--max-p95-scan-ms", type=float,
+                        help="exit with status 1 when scan p95 exceeds this")
+    parser.add_argument("--query-stats", action="store_true",
+                        help="print per-query statistics (calls, prepares, latency) at the end")
+    parser.add_argument("--cleanup", action="store_true", help="delete BENCH- transactions and exit")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+
+    references, default_cashier = load_fixture()
+    cashier_id = args.cashier_id or default_cashier
+    print(f"{args.lanes} lanes for {args.duration:g}s, {len(references)} products, "
+          f"cashier {cashier_id}, {'pooled' if args.pooled else 'new'} connections")
+
+    lane_stats = [LaneStats() for _ in range(args.lanes)]
+    started = time.perf_counter()
+    deadline = started + args.duration
+    threads = [threading.Thread(target=run_lane,
+                                args=(lane, args, references, cashier_id, deadline, lane_stats[lane]))
+               for lane in range(args.lanes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    print()
+    print(f"{'Operation':<10} {'Count':>8} {'Errors':>7} {'Per sec':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Max ms':>8}")
+    print("-" * 72)
+    scan_p95 = report("Scan", [ms for s in lane_stats for ms in s.scan_ms],
+                      sum(s.scan_errors for s in lane_stats), wall)
+    checkout_p95 = report("Checkout", [ms for s in lane_stats for ms in s.checkout_ms],
+                          sum(s.checkout_errors for s in lane_stats), wall)
+    print(f"\nLines sold: {sum(s.items for s in lane_stats)} in {wall:.1f}s")
+    if args.query_stats:
+        print("\n" + get_query_stats().format_summary())
+
+    failed = []
+    if args.max_p95_checkout_ms is not None and checkout_p95 > args.max_p95_checkout_ms:
+        failed.append(f"checkout p95 {checkout_p95:.1f} ms > {args.max_p95_checkout_ms:g} ms")
+    if args.max_p95_scan_ms is not None and scan_p95 > args.max_p95_scan_ms:
+        failed.append(f"scan p95 {scan_p95:.1f} ms > {args.max_p95_scan_ms:g} ms")
+    if failed:
+        print("\nFAILED: " + "; ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
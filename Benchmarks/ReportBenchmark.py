@@ -0,0 +1,127 @@
+"""
+Report and dashboard query benchmark at production scale
+Times every ReportRunner report, the comparison reports and the dashboard
+chart / KPI detail queries (uncached) over month, year and full-history
+windows.
+
+With --scales the database is grown with SeedGenerator to each item count
+in turn (only the missing items are added) and the suite is re-run, so
+1M / 10M / 50M item results come from one command. Use a scratch database.
+
+Usage (from the project root):
+    python Benchmarks/ReportBenchmark.py                         # current data
+    python Benchmarks/ReportBenchmark.py --scales 1M,10M,50M --csv report_bench.csv
+    python Benchmarks/ReportBenchmark.py --only "Daily Sales" --repeat 5
+"""
+
+import argparse
+import csv
+import datetime
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model.AdminDashboardModel import AdminDashboardModel
+from Utilities.Dialect import sql
+from Utilities.AnalyticsService import AnalyticsService, DETAIL_PAGE_SIZE, KPI_DETAIL_QUERIES
+from Utilities.ReportRunner import (
+    REPORT_QUERIES, COMPARISON_REPORTS, fetch_report_rows, fetch_comparison_rows
+)
+from Utilities.SeedGenerator import SeedGenerator, count_items, parse_count
+
+
+def windows(end: datetime.date, years: int) -> dict:
+    """Window name -> (from_date, to_date)"""
+    return {
+        "month": (end - datetime.timedelta(days=29), end),
+        "year": (end - datetime.timedelta(days=364), end),
+        "all": (end - datetime.timedelta(days=365 * years - 1), end),
+    }
+
+
+def cases(end: datetime.date, years: int) -> list:
+    """(case name, window name, callable returning rows)"""
+    suite = []
+    for window, (from_date, to_date) in windows(end, years).items():
+        for report_type in REPORT_QUERIES:
+            suite.append((report_type, window,
+                          lambda r=report_type, f=from_date, t=to_date: fetch_report_rows(r, f, t)))
+        for report_type, (comparison_type, _) in COMPARISON_REPORTS.items():
+            suite.append((comparison_type, window,
+                          lambda r=report_type, f=from_date, t=to_date:
+                          fetch_comparison_rows(r, f, t, "Previous Period")[1]))
+        for bucket in ("day", "week", "month"):
+            suite.append((f"Sales chart ({bucket})", window,
+                          lambda b=bucket, f=from_date, t=to_date: AnalyticsService._fetch(
+                              AdminDashboardModel.get_sales_by_bucket_query, f, t, b)))
+
+    for kind, (builder_name, _) in KPI_DETAIL_QUERIES.items():
+        suite.append((f"KPI detail page ({kind})", "day",
+                      lambda n=builder_name: AnalyticsService._fetch(
+                          getattr(AdminDashboardModel, n), end, None, DETAIL_PAGE_SIZE)))
+    return suite
+
+
+def run_suite(end: datetime.date, years: int, repeat: int, only: str = None) -> list:
+    """Returns: [(case, window, median_ms, min_ms, rows), ...]"""
+    results = []
+    for name, window, func in cases(end, years):
+        if only and only.lower() not in name.lower():
+            continue
+        samples = []
+        rows = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = len(func())
+            samples.append((time.perf_counter() - started) * 1000)
+        results.append((name, window, statistics.median(samples), min(samples), rows))
+        print(f"  {name:<40} {window:<6} {statistics.median(samples):>10.1f} "
+              f"{min(samples):>10.1f} {rows:>8}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report/dashboard benchmark")
+    parser.add_argument("--scales", help="comma-separated item counts to grow to, e.g. 1M,10M,50M")
+    parser.add_argument("--years", type=int, default=3, help="history length ending --end")
+    parser.add_argument("--end", type=lambda s: datetime.datetime.strptime(s, "%Y-%m-%d").date(),
+                        help="last day of the windows (default yesterday)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (median reported)")
+    parser.add_argument("--only", help="only cases whose name contains this text")
+    parser.add_argument("--method", choices=("insert", "load"),
+                        help="seed load method for --scales (default: load on MySQL, insert on SQLite)")
+    parser.add_argument("--csv", help="write all results to this CSV file")
+    args = parser.parse_args()
+
+    end = args.end or datetime.date.today() - datetime.timedelta(days=1)
+    first_day = windows(end, args.years)["all"][0]
+    method = args.method or ("load" if sql().name == "mysql" else "insert")
+    scales = [parse_count(s) for s in args.scales.split(",")] if args.scales else [None]
+
+    all_results = []
+    for target in scales:
+        current = count_items()
+        if target is not None and current < target:
+            print(f"Seeding {target - current:,} items to reach {target:,}...")
+            SeedGenerator(method=method).seed(target - current, first_day, end)
+            current = count_items()
+
+        print(f"\n{current:,} transaction items")
+        print(f"  {'Case':<40} {'Window':<6} {'Median ms':>10} {'Min ms':>10} {'Rows':>8}")
+        for result in run_suite(end, args.years, args.repeat, args.only):
+            all_results.append((current,) + result)
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            writer.writerow(["items", "case", "window", "median_ms", "min_ms", "rows"])
+            for items, name, window, median_ms, min_ms, rows in all_results:
+                writer.writerow([items, name, window, f"{median_ms:.1f}", f"{min_ms:.1f}", rows])
+        print(f"\nResults written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
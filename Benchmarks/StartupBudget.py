@@ -0,0 +1,122 @@
+"""
+Cold-start budget check
+Starts a fresh interpreter that does what Main.py does up to the login window
+(offscreen, on a throwaway SQLite database - no server or network needed) and
+fails when it takes longer than the budget or when heavy / admin-only modules
+were imported on the way
+
+Usage (from the project root):
+    python Benchmarks/StartupBudget.py
+    python Benchmarks/StartupBudget.py --budget-ms 1000 --runs 5
+Exit code 1 means the budget was exceeded
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must not be imported before the user has logged in
+FORBIDDEN_AT_LOGIN = (
+    "matplotlib",
+    "openpyxl",
+    "Utilities.ReportRunner",
+    "Utilities.AnalyticsService",
+    "View.AdminGUI",
+    "Controller.Admin",
+    "Controller.Cashier",
+)
+
+# Mirrors Main.main() up to the first painted login window: profiler hotkeys,
+# metrics endpoint, terminal registration (a database write) and heartbeat
+CHILD_CODE = """
+import json, os, sys
+sys.path.insert(0, os.path.join(os.getcwd(), "Main Application"))
+from Main import (QApplication, LoginView, LoginModel, LoginController, ProfilerHotkeys,
+                  start_metrics_server, start_terminal)
+
+app = QApplication(sys.argv)
+hotkeys = ProfilerHotkeys(app)
+start_metrics_server()
+terminal = start_terminal()
+if terminal is None or not terminal.is_active:
+    sys.exit("terminal registration failed")
+view = LoginView()
+controller = LoginController(LoginModel(), view)
+view.showMaximized()
+app.processEvents()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def child_environment(folder: str) -> dict:
+    """Offscreen Qt and a SQLite database, span log and terminal of the benchmark's own"""
+    return dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM="offscreen",
+                SYPOINT_DATABASE_BACKEND="sqlite",
+                SYPOINT_DATABASE_SQLITE_PATH=os.path.join(folder, "startup.sqlite3"),
+                SYPOINT_TELEMETRY_JSONL_PATH=os.path.join(folder, "telemetry.jsonl"),
+                SYPOINT_TERMINAL_CODE="STARTUP-BUDGET")
+
+
+def cold_start(env: dict) -> tuple:
+    """
+    One cold start in a new interpreter
+    Returns: (milliseconds, imported module names)
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", CHILD_CODE], cwd=ROOT, env=env,
+                            capture_output=True, text=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr.strip().splitlines() or ["no output"])[-1])
+    return elapsed_ms, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def forbidden_modules(modules: list) -> list:
+    return [name for name in modules
+            if any(name == prefix or name.startswith(prefix + ".") for prefix in FORBIDDEN_AT_LOGIN)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start to login window budget check")
+    parser.add_argument("--budget-ms", type=float, default=1500,
+                        help="Maximum median cold start time (default: 1500 ms)")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts to measure (default: 3)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        env = child_environment(folder)
+        try:
+            cold_start(env)  # untimed: creates the database and registers the terminal
+            runs = [cold_start(env) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"Startup failed: {e}")
+            sys.exit(1)
+
+    median_ms = statistics.median(ms for ms, _ in runs)
+    loaded = forbidden_modules(runs[-1][1])
+
+    print(f"Cold start to login window: median {median_ms:.0f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    print(f"Modules loaded: {len(runs[-1][1])}")
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print("FAIL: over budget - run \"Main Application/ImportProfile.py\" to see why")
+        failed = True
+    if loaded:
+        print("FAIL: imported before login: " + ", ".join(loaded))
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
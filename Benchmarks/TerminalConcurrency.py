@@ -0,0 +1,237 @@
+"""
+Multi-terminal concurrency check
+Starts one OS process per terminal against the local database. Each process
+registers as its own terminal (BENCH-TERM-01, ...), beats its heartbeat and
+checks out carts back to back through CheckoutService, as a row of tills
+would at peak. Afterwards the run is verified from the database:
+    - every checkout a terminal reported is stored, stamped with its terminal_id
+    - no transaction number is used twice
+    - each terminal's product_daily_sales rows match its transaction items
+    - every terminal's heartbeat landed during the run
+and lock waits / deadlocks / lock timeouts seen during the run are reported
+(MySQL: Innodb_row_lock_waits; both backends: failed checkouts by error).
+
+Exits with status 1 when a check fails. Sales are real BENCH- transactions;
+remove them with: python Benchmarks/CheckoutBenchmark.py --cleanup
+
+Usage (from the project root):
+    python Benchmarks/TerminalConcurrency.py --terminals 12 --duration 20
+    SYPOINT_DB_BACKEND=sqlite python Benchmarks/TerminalConcurrency.py --terminals 4
+"""
+
+import argparse
+import datetime
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mysql.connector import Error
+
+from CheckoutBenchmark import BENCH_PREFIX, build_payment, percentile
+from Utilities.CheckoutService import create_transaction
+from Utilities.DatabaseConnection import getConnection, getPooledConnection
+from Utilities.Dialect import sql
+from Utilities.Terminals import TerminalHeartbeat, register_terminal
+
+
+def terminal_code(index: int) -> str:
+    return f"{BENCH_PREFIX}-TERM-{index + 1:02d}"
+
+
+def load_fixture():
+    """Active products (id, name, price) and a cashier to sell as"""
+    try:
+        conn = getConnection()
+    except Error as e:
+        sys.exit(f"Database connection error: {e}")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT product_id, product_name, price FROM products
+            WHERE is_active = TRUE ORDER BY product_id
+        """)
+        products = [(row[0], row[1], float(row[2])) for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT user_id FROM users
+            WHERE role = 'cashier' AND is_active = TRUE
+            ORDER BY user_id LIMIT 1
+        """)
+        cashier = cursor.fetchone()
+        cursor.close()
+    finally:
+        conn.close()
+    if not products or cashier is None:
+        sys.exit("Need active products and an active cashier.")
+    return products, cashier[0]
+
+
+def row_lock_waits() -> int:
+    """InnoDB row lock waits since server start (None on SQLite)"""
+    if sql().name != "mysql":
+        return None
+    conn = getConnection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_waits'")
+        waits = int(cursor.fetchone()[1])
+        cursor.close()
+        return waits
+    finally:
+        conn.close()
+
+
+def run_terminal(index: int, args, products: list, cashier_id: int, start_at: float) -> dict:
+    """One terminal process: register, heartbeat, check out until the deadline"""
+    terminal = register_terminal(terminal_code(index))
+    heartbeat = TerminalHeartbeat(terminal, interval=args.heartbeat)
+    heartbeat.start()
+
+    # The products are shared, so every terminal keeps selling the same few
+    # best sellers - the rows the old shared counters serialized on
+    hot = products[:args.hot_products]
+    rng = random.Random(args.seed + index)
+    result = {'terminal_id': terminal.terminal_id, 'checkout_ms': [], 'errors': Counter()}
+
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = time.time() + args.duration
+    while time.time() < deadline:
+        cart_items = []
+        for product_id, name, price in rng.sample(hot, rng.randint(1, min(args.max_items,
+                                                                           len(hot)))):
+            qty = rng.randint(1, 3)
+            cart_items.append({'product_id': product_id, 'product_name': name, 'price': price,
+                               'qty': qty, 'subtotal': price * qty})
+        started = time.perf_counter()
+        conn = getPooledConnection(pool_size=1)
+        try:
+            create_transaction(cashier_id, build_payment(cart_items, rng), cart_items, conn=conn,
+                               number_prefix=f"{BENCH_PREFIX}-{terminal.number_prefix}",
+                               terminal=terminal)
+        except Error as e:
+            result['errors'][e.errno or str(e)] += 1
+            continue
+        finally:
+            if conn:
+                conn.close()
+        result['checkout_ms'].append((time.perf_counter() - started) * 1000)
+
+    heartbeat.stop()
+    return result
+
+
+def verify(terminal_ids: dict, run_started: datetime.datetime) -> list:
+    """Check the stored sales against what the terminals reported; returns failures"""
+    failures = []
+    conn = getConnection()
+    cursor = conn.cursor()
+    try:
+        ids = tuple(terminal_ids)
+        marks = ", ".join(["%s"] * len(ids))
+        like = f"{BENCH_PREFIX}-%"
+
+        cursor.execute(f"""
+            SELECT terminal_id, COUNT(*) FROM transactions
+            WHERE terminal_id IN ({marks}) AND transaction_date >= %s
+              AND transaction_number LIKE %s
+            GROUP BY terminal_id
+        """, ids + (run_started.replace(microsecond=0), like))
+        stored = dict(cursor.fetchall())
+        for terminal_id, reported in terminal_ids.items():
+            if stored.get(terminal_id, 0) != reported:
+                failures.append(f"terminal {terminal_id}: {reported} checkouts reported, "
+                                f"{stored.get(terminal_id, 0)} stored")
+
+        cursor.execute("""
+            SELECT transaction_number FROM transactions
+            WHERE transaction_number LIKE %s
+            GROUP BY transaction_number HAVING COUNT(*) > 1
+        """, (like,))
+        duplicates = cursor.fetchall()
+        if duplicates:
+            failures.append(f"{len(duplicates)} duplicate transaction numbers")
+
+        # Whole history of these terminals: counters must equal their items
+        cursor.execute(f"""
+            SELECT c.terminal_id, c.sale_date, c.product_id, c.quantity, s.quantity
+            FROM product_daily_sales c
+            LEFT JOIN (
+                SELECT t.terminal_id, DATE(t.transaction_date) as sale_date, ti.product_id,
+                       SUM(ti.quantity) as quantity
+                FROM transaction_items ti
+                JOIN transactions t ON t.transaction_id = ti.transaction_id
+                                  AND t.transaction_date = ti.transaction_date
+                WHERE t.terminal_id IN ({marks}) AND t.status = 'completed'
+                GROUP BY t.terminal_id, DATE(t.transaction_date), ti.product_id
+            ) s ON s.terminal_id = c.terminal_id AND s.sale_date = c.sale_date
+               AND s.product_id = c.product_id
+            WHERE c.terminal_id IN ({marks})
+        """, ids + ids)
+        mismatched = [row for row in cursor.fetchall()
+                      if float(row[3] or 0) != float(row[4] or 0)]
+        if mismatched:
+            failures.append(f"{len(mismatched)} product counter rows disagree with their items")
+
+        cursor.execute(f"""
+            SELECT terminal_code FROM terminals
+            WHERE terminal_id IN ({marks})
+              AND (last_heartbeat IS NULL OR last_heartbeat < %s)
+        """, ids + (run_started.replace(microsecond=0),))
+        silent = [row[0] for row in cursor.fetchall()]
+        if silent:
+            failures.append(f"no heartbeat during the run from {', '.join(silent)}")
+    finally:
+        cursor.close()
+        conn.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-terminal concurrency check")
+    parser.add_argument("--terminals", type=int, default=8, help="terminal processes")
+    parser.add_argument("--duration", type=float, default=20, help="seconds to sell")
+    parser.add_argument("--max-items", type=int, default=6, help="largest cart")
+    parser.add_argument("--hot-products", type=int, default=5,
+                        help="products every terminal sells (fewer = hotter rows)")
+    parser.add_argument("--heartbeat", type=float, default=1.0, help="heartbeat interval seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    products, cashier_id = load_fixture()
+    print(f"{args.terminals} terminal processes for {args.duration:g}s on {sql().name}, "
+          f"{min(args.hot_products, len(products))} shared products")
+
+    waits_before = row_lock_waits()
+    run_started = datetime.datetime.now()
+    # Processes start selling together once all of them are up
+    start_at = time.time() + 2.0
+    with multiprocessing.Pool(args.terminals) as pool:
+        results = pool.starmap(run_terminal, [(index, args, products, cashier_id, start_at)
+                                              for index in range(args.terminals)])
+    waits_after = row_lock_waits()
+
+    samples = sorted(ms for r in results for ms in r['checkout_ms'])
+    errors = sum((r['errors'] for r in results), Counter())
+    print()
+    print(f"{'Checkouts':<22} {len(samples):>10}")
+    print(f"{'Per second':<22} {len(samples) / args.duration:>10.1f}")
+    print(f"{'p50 / p95 / p99 ms':<22} {percentile(samples, 0.50):>10.1f} "
+          f"{percentile(samples, 0.95):>8.1f} {percentile(samples, 0.99):>8.1f}")
+    if waits_before is not None:
+        print(f"{'InnoDB row lock waits':<22} {waits_after - waits_before:>10}")
+    print(f"{'Failed checkouts':<22} {sum(errors.values()):>10}"
+          + (f"  (by error: {dict(errors)})" if errors else ""))
+
+    failures = verify({r['terminal_id']: len(r['checkout_ms']) for r in results}, run_started)
+    if failures:
+        print("\nFAILED:\n    " + "\n    ".join(failures))
+        sys.exit(1)
+    print("\nOK: every checkout stored once per terminal, counters match, heartbeats seen")
+
+
+if __name__ == "__main__":
+    main()
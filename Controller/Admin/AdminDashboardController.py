@@ -3,32 +3,68 @@ AdminDashboardController.py - FIXED
 Controller for Admin Dashboard with non-editable KPI detail dialogs
 """
 import datetime
+import time
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import fetchAll
+from Utilities.Resilience import DatabaseUnavailable
 from View.AdminGUI.AdminDashboard import AdminDashboardView, KPIDetailDialog
 from Model.AdminDashboardModel import AdminDashboardModel
+from Utilities.AnalyticsService import get_analytics_service
+from Utilities.Settings import LIVE_DASHBOARD, LIVE_GAP_SECONDS, LIVE_POLL_INTERVAL_MS
+from Utilities.TimeSeries import bucket_for_range, bucket_starts, bucket_label, lttb
+from Utilities.Telemetry import record_error
 
 
 class AdminDashboardController:
     """Controller for Admin Dashboard - Recent Transactions Section Removed"""
 
-    def __init__(self, current_user: dict):
+    # Session staleness (see SessionManager): live updates keep today's figures
+    # current, so only reload fully after a while (e.g. across midnight)
+    MAX_DATA_AGE = 300
+    # Skipped event IDs re-read at most (the rest wait for LIVE_GAP_SECONDS to pass)
+    MAX_EVENT_GAPS = 1000
+
+    def __init__(self, current_user: dict, session):
         self.current_user = current_user
+        self.session = session
         self.admin_id = current_user.get('user_id')
         self.view = None
-        self.users_controller = None
-        self.products_controller = None
-        self.reports_controller = None
 
         # Dashboard data
         self.kpi_data = {}
 
+        # Live updates: sales_events watermark, the IDs below it not committed yet
+        # (event_id -> monotonic deadline) and the chart currently shown
+        self.last_event_id = 0
+        self.missing_event_ids = {}
+        self.chart_dates = []
+        self.chart_sales = []
+        self.chart_title = ""
+        self.chart_end_date = None
+        self.live_timer = None
+
     def open_dashboard(self):
         """Initialize and show dashboard"""
         self.view = AdminDashboardView(self.current_user)
         self._load_dashboard_data()
         self._connect_signals()
-        self.view.show()
+        self._start_live_updates()
+        self.session.show_view(self.view)
+
+    def refresh(self):
+        """Reload KPIs and the selected chart into the existing window"""
+        self._load_kpis(datetime.date.today())
+        self.update_sales_chart(self.view.chartFilterCombo.currentText())
+
+    def activate(self):
+        """Dashboard shown again: catch up on sales made meanwhile, resume polling"""
+        self.poll_sales_events()
+        self._start_live_updates()
+
+    def deactivate(self):
+        """Dashboard hidden: stop polling"""
+        self._stop_live_updates()
 
     def _connect_signals(self):
         """Connect UI signals"""
@@ -40,6 +76,8 @@ class AdminDashboardController:
 
         # Chart filter
         self.view.chartFilterCombo.currentTextChanged.connect(self.update_sales_chart)
+        self.view.chartFromDateEdit.dateChanged.connect(self.update_custom_chart_range)
+        self.view.chartToDateEdit.dateChanged.connect(self.update_custom_chart_range)
 
         # KPI card clicks
         self.view.totalSalesCard.mousePressEvent = lambda e: self.show_sales_detail()
@@ -61,220 +99,261 @@ class AdminDashboardController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Failed to load dashboard data: {str(e)}")
-            print(f"Error loading dashboard data: {e}")
+            record_error("dashboard_load", e)
 
     def _load_kpis(self, today: datetime.date):
         """Load and display KPI data"""
         try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            # Total sales today
-            sales_query, sales_params = AdminDashboardModel.get_total_sales_today_query(today)
-            cursor.execute(sales_query, sales_params)
-            result = cursor.fetchone()
-            total_sales = float(result['total_sales'] or 0)
-            self.kpi_data['total_sales'] = total_sales
-            self.view.update_kpi('totalSales', f"PHP {total_sales:,.2f}")
-
-            # Transactions today
-            trans_query, trans_params = AdminDashboardModel.get_transactions_today_query(today)
-            cursor.execute(trans_query, trans_params)
-            result = cursor.fetchone()
-            trans_count = int(result['transaction_count'] or 0)
-            self.kpi_data['transactions'] = trans_count
-            self.view.update_kpi('transactions', str(trans_count))
-
-            # Products sold today
-            products_query, products_params = AdminDashboardModel.get_products_sold_today_query(today)
-            cursor.execute(products_query, products_params)
-            result = cursor.fetchone()
-            products_sold = int(result['products_sold'] or 0)
-            self.kpi_data['products'] = products_sold
-            self.view.update_kpi('products', str(products_sold))
-
-            # Average sale
-            avg_sale = total_sales / trans_count if trans_count > 0 else 0
-            self.kpi_data['avg_sale'] = avg_sale
-            self.view.update_kpi('avgSale', f"PHP {avg_sale:,.2f}")
-
-            cursor.close()
-            conn.close()
+            kpis = get_analytics_service().today_kpis()
+
+            self.kpi_data['total_sales'] = kpis.total_sales
+            self.view.update_kpi('totalSales', f"PHP {kpis.total_sales:,.2f}")
+
+            self.kpi_data['transactions'] = kpis.transactions
+            self.view.update_kpi('transactions', str(kpis.transactions))
+
+            self.kpi_data['products'] = kpis.products
+            self.view.update_kpi('products', str(kpis.products))
+
+            self.kpi_data['avg_sale'] = kpis.avg_sale
+            self.view.update_kpi('avgSale', f"PHP {kpis.avg_sale:,.2f}")
+
+            self.last_event_id = kpis.last_event_id
+            deadline = time.monotonic() + LIVE_GAP_SECONDS
+            self.missing_event_ids = {event_id: deadline for event_id in kpis.missing_event_ids}
 
         except Exception as e:
-            print(f"Error loading KPIs: {e}")
+            record_error("dashboard_kpis", e)
             raise
 
+    def _chart_range(self, filter_text: str, today: datetime.date):
+        """Start/end dates for a chart filter"""
+        if filter_text == "Last 30 Days":
+            return today - datetime.timedelta(days=29), today
+        if filter_text == "This Month":
+            return today.replace(day=1), today
+        if filter_text == "Last Month":
+            last_month = today.replace(day=1) - datetime.timedelta(days=1)
+            return last_month.replace(day=1), last_month
+        if filter_text == "This Year":
+            return today.replace(month=1, day=1), today
+        if filter_text == "Last 12 Months":
+            return today - datetime.timedelta(days=364), today
+        if filter_text == "Last 3 Years":
+            return today - datetime.timedelta(days=3 * 365 - 1), today
+        if filter_text == "Custom Range":
+            start_date = self.view.chartFromDateEdit.date().toPyDate()
+            end_date = self.view.chartToDateEdit.date().toPyDate()
+            return min(start_date, end_date), max(start_date, end_date)
+        return today - datetime.timedelta(days=6), today
+
+    def update_custom_chart_range(self):
+        """Redraw the chart when the custom range dates change"""
+        if self.view.chartFilterCombo.currentText() == "Custom Range":
+            self.update_sales_chart("Custom Range")
+
     def update_sales_chart(self, filter_text: str):
         """Update sales chart based on selected filter"""
         try:
             today = datetime.date.today()
-
-            if filter_text == "Last 7 Days":
-                start_date = today - datetime.timedelta(days=6)
-                end_date = today
-            elif filter_text == "Last 30 Days":
-                start_date = today - datetime.timedelta(days=29)
-                end_date = today
-            elif filter_text == "This Month":
-                start_date = today.replace(day=1)
-                end_date = today
-            elif filter_text == "Last Month":
-                last_month = today.replace(day=1) - datetime.timedelta(days=1)
-                start_date = last_month.replace(day=1)
-                end_date = last_month
-            else:
-                start_date = today - datetime.timedelta(days=6)
-                end_date = today
-
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query, params = AdminDashboardModel.get_sales_by_date_query(start_date, end_date)
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-
-            cursor.close()
-            conn.close()
-
-            # Prepare data
-            date_range = []
-            current_date = start_date
-            while current_date <= end_date:
-                date_range.append(current_date)
-                current_date += datetime.timedelta(days=1)
-
-            sales_dict = {row['sale_date']: float(row['total_sales']) for row in results}
-            sales_data = [sales_dict.get(d, 0) for d in date_range]
-
-            date_labels = [d.strftime('%m/%d') for d in date_range]
-
-            self.view.plot_sales_chart(date_labels, sales_data, f"Sales - {filter_text}")
+            self.view.set_custom_range_visible(filter_text == "Custom Range")
+            start_date, end_date = self._chart_range(filter_text, today)
+
+            # Week/month buckets are aggregated in SQL; the series is dense over
+            # every bucket in the range so days without sales plot as zero
+            bucket = bucket_for_range(start_date, end_date)
+            analytics = get_analytics_service()
+            # Today's part of the last bucket is the KPI cards' total (the
+            # today_kpis snapshot plus live deltas), never a separately cached
+            # query that may be older or newer than the cards
+            from_kpis = end_date == today and 'total_sales' in self.kpi_data
+            history_end = today - datetime.timedelta(days=1) if from_kpis else end_date
+            results = (analytics.sales_by_bucket(start_date, history_end, bucket)
+                       if start_date <= history_end else [])
+            sales_dict = {row.bucket_start: row.total_sales for row in results}
+            buckets = bucket_starts(start_date, end_date, bucket)
+            sales_data = [sales_dict.get(b, 0) for b in buckets]
+            if from_kpis:
+                sales_data[-1] += self.kpi_data['total_sales']
+
+            # Keep the chart's shape with far fewer points on long ranges
+            keep = lttb(sales_data)
+            multi_year = start_date.year != end_date.year
+            date_labels = [bucket_label(buckets[i], bucket, multi_year) for i in keep]
+            sales_data = [sales_data[i] for i in keep]
+
+            self.chart_dates = date_labels
+            self.chart_sales = sales_data
+            self.chart_title = f"Sales - {filter_text}"
+            self.chart_end_date = end_date
+
+            self.view.plot_sales_chart(date_labels, sales_data, self.chart_title)
 
         except Exception as e:
-            print(f"Error updating chart: {e}")
+            record_error("dashboard_chart", e)
+
+    # ============================================================
+    # LIVE UPDATES (sales_events outbox)
+    # ============================================================
+
+    def _start_live_updates(self):
+        """Poll the sales event outbox and apply new sales as deltas"""
+        if not LIVE_DASHBOARD:
+            return
+        if self.live_timer is None:
+            self.live_timer = QTimer(self.view)
+            self.live_timer.setInterval(LIVE_POLL_INTERVAL_MS)
+            self.live_timer.timeout.connect(self.poll_sales_events)
+        self.live_timer.start()
+
+    def _stop_live_updates(self):
+        if self.live_timer:
+            self.live_timer.stop()
+
+    def poll_sales_events(self):
+        """Fetch sales committed since the watermark (or into one of its gaps) and apply them"""
+        try:
+            now = time.monotonic()
+            self.missing_event_ids = {event_id: deadline for event_id, deadline
+                                      in self.missing_event_ids.items() if deadline > now}
+            query, params = AdminDashboardModel.get_sales_events_after_query(
+                self.last_event_id, sorted(self.missing_event_ids)[-self.MAX_EVENT_GAPS:])
+            events = fetchAll(query, params)
+
+            if events:
+                self.apply_sales_events(events)
+
+        except DatabaseUnavailable:
+            pass  # Offline: the cards keep their last figures until the circuit closes
+        except Exception as e:
+            record_error("dashboard_poll", e)
+
+    def apply_sales_events(self, events: list):
+        """Apply new sales to the KPI cards and today's chart point without re-querying"""
+        today = datetime.date.today()
+        sales_delta = 0.0
+        transactions_delta = 0
+        items_delta = 0
+
+        deadline = time.monotonic() + LIVE_GAP_SECONDS
+        for event in events:
+            event_id = int(event['event_id'])
+            if event_id > self.last_event_id:
+                # Lower IDs skipped over may still be committing on another lane
+                for skipped in range(max(self.last_event_id, event_id - self.MAX_EVENT_GAPS) + 1, event_id):
+                    self.missing_event_ids.setdefault(skipped, deadline)
+                self.last_event_id = event_id
+            elif self.missing_event_ids.pop(event_id, None) is None:
+                continue  # Already applied
+            if event['event_time'].date() != today:
+                continue
+            sales_delta += float(event['final_total'])
+            transactions_delta += 1
+            items_delta += int(event['items_count'])
+
+        if not transactions_delta:
+            return
+
+        self.kpi_data['total_sales'] = self.kpi_data.get('total_sales', 0) + sales_delta
+        self.kpi_data['transactions'] = self.kpi_data.get('transactions', 0) + transactions_delta
+        self.kpi_data['products'] = self.kpi_data.get('products', 0) + items_delta
+        self.kpi_data['avg_sale'] = self.kpi_data['total_sales'] / self.kpi_data['transactions']
+
+        self.view.update_kpi('totalSales', f"PHP {self.kpi_data['total_sales']:,.2f}")
+        self.view.update_kpi('transactions', str(self.kpi_data['transactions']))
+        self.view.update_kpi('products', str(self.kpi_data['products']))
+        self.view.update_kpi('avgSale', f"PHP {self.kpi_data['avg_sale']:,.2f}")
+
+        # Cached open-day results no longer match; history stays cached
+        get_analytics_service().invalidate_open_day()
+
+        if self.chart_end_date == today and self.chart_sales:
+            self.chart_sales[-1] += sales_delta
+            self.view.update_last_sales_point(self.chart_sales[-1])
 
     def show_sales_detail(self):
         """Show detailed sales breakdown"""
-        try:
-            dialog = KPIDetailDialog("Total Sales Today", self.view)
-
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            today = datetime.date.today()
-
-            query, params = AdminDashboardModel.get_sales_detail_query(today)
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-
-            cursor.close()
-            conn.close()
-
-            columns = ["Transaction #", "Date/Time", "Cashier", "Subtotal", "Discount", "Total"]
-            data = []
-            for row in results:
-                data.append([
-                    row['transaction_number'],
-                    row['transaction_date'].strftime('%Y-%m-%d %H:%M:%S'),
-                    row['cashier_name'],
-                    f"PHP {row['subtotal']:.2f}",
-                    f"PHP {row['discount_amount']:.2f}",
-                    f"PHP {row['final_total']:.2f}"
-                ])
-
-            dialog.populate_table(columns, data)
-            dialog.exec()
-
-        except Exception as e:
-            QMessageBox.critical(self.view, "Error", f"Failed to load details: {str(e)}")
-            print(f"Error showing sales detail: {e}")
+        self._show_kpi_detail(
+            "sales", "Total Sales Today",
+            ["Transaction #", "Date/Time", "Cashier", "Subtotal", "Discount", "Total"],
+            lambda row: [
+                row['transaction_number'],
+                row['transaction_date'].strftime('%Y-%m-%d %H:%M:%S'),
+                row['cashier_name'],
+                f"PHP {row['subtotal']:.2f}",
+                f"PHP {row['discount_amount']:.2f}",
+                f"PHP {row['final_total']:.2f}"
+            ])
 
     def show_transactions_detail(self):
         """Show detailed transaction list"""
-        try:
-            dialog = KPIDetailDialog("Transactions Today", self.view)
-
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            today = datetime.date.today()
-
-            query, params = AdminDashboardModel.get_transactions_detail_query(today)
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-
-            cursor.close()
-            conn.close()
-
-            columns = ["Transaction #", "Date/Time", "Cashier", "Items", "Total"]
-            data = []
-            for row in results:
-                data.append([
-                    row['transaction_number'],
-                    row['transaction_date'].strftime('%Y-%m-%d %H:%M:%S'),
-                    row['cashier_name'],
-                    str(row['items_count']),
-                    f"PHP {row['final_total']:.2f}"
-                ])
-
-            dialog.populate_table(columns, data)
-            dialog.exec()
-
-        except Exception as e:
-            QMessageBox.critical(self.view, "Error", f"Failed to load details: {str(e)}")
-            print(f"Error showing transactions detail: {e}")
+        self._show_kpi_detail(
+            "transactions", "Transactions Today",
+            ["Transaction #", "Date/Time", "Cashier", "Items", "Total"],
+            lambda row: [
+                row['transaction_number'],
+                row['transaction_date'].strftime('%Y-%m-%d %H:%M:%S'),
+                row['cashier_name'],
+                str(row['items_count']),
+                f"PHP {row['final_total']:.2f}"
+            ])
 
     def show_products_detail(self):
         """Show detailed products sold"""
-        try:
-            dialog = KPIDetailDialog("Products Sold Today", self.view)
-
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            today = datetime.date.today()
-
-            query, params = AdminDashboardModel.get_products_detail_query(today)
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-
-            cursor.close()
-            conn.close()
-
-            columns = ["Product Name", "Quantity Sold", "Revenue"]
-            data = []
-            for row in results:
-                data.append([
-                    row['product_name'],
-                    str(row['quantity_sold']),
-                    f"PHP {row['revenue']:.2f}"
-                ])
-
-            dialog.populate_table(columns, data)
+        self._show_kpi_detail(
+            "products", "Products Sold Today",
+            ["Product Name", "Quantity Sold", "Revenue"],
+            lambda row: [
+                row['product_name'],
+                str(row['quantity_sold']),
+                f"PHP {row['revenue']:.2f}"
+            ])
+
+    def _show_kpi_detail(self, kind: str, title: str, columns: list, format_row):
+        """
+        Open a KPI detail dialog one keyset page at a time
+        Pages come from the analytics cache, so reopening a card or paging
+        back does not hit the database again
+        """
+        dialog = KPIDetailDialog(title, self.view)
+        analytics = get_analytics_service()
+        today = datetime.date.today()
+        # Keyset of each page shown so far (page 1 starts at None)
+        starts = [None]
+
+        def show_page(index: int):
+            try:
+                page = analytics.kpi_detail_page(kind, today, starts[index])
+            except Exception as e:
+                QMessageBox.critical(dialog, "Error", f"Failed to load details: {str(e)}")
+                record_error("kpi_detail", e, kind=kind)
+                return False
+
+            del starts[index + 1:]
+            if page.next_after is not None:
+                starts.append(page.next_after)
+            dialog.populate_table(columns, [format_row(row) for row in page.rows])
+            dialog.set_page_state(index + 1, index > 0, page.next_after is not None)
+            dialog.current_page = index
+            return True
+
+        dialog.prevPageButton.clicked.connect(lambda: show_page(dialog.current_page - 1))
+        dialog.nextPageButton.clicked.connect(lambda: show_page(dialog.current_page + 1))
+
+        if show_page(0):
             dialog.exec()
 
-        except Exception as e:
-            QMessageBox.critical(self.view, "Error", f"Failed to load details: {str(e)}")
-            print(f"Error showing products detail: {e}")
-
     def navigate_to_products(self):
         """Navigate to product management"""
-        self.view.close()
-        from Controller.Admin.ProductsManagementController import AdminProductsController
-        self.products_controller = AdminProductsController(self.current_user)
-        self.products_controller.open_products_window()
+        self.session.navigate("products")
 
     def navigate_to_reports(self):
         """Navigate to reports"""
-        self.view.close()
-        from Controller.Admin.ReportsController import AdminReportsController
-        self.reports_controller = AdminReportsController(self.current_user)
-        self.reports_controller.open_reports()
+        self.session.navigate("reports")
 
     def navigate_to_users(self):
         """Navigate to user management"""
-        self.view.close()
-        from Controller.Admin.UsersManagementController import AdminUsersController
-        self.users_controller = AdminUsersController(self.current_user)
-        self.users_controller.open_users_window()
+        self.session.navigate("users")
 
     def logout(self):
         """Logout"""
@@ -286,12 +365,4 @@ class AdminDashboardController:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.view.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI.Login import LoginView
-
-            login_model = LoginModel()
-            login_view = LoginView()
-            login_controller = LoginController(login_model, login_view)
-            login_view.show()
\ No newline at end of file
+            self.session.logout()
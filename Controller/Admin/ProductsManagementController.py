@@ -6,18 +6,20 @@ from View.AdminGUI.ProductsManagementWindow import (
     AdminProductsView, AddCategoryDialog, AddProductDialog, EditProductDialog
 )
 from Model.ProductsModel import AdminProductsModel
+from Utilities.Telemetry import record_error
 
 
 class AdminProductsController:
     """Controller for Admin Product Management"""
 
-    def __init__(self, current_user: dict):
+    # Session staleness (see SessionManager): stock changes at every terminal
+    MAX_DATA_AGE = 60
+
+    def __init__(self, current_user: dict, session):
         self.current_user = current_user
+        self.session = session
         self.admin_id = current_user.get('user_id')
         self.view = None
-        self.users_controller = None
-        self.reports_controller = None
-        self.dashboard_controller = None
 
         self.all_products = []
         self.all_categories = []
@@ -28,7 +30,12 @@ class AdminProductsController:
         self._load_categories()
         self._load_all_products()
         self._connect_signals()
-        self.view.show()
+        self.session.show_view(self.view)
+
+    def refresh(self):
+        """Reload categories and products into the existing window"""
+        self._load_categories()
+        self._load_all_products()
 
     def _connect_signals(self):
         """Connect UI signals"""
@@ -69,7 +76,7 @@ class AdminProductsController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Failed to load categories: {str(e)}")
-            print(f"Error loading categories: {e}")
+            record_error("categories_load", e)
 
     def _load_all_products(self):
         """Load all products and populate table"""
@@ -89,7 +96,7 @@ class AdminProductsController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Failed to load products: {str(e)}")
-            print(f"Error loading products: {e}")
+            record_error("products_load", e)
 
     def _populate_products_table(self, products: list):
         """Populate products table - REMOVED Product ID column"""
@@ -142,7 +149,7 @@ class AdminProductsController:
                         self.view.selected_product_data = product
                         break
         except (ValueError, Exception) as e:
-            print(f"Error selecting product: {e}")
+            record_error("products_select", e)
             self.view.clear_selection()
 
     def apply_filters(self):
@@ -172,7 +179,7 @@ class AdminProductsController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Failed to apply filters: {str(e)}")
-            print(f"Error applying filters: {e}")
+            record_error("products_filter", e)
 
     def show_add_category_dialog(self):
         """Show add category dialog"""
@@ -214,7 +221,7 @@ class AdminProductsController:
             except Exception as e:
                 QMessageBox.critical(dialog, "Error",
                                      f"Failed to add category: {str(e)}")
-                print(f"Error adding category: {e}")
+                record_error("categories_add", e)
 
         dialog.submitButton.clicked.connect(add_category)
         dialog.exec()
@@ -271,7 +278,7 @@ class AdminProductsController:
             except Exception as e:
                 QMessageBox.critical(dialog, "Error",
                                      f"Failed to add product: {str(e)}")
-                print(f"Error adding product: {e}")
+                record_error("products_add", e)
 
         dialog.submitButton.clicked.connect(add_product)
         dialog.exec()
@@ -331,7 +338,7 @@ class AdminProductsController:
             except Exception as e:
                 QMessageBox.critical(dialog, "Error",
                                      f"Failed to update product: {str(e)}")
-                print(f"Error updating product: {e}")
+                record_error("products_update", e)
 
         dialog.submitButton.clicked.connect(update_product)
         dialog.exec()
@@ -374,7 +381,7 @@ class AdminProductsController:
             except Exception as e:
                 QMessageBox.critical(self.view, "Error",
                                      f"Failed to archive product: {str(e)}")
-                print(f"Error archiving product: {e}")
+                record_error("products_archive", e)
 
     @staticmethod
     def _validate_product_data(data: dict):
@@ -391,24 +398,15 @@ class AdminProductsController:
 
     def navigate_to_dashboard(self):
         """Navigate to dashboard"""
-        self.view.close()
-        from Controller.Admin.AdminDashboardController import AdminDashboardController
-        self.dashboard_controller = AdminDashboardController(self.current_user)
-        self.dashboard_controller.open_dashboard()
+        self.session.navigate("dashboard")
 
     def navigate_to_reports(self):
         """Navigate to reports"""
-        self.view.close()
-        from Controller.Admin.ReportsController import AdminReportsController
-        self.reports_controller = AdminReportsController(self.current_user)
-        self.reports_controller.open_reports()
+        self.session.navigate("reports")
 
     def navigate_to_users(self):
         """Navigate to users"""
-        self.view.close()
-        from Controller.Admin.UsersManagementController import AdminUsersController
-        self.users_controller = AdminUsersController(self.current_user)
-        self.users_controller.open_users_window()
+        self.session.navigate("users")
 
     def logout(self):
         """Logout"""
@@ -420,12 +418,4 @@ class AdminProductsController:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.view.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI.Login import LoginView
-
-            login_model = LoginModel()
-            login_view = LoginView()
-            login_controller = LoginController(login_model, login_view)
-            login_view.show()
\ No newline at end of file
+            self.session.logout()
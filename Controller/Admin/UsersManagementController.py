@@ -4,20 +4,22 @@ from PyQt6.QtGui import QColor
 from Utilities.DatabaseConnection import getConnection
 from View.AdminGUI.UsersManagementWindow import AdminUsersView, AddUserDialog, EditUserDialog
 from Model.UsersModel import AdminUsersModel
+from Utilities.Telemetry import record_error
 
 
 class AdminUsersController:
     """Controller for Admin User Management"""
 
-    def __init__(self, current_user: dict):
+    # Session staleness (see SessionManager)
+    MAX_DATA_AGE = 300
+
+    def __init__(self, current_user: dict, session):
         self.current_user = current_user
+        self.session = session
         self.admin_id = current_user.get('user_id')
         self.view = None
         self.add_dialog = None
         self.edit_dialog = None
-        self.dashboard_controller = None
-        self.products_controller = None
-        self.reports_controller = None
 
         self.all_users = []
 
@@ -26,7 +28,11 @@ class AdminUsersController:
         self.view = AdminUsersView(self.current_user)
         self._load_all_users()
         self._connect_signals()
-        self.view.show()
+        self.session.show_view(self.view)
+
+    def refresh(self):
+        """Reload users into the existing window"""
+        self._load_all_users()
 
     def _connect_signals(self):
         """Connect UI signals"""
@@ -61,7 +67,7 @@ class AdminUsersController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Failed to load users: {str(e)}")
-            print(f"Error loading users: {e}")
+            record_error("users_load", e)
 
     def _populate_users_table(self, users: list):
         """Populate users table - REMOVED User ID column"""
@@ -118,7 +124,7 @@ class AdminUsersController:
                         self.view.selected_user_data = user
                         break
         except (ValueError, Exception) as e:
-            print(f"Error selecting user: {e}")
+            record_error("users_select", e)
             self.view.clear_selection()
 
     def search_users(self):
@@ -145,7 +151,7 @@ class AdminUsersController:
         except Exception as e:
             QMessageBox.critical(self.view, "Error",
                                  f"Search failed: {str(e)}")
-            print(f"Error searching users: {e}")
+            record_error("users_search", e)
 
     def show_add_user_dialog(self):
         """Show add user dialog"""
@@ -197,7 +203,7 @@ class AdminUsersController:
         except Exception as e:
             QMessageBox.critical(self.add_dialog, "Error",
                                  f"Failed to add user: {str(e)}")
-            print(f"Error adding user: {e}")
+            record_error("users_add", e)
 
     def show_edit_user_dialog(self):
         """Show edit user dialog"""
@@ -259,7 +265,7 @@ class AdminUsersController:
         except Exception as e:
             QMessageBox.critical(self.edit_dialog, "Error",
                                  f"Failed to update user: {str(e)}")
-            print(f"Error updating user: {e}")
+            record_error("users_update", e)
 
     @staticmethod
     def _validate_user_data(data: dict, is_new: bool = True):
@@ -280,24 +286,15 @@ class AdminUsersController:
 
     def navigate_to_dashboard(self):
         """Navigate to dashboard"""
-        self.view.close()
-        from Controller.Admin.AdminDashboardController import AdminDashboardController
-        self.dashboard_controller = AdminDashboardController(self.current_user)
-        self.dashboard_controller.open_dashboard()
+        self.session.navigate("dashboard")
 
     def navigate_to_products(self):
         """Navigate to products"""
-        self.view.close()
-        from Controller.Admin.ProductsManagementController import AdminProductsController
-        self.products_controller = AdminProductsController(self.current_user)
-        self.products_controller.open_products_window()
+        self.session.navigate("products")
 
     def navigate_to_reports(self):
         """Navigate to reports"""
-        self.view.close()
-        from Controller.Admin.ReportsController import AdminReportsController
-        self.reports_controller = AdminReportsController(self.current_user)
-        self.reports_controller.open_reports()
+        self.session.navigate("reports")
 
     def logout(self):
         """Logout"""
@@ -309,12 +306,4 @@ class AdminUsersController:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.view.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI.Login import LoginView
-
-            login_model = LoginModel()
-            login_view = LoginView()
-            login_controller = LoginController(login_model, login_view)
-            login_view.show()
\ No newline at end of file
+            self.session.logout()
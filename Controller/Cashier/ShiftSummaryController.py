@@ -4,32 +4,70 @@ Controller for Shift Summary window
 FIXED: Shows all transactions for the logged-in cashier from today, regardless of shift time
 """
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
 from Utilities.DatabaseConnection import getConnection
 from View.CashierGUI.ShiftSummaryWindow import ShiftSummaryView
 from Model.ShiftSummaryModel import ShiftSummaryModel
-from matplotlib.backends.backend_pdf import PdfPages
-import matplotlib.pyplot as plt
+from Utilities.ShiftAccumulator import sales_from_rows
+from Utilities.Telemetry import record_error
+
+# How often the window checks whether a background reconcile has finished
+RECONCILE_POLL_INTERVAL_MS = 100
 
 
 class ShiftSummaryController:
     """Controller for Shift Summary window"""
 
-    def __init__(self, current_user: dict):
+    # Session staleness (see SessionManager): redraw after a sale, reconcile
+    # with the database after a minute
+    STALE_TOPICS = ("sales",)
+    MAX_DATA_AGE = 60
+
+    def __init__(self, current_user: dict, session):
         self.current_user = current_user
+        self.session = session
         self.cashier_id = current_user.get('user_id')
         self.role = current_user.get('role', 'cashier')
         self.view = None
 
-        # Summary data
+        # Summary data (running totals live in the session's ShiftAccumulator)
         self.shift_data = {}
+        self.accumulator = None
+        self._reconcile_executor = None  # created per visit, shut down in deactivate()
+        self._reconcile_future = None
+        self._reconcile_timer = None
 
     def open_shift_summary(self):
         """Initialize and show shift summary window"""
         self.view = ShiftSummaryView(self.current_user)
         self._load_shift_data()
         self._connect_signals()
-        self.view.show()
+        self.session.show_view(self.view)
+
+    def refresh(self):
+        """Redraw from the accumulator; reconcile again if it is getting old"""
+        self.accumulator = self.session.shift_accumulator()
+        self._render_shift_data()
+        reconciled_at = self.accumulator.reconciled_at
+        if (reconciled_at is None or
+                (datetime.datetime.now() - reconciled_at).total_seconds() > self.MAX_DATA_AGE):
+            self._start_reconcile()
+
+    def activate(self):
+        """Shown again: pick up a reconcile that finished (or is still running) meanwhile"""
+        if self._reconcile_future is not None and self._reconcile_timer is not None:
+            self._reconcile_timer.start()
+
+    def deactivate(self):
+        """Hidden or logged out: stop polling and let the worker thread exit"""
+        if self._reconcile_timer is not None:
+            self._reconcile_timer.stop()
+        if self._reconcile_executor is not None:
+            # A reconcile in flight still completes; activate() shows its result
+            self._reconcile_executor.shutdown(wait=False)
+            self._reconcile_executor = None
 
     def _connect_signals(self):
         """Connect UI signals"""
@@ -38,180 +76,104 @@ class ShiftSummaryController:
         self.view.logoutButton.clicked.connect(self.logout)
 
     def _load_shift_data(self):
-        """Load all shift summary data"""
-        try:
-            # FIXED: Get today's date at midnight (start of day)
-            # This ensures we show ALL transactions from today for this cashier
-            today_start = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-            # Store for debugging
-            print(f"Loading shift data for cashier_id={self.cashier_id}, today_start={today_start}")
-
-            # Load KPIs
-            self._load_kpis(today_start)
-
-            # Load payment breakdown
-            self._load_payment_breakdown(today_start)
-
-            # Load top products
-            self._load_top_products(today_start)
-
-            # Load transactions table
-            self._load_transactions(today_start)
-
-        except Exception as e:
-            QMessageBox.critical(self.view, "Error",
-                                 f"Failed to load shift data: {str(e)}")
-            print(f"Error loading shift data: {e}")
-
-    def _load_kpis(self, today_start):
-        """Load and display KPI data"""
+        """Show the session's running totals now, then reconcile with the database"""
+        self.accumulator = self.session.shift_accumulator()
+        self._render_shift_data()
+        self._start_reconcile()
+
+    def _render_shift_data(self):
+        """Fill the KPIs, info cards and table from the shift accumulator"""
+        totals = self.accumulator.totals()
+
+        self.shift_data = {
+            'total_sales': totals.total_sales,
+            'items_sold': totals.items_sold,
+            'transaction_count': totals.transaction_count,
+            'avg_sale': totals.avg_sale
+        }
+        self.view.update_kpi('sales', f"PHP {totals.total_sales:,.2f}")
+        self.view.update_kpi('items', str(totals.items_sold))
+        self.view.update_kpi('transactions', str(totals.transaction_count))
+        self.view.update_kpi('avg', f"PHP {totals.avg_sale:,.2f}")
+
+        # Payment breakdown
+        breakdown_text = ""
+        for method, (count, total) in sorted(totals.payment_methods.items()):
+            breakdown_text += f"• {method}: {count} ({total:,.2f} PHP)\n"
+        self.view.update_info_card(self.view.paymentFrame,
+                                   breakdown_text.strip() if breakdown_text else "No payment data")
+
+        # Top 5 products
+        products_text = ""
+        for i, (name, qty) in enumerate(self.accumulator.top_products(5), 1):
+            products_text += f"{i}. {name} ({qty} sold)\n"
+        self.view.update_info_card(self.view.topProductsFrame,
+                                   products_text.strip() if products_text else "No products sold")
+
+        # Transactions table, newest first
+        table_data = []
+        for sale in self.accumulator.recent_transactions():
+            table_data.append([
+                sale.transaction_number,
+                sale.sold_at.strftime('%I:%M %p'),
+                str(len(sale.items)),
+                f"PHP {sale.final_total:.2f}",
+                sale.payment_method,
+                sale.discount_type or 'None'
+            ])
+        self.view.update_transactions_table(table_data)
+
+    # ============================================================
+    # BACKGROUND RECONCILE
+    # ============================================================
+
+    def _start_reconcile(self):
+        """Rebuild the accumulator from the database without blocking the window"""
+        if self._reconcile_future is not None and not self._reconcile_future.done():
+            return
+        if self._reconcile_executor is None:
+            self._reconcile_executor = ThreadPoolExecutor(max_workers=1)
+        self._reconcile_future = self._reconcile_executor.submit(
+            self._reconcile_shift, self.accumulator)
+
+        if self._reconcile_timer is None:
+            self._reconcile_timer = QTimer(self.view)
+            self._reconcile_timer.setInterval(RECONCILE_POLL_INTERVAL_MS)
+            self._reconcile_timer.timeout.connect(self._check_reconcile)
+        self._reconcile_timer.start()
+
+    @staticmethod
+    def _reconcile_shift(accumulator):
+        """Worker thread: today's item lines and tenders for this cashier"""
+        conn = getConnection()
         try:
-            conn = getConnection()
             cursor = conn.cursor(dictionary=True)
-
-            # Total sales
-            sales_query, sales_params = ShiftSummaryModel.get_total_sales_query(
-                self.cashier_id, today_start)
-            print(f"Sales query: {sales_query}")
-            print(f"Sales params: {sales_params}")
-            cursor.execute(sales_query, sales_params)
-            result = cursor.fetchone()
-            total_sales = float(result['total_sales'] or 0)
-            self.shift_data['total_sales'] = total_sales
-            self.view.update_kpi('sales', f"PHP {total_sales:,.2f}")
-            print(f"Total sales: {total_sales}")
-
-            # Items sold
-            items_query, items_params = ShiftSummaryModel.get_items_sold_query(
-                self.cashier_id, today_start)
-            cursor.execute(items_query, items_params)
-            result = cursor.fetchone()
-            items_sold = int(result['items_sold'] or 0)
-            self.shift_data['items_sold'] = items_sold
-            self.view.update_kpi('items', str(items_sold))
-            print(f"Items sold: {items_sold}")
-
-            # Transaction count
-            trans_query, trans_params = ShiftSummaryModel.get_transaction_count_query(
-                self.cashier_id, today_start)
-            cursor.execute(trans_query, trans_params)
-            result = cursor.fetchone()
-            trans_count = int(result['transaction_count'] or 0)
-            self.shift_data['transaction_count'] = trans_count
-            self.view.update_kpi('transactions', str(trans_count))
-            print(f"Transaction count: {trans_count}")
-
-            # Average per sale
-            avg_sale = total_sales / trans_count if trans_count > 0 else 0
-            self.shift_data['avg_sale'] = avg_sale
-            self.view.update_kpi('avg', f"PHP {avg_sale:,.2f}")
-
-            cursor.close()
-            conn.close()
-
-        except Exception as e:
-            print(f"Error loading KPIs: {e}")
-            raise
-
-    def _load_payment_breakdown(self, today_start):
-        """Load payment methods breakdown"""
-        try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query, params = ShiftSummaryModel.get_payment_breakdown_query(
-                self.cashier_id, today_start)
+            query, params = ShiftSummaryModel.get_shift_sales_lines_query(
+                accumulator.cashier_id, accumulator.shift_start)
             cursor.execute(query, params)
-            results = cursor.fetchall()
+            rows = cursor.fetchall()
 
-            cursor.close()
-            conn.close()
-
-            if results:
-                breakdown_text = ""
-                for row in results:
-                    method = row['payment_method'] or 'Unknown'
-                    count = row['count']
-                    total = float(row['total'] or 0)
-                    if count > 0:  # Only show payment methods that were actually used
-                        breakdown_text += f"• {method}: {count} ({total:,.2f} PHP)\n"
-                self.view.update_info_card(self.view.paymentFrame,
-                                           breakdown_text.strip() if breakdown_text else "No payment data")
-            else:
-                self.view.update_info_card(self.view.paymentFrame, "No payment data")
-
-        except Exception as e:
-            print(f"Error loading payment breakdown: {e}")
-            self.view.update_info_card(self.view.paymentFrame, "Error loading data")
-
-    def _load_top_products(self, today_start):
-        """Load top 5 products sold"""
-        try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query, params = ShiftSummaryModel.get_top_products_query(
-                self.cashier_id, today_start)
+            query, params = ShiftSummaryModel.get_shift_payments_query(
+                accumulator.cashier_id, accumulator.shift_start)
             cursor.execute(query, params)
-            results = cursor.fetchall()
-
+            payment_rows = cursor.fetchall()
             cursor.close()
+        finally:
             conn.close()
-
-            if results:
-                products_text = ""
-                for i, row in enumerate(results, 1):
-                    name = row['product_name']
-                    qty = int(row['total_qty'])
-                    products_text += f"{i}. {name} ({qty} sold)\n"
-                self.view.update_info_card(self.view.topProductsFrame, products_text.strip())
-            else:
-                self.view.update_info_card(self.view.topProductsFrame, "No products sold")
-
-        except Exception as e:
-            print(f"Error loading top products: {e}")
-            self.view.update_info_card(self.view.topProductsFrame, "Error loading data")
-
-    def _load_transactions(self, today_start):
-        """Load transactions table"""
+        accumulator.reconcile(sales_from_rows(rows, payment_rows))
+
+    def _check_reconcile(self):
+        """GUI thread: redraw once the reconcile has finished"""
+        if not self._reconcile_future.done():
+            return
+        self._reconcile_timer.stop()
+        future, self._reconcile_future = self._reconcile_future, None
         try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query, params = ShiftSummaryModel.get_shift_transactions_query(
-                self.cashier_id, today_start)
-            print(f"Transactions query: {query}")
-            print(f"Transactions params: {params}")
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            print(f"Transactions found: {len(results)}")
-
-            cursor.close()
-            conn.close()
-
-            if results:
-                table_data = []
-                for row in results:
-                    time_str = row['transaction_date'].strftime('%I:%M %p')
-                    discount = row['discount_type'] or 'None'
-
-                    table_data.append([
-                        row['transaction_number'],
-                        time_str,
-                        str(row['items_count']),
-                        f"PHP {row['final_total']:.2f}",
-                        'Cash',  # Placeholder - update when payment table exists
-                        discount
-                    ])
-
-                self.view.update_transactions_table(table_data)
-            else:
-                self.view.update_transactions_table([])
-
+            future.result()
         except Exception as e:
-            print(f"Error loading transactions: {e}")
-            self.view.update_transactions_table([])
+            record_error("shift_reconcile", e)
+            return
+        self._render_shift_data()
 
     def print_summary(self):
         """Generate and save shift summary as PDF"""
@@ -227,7 +189,8 @@ class ShiftSummaryController:
             if not file_path:
                 return
 
-            # Create PDF
+            # Create PDF (matplotlib is only loaded when a summary is printed)
+            from matplotlib.backends.backend_pdf import PdfPages
             with PdfPages(file_path) as pdf:
                 self._create_summary_pdf(pdf)
 
@@ -243,11 +206,12 @@ class ShiftSummaryController:
                 "Error",
                 f"Failed to generate PDF: {str(e)}"
             )
-            print(f"Error generating PDF: {e}")
+            record_error("shift_summary_pdf", e)
 
     def _create_summary_pdf(self, pdf):
         """Create PDF content for shift summary"""
-        fig = plt.figure(figsize=(8.5, 11))
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(8.5, 11))
         fig.suptitle("SHIFT SUMMARY REPORT", fontsize=16, fontweight='bold', y=0.98)
 
         # Header info
@@ -281,14 +245,10 @@ class ShiftSummaryController:
                  ha='center', fontsize=9, style='italic', color='gray')
 
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
 
     def navigate_to_transaction(self):
         """Navigate back to transaction window"""
-        self.view.close()
-        from Controller.Cashier.TransactionController import TransactionController
-        self.trans_controller = TransactionController(self.current_user)
-        self.trans_controller.open_transaction()
+        self.session.navigate("transaction")
 
     def logout(self):
         """Logout and return to login"""
@@ -300,12 +260,4 @@ class ShiftSummaryController:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.view.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI.Login import LoginView
-
-            login_model = LoginModel()
-            login_view = LoginView()
-            login_controller = LoginController(login_model, login_view)
-            login_view.show()
\ No newline at end of file
+            self.session.logout()
@@ -4,13 +4,20 @@ from PyQt6.QtWidgets import QMessageBox
 from Utilities.DatabaseConnection import getConnection
 from View.CashierGUI.TransactionWindow import TransactionView, VoidTransactionDialog, PaymentPopup
 from Model.TransactionModel import TransactionModel
+from Utilities.Settings import RECEIPT_WIDTH, RECEIPTS_FOLDER, tax_label
+from Utilities.ShiftAccumulator import ShiftSale
+from Utilities.CheckoutService import create_transaction, find_product
+from Utilities.Resilience import DatabaseUnavailable
+from Utilities.Telemetry import record_error, span
+from Utilities.Terminals import TerminalDisabled
 
 
 class TransactionController:
     """Controller for Transaction window - handles business logic and DB operations"""
 
-    def __init__(self, current_user: dict):
+    def __init__(self, current_user: dict, session):
         self.current_user = current_user
+        self.session = session
         self.cashier_id = current_user.get('user_id')
         self.role = current_user.get('role', 'cashier')
         self.view = None
@@ -18,6 +25,7 @@ class TransactionController:
 
         # Receipt data storage
         self.last_transaction_id = None
+        self.last_transaction_number = None
         self.last_payment_data = None
         self.last_cart_items = None
         self.last_cashier_name = None
@@ -26,7 +34,7 @@ class TransactionController:
         """Initialize and show transaction window"""
         self.view = TransactionView(self.current_user)
         self._connect_signals()
-        self.view.show()
+        self.session.show_view(self.view)
 
     def _connect_signals(self):
         """Connect all UI signals to controller methods"""
@@ -48,17 +56,10 @@ class TransactionController:
         if not ref:
             return
 
-        # Get query from model
-        query, params = TransactionModel.get_product_query(ref)
-
-        # Execute in controller
         try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, params)
-            product = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with span("scan") as s:
+                product = find_product(ref)
+                s.set(found=bool(product))
 
             if product:
                 # Display product name in search box
@@ -71,7 +72,6 @@ class TransactionController:
                 self.view.productSearchInput.setFocus()
         except Exception as e:
             QMessageBox.critical(self.view, "Error", f"Database error: {str(e)}")
-            print(f"Error in search_product: {e}")
 
     # ============================================================
     # CART MANAGEMENT
@@ -87,34 +87,27 @@ class TransactionController:
                                 "Please enter a reference number.")
             return
 
-        # Get query from model
-        query, params = TransactionModel.get_product_query(ref)
-
-        # Execute in controller
         try:
-            conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, params)
-            product = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with span("add_to_cart", qty=qty) as s:
+                product = find_product(ref)
+                s.set(found=bool(product))
+
+                if product:
+                    # Create cart item
+                    item = {
+                        'product_id': product['product_id'],
+                        'reference_number': product['reference_number'],
+                        'product_name': product['product_name'],
+                        'price': float(product['price']),
+                        'qty': qty,
+                        'subtotal': float(product['price']) * qty
+                    }
+                    self.view.add_item_to_cart(item)
 
             if not product:
                 QMessageBox.warning(self.view, "Not Found", "Product not found.")
                 return
 
-            # Create cart item
-            item = {
-                'product_id': product['product_id'],
-                'reference_number': product['reference_number'],
-                'product_name': product['product_name'],
-                'price': float(product['price']),
-                'qty': qty,
-                'subtotal': float(product['price']) * qty
-            }
-
-            self.view.add_item_to_cart(item)
-
             # Reset inputs
             self.view.productSearchInput.clear()
             self.view.productSearchInput.setFocus()
@@ -122,7 +115,6 @@ class TransactionController:
 
         except Exception as e:
             QMessageBox.critical(self.view, "Error", f"Database error: {str(e)}")
-            print(f"Error in add_to_cart: {e}")
 
     # ============================================================
     # VOID TRANSACTION
@@ -168,7 +160,7 @@ class TransactionController:
                                          "Invalid admin code or insufficient permissions.")
             except Exception as e:
                 QMessageBox.critical(dialog, "Error", f"Database error: {str(e)}")
-                print(f"Error in verify_and_void: {e}")
+                record_error("void_transaction", e)
 
         dialog.confirmButton.clicked.connect(verify_and_void)
         dialog.exec()
@@ -192,17 +184,26 @@ class TransactionController:
 
     def confirm_payment(self, popup):
         """Process payment and save transaction"""
-        payment_data = popup.get_payment_data()
-
-        if payment_data['tendered'] < payment_data['total']:
-            QMessageBox.warning(popup, "Insufficient Payment",
-                                "Amount received is less than the total.")
+        try:
+            payment_data = popup.get_payment_data()
+        except ValueError as e:
+            QMessageBox.warning(popup, "Payment Not Accepted", str(e))
             return
 
         cart_items = self.view.get_cart_items()
 
         # Create transaction
-        transaction_id = self._create_transaction(payment_data, cart_items)
+        try:
+            transaction_id = self._create_transaction(payment_data, cart_items)
+        except DatabaseUnavailable as e:
+            QMessageBox.critical(self.view, "Lane Offline",
+                                 f"{e.msg}\nThe sale was not saved. The cart is kept - "
+                                 "try again once the database is back.")
+            return
+        except TerminalDisabled as e:
+            QMessageBox.critical(self.view, "Terminal Disabled",
+                                 f"{e}\nThe sale was not saved.")
+            return
 
         if not transaction_id:
             QMessageBox.critical(self.view, "Error",
@@ -210,6 +211,17 @@ class TransactionController:
             return
 
         popup.close()
+        self.session.shift_accumulator().record_sale(ShiftSale(
+            transaction_id=transaction_id,
+            transaction_number=self.last_transaction_number,
+            sold_at=datetime.datetime.now(),
+            final_total=payment_data['total'],
+            items=[(item['product_name'], item['qty']) for item in cart_items],
+            payments=[(p['method'], p['amount']) for p in payment_data['payments']],
+            discount_type=(None if payment_data['discount_type'] == "None"
+                           else payment_data['discount_type'].split('(')[0].strip())
+        ))
+        self.session.touch("sales")
 
         # Store receipt data
         cashier_name = self.current_user.get('full_name', 'CASHIER').upper()
@@ -219,9 +231,12 @@ class TransactionController:
         self.last_cashier_name = cashier_name
 
         # Generate and save receipt
-        success, result = self._generate_receipt(
-            transaction_id, payment_data, cart_items, cashier_name
-        )
+        with span("receipt", transaction_id=transaction_id) as s:
+            success, result = self._generate_receipt(
+                transaction_id, payment_data, cart_items, cashier_name
+            )
+            if not success:
+                s.fail(result)
 
         if success:
             QMessageBox.information(self.view, "Transaction Complete",
@@ -234,71 +249,26 @@ class TransactionController:
         self.view.clear_cart()
 
     def _create_transaction(self, payment_data: dict, cart_items: list) -> int:
-        """Create transaction in database"""
+        """Create transaction in database (0 on failure; raises DatabaseUnavailable/TerminalDisabled)"""
         try:
-            conn = getConnection()
-            cursor = conn.cursor()
-
-            # Generate transaction number
-            today = datetime.date.today().strftime('%Y%m%d')
-            transaction_number = f"TXN-{today}-{datetime.datetime.now().strftime('%H%M%S')}"
-
-            # Get discount type ID
-            discount_type_id = None
-            if payment_data.get('discount_type') != "None":
-                discount_query, discount_params = TransactionModel.get_discount_type_id_query(
-                    payment_data['discount_type'])
-                cursor.execute(discount_query, discount_params)
-                discount_result = cursor.fetchone()
-                if discount_result:
-                    discount_type_id = discount_result[0]
-
-            # Insert transaction
-            trans_query, trans_params = TransactionModel.create_transaction_query(
-                transaction_number=transaction_number,
-                cashier_id=self.cashier_id,
-                subtotal=payment_data['subtotal'],
-                discount_amount=payment_data['discount'],
-                final_total=payment_data['total'],
-                discount_type_id=discount_type_id
-            )
-            cursor.execute(trans_query, trans_params)
-            transaction_id = cursor.lastrowid
-
-            # Insert transaction items
-            for item in cart_items:
-                item_query, item_params = TransactionModel.add_transaction_item_query(
-                    transaction_id=transaction_id,
-                    product_id=item['product_id'],
-                    product_name=item['product_name'],
-                    quantity=item['qty'],
-                    unit_price=item['price'],
-                    total_price=item['subtotal']
-                )
-                cursor.execute(item_query, item_params)
-
-            conn.commit()
-            cursor.close()
-            conn.close()
-            return transaction_id
-
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            print(f"Error creating transaction: {e}")
-            return 0
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+            with span("checkout", items=len(cart_items),
+                      payments=len(payment_data['payments'])) as s:
+                transaction_id, transaction_number = create_transaction(
+                    self.cashier_id, payment_data, cart_items)
+                s.set(transaction_id=transaction_id)
+        except (DatabaseUnavailable, TerminalDisabled):
+            raise
+        except Exception:
+            return 0  # Recorded on the checkout span
+        self.last_transaction_number = transaction_number
+        return transaction_id
 
     @staticmethod
     def _generate_receipt(transaction_id: int, payment_data: dict,
                           cart_items: list, cashier_name: str):
         """Generate receipt text file"""
         now = datetime.datetime.now()
-        WIDTH = 42
+        WIDTH = RECEIPT_WIDTH
 
         def center(t):
             return f"{t:^{WIDTH}}"
@@ -336,7 +306,7 @@ class TransactionController:
         receipt_lines.extend([
             line(),
             lr("Subtotal:", price(payment_data['subtotal'])),
-            lr("Tax (12%):", price(payment_data['tax'])),
+            lr(tax_label(), price(payment_data['tax'])),
         ])
 
         if payment_data.get('discount', 0) > 0:
@@ -348,6 +318,14 @@ class TransactionController:
             lr("TOTAL:", price(payment_data['total'])),
             "",
             lr("Payment Method:", payment_data['method'].upper()),
+        ])
+
+        # Split tender: show what each method covered
+        if len(payment_data['payments']) > 1:
+            for payment in payment_data['payments']:
+                receipt_lines.append(lr(f"  {payment['method']}:", price(payment['amount'])))
+
+        receipt_lines.extend([
             lr("Amount Tendered:", price(payment_data['tendered'])),
             lr("Change:", price(payment_data['change'])),
             line(),
@@ -358,7 +336,7 @@ class TransactionController:
         ])
 
         # Save file
-        folder = "receipts"
+        folder = RECEIPTS_FOLDER
         os.makedirs(folder, exist_ok=True)
 
         filename = f"receipt_TXN-{transaction_id:06d}_{now.strftime('%Y%m%d_%H%M')}.txt"
@@ -369,8 +347,7 @@ class TransactionController:
                 f.write("\n".join(receipt_lines))
             return True, filepath
         except Exception as e:
-            print(f"Receipt save failed: {e}")
-            return False, str(e)
+            return False, str(e)  # Recorded on the receipt span
 
     # ============================================================
     # NAVIGATION
@@ -378,10 +355,7 @@ class TransactionController:
 
     def navigate_to_shift_summary(self):
         """Navigate to shift summary window"""
-        self.view.close()
-        from Controller.Cashier.ShiftSummaryController import ShiftSummaryController
-        self.shift_controller = ShiftSummaryController(self.current_user)
-        self.shift_controller.open_shift_summary()
+        self.session.navigate("shift_summary")
 
     def logout(self):
         """Logout and return to login"""
@@ -393,12 +367,4 @@ class TransactionController:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.view.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI.Login import LoginView
-
-            login_model = LoginModel()
-            login_view = LoginView()
-            login_controller = LoginController(login_model, login_view)
-            login_view.show()
\ No newline at end of file
+            self.session.logout()
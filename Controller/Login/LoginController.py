@@ -1,6 +1,10 @@
+from PyQt6.QtWidgets import QMessageBox
 from View.LoginGUI.Login import LoginView, LoginErrorPopup, LoginSuccessPopup
 from Model.Authentication.LoginModel import LoginModel
 from mysql.connector import Error
+from Utilities.Resilience import DatabaseUnavailable
+from Controller.SessionManager import SessionManager
+from Utilities.Telemetry import record_error
 
 
 class LoginController:
@@ -16,8 +20,7 @@ class LoginController:
 
         self.popup = None
         self.current_user = None
-        self.dashboard_controller = None
-        self.transaction_controller = None
+        self.session = None
 
     def handle_login(self):
         username = self.view.usernameInput.text().strip()
@@ -31,7 +34,12 @@ class LoginController:
             return
 
         # Validate user using controller-managed execution
-        user = self.validateUser(username, password)
+        try:
+            user = self.validateUser(username, password)
+        except DatabaseUnavailable as e:
+            QMessageBox.critical(self.view, "Database Unavailable",
+                                 f"{e.msg}\nPlease try again in a moment.")
+            return
 
         if not user:
             self.popup = LoginErrorPopup("invalid", self.view)
@@ -72,8 +80,10 @@ class LoginController:
             cursor.close()
             return user if user else None
 
+        except DatabaseUnavailable:
+            raise
         except Error as e:
-            print(f"[LoginController] Database error during validation: {e}")
+            record_error("login_validate", e)
             return None
         finally:
             if connection and connection.is_connected():
@@ -106,12 +116,10 @@ class LoginController:
 
     def open_cashier_transaction(self):
         """Open Transaction window with current user data"""
-        from Controller.Cashier.TransactionController import TransactionController
-        self.transaction_controller = TransactionController(self.current_user)
-        self.transaction_controller.open_transaction()
+        self.session = SessionManager(self.current_user)
+        self.session.navigate("transaction")
 
     def open_admin_dashboard(self):
         """Open Admin Dashboard with current user data"""
-        from Controller.Admin.AdminDashboardController import AdminDashboardController
-        self.dashboard_controller = AdminDashboardController(self.current_user)
-        self.dashboard_controller.open_dashboard()
\ No newline at end of file
+        self.session = SessionManager(self.current_user)
+        self.session.navigate("dashboard")
\ No newline at end of file
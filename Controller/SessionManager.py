@@ -0,0 +1,186 @@
+"""
+SessionManager.py
+Keeps one controller + view per screen alive for the whole login session
+
+Screens are created on first visit and then only switched to. When a screen
+is shown again it is refreshed only if its data is stale:
+    STALE_TOPICS  - data topics ("sales", ...) the screen shows; a write to a
+                    topic (touch) marks every other screen that shows it stale
+    MAX_DATA_AGE  - seconds after which the screen reloads anyway (other
+                    terminals write too); None = never
+Controllers may also define activate()/deactivate() (called when their screen
+is shown again / hidden) and must define refresh() if they declare staleness.
+"""
+import datetime
+import importlib
+import time
+
+from PyQt6.QtWidgets import QMessageBox
+
+from View.SessionWindow import SessionWindow
+from Utilities.Resilience import CircuitBreaker, get_breaker, is_offline
+from Utilities.ShiftAccumulator import ShiftAccumulator
+from Utilities.Telemetry import span
+from Utilities.Terminals import set_terminal_user
+
+
+# Screen name -> (controller module, controller class, method that builds the view)
+SCREENS = {
+    "transaction": ("Controller.Cashier.TransactionController", "TransactionController",
+                    "open_transaction"),
+    "shift_summary": ("Controller.Cashier.ShiftSummaryController", "ShiftSummaryController",
+                      "open_shift_summary"),
+    "dashboard": ("Controller.Admin.AdminDashboardController", "AdminDashboardController",
+                  "open_dashboard"),
+    "products": ("Controller.Admin.ProductsManagementController", "AdminProductsController",
+                 "open_products_window"),
+    "reports": ("Controller.Admin.ReportsController", "AdminReportsController", "open_reports"),
+    "users": ("Controller.Admin.UsersManagementController", "AdminUsersController",
+              "open_users_window"),
+}
+
+
+class SessionManager:
+    """Window/session manager for one logged-in user"""
+
+    def __init__(self, current_user: dict):
+        self.current_user = current_user
+        self.window = SessionWindow()
+        self.controllers = {}
+        self.current = None
+        self.login_controller = None
+
+        # Data topic versions, and per screen: (versions seen, monotonic load time)
+        self.versions = {}
+        self._loaded = {}
+
+        self._shift = None
+
+        # Heartbeats report who is signed in at this terminal
+        set_terminal_user(current_user.get('user_id'))
+
+        # Offline banner follows the database circuit breaker
+        get_breaker().add_listener(self._circuit_changed)
+        self.window.offline_changed.emit(is_offline())
+
+    # ============================================================
+    # NAVIGATION
+    # ============================================================
+
+    def navigate(self, name: str):
+        """
+        Show a screen, creating its controller on first use
+        Returns: the screen's controller; if it cannot be opened the error is
+        shown and the previous screen's controller is returned (None after
+        logging out when there was no previous screen)
+        """
+        if name == self.current:
+            return self.controllers[name]
+
+        previous = self.controllers.get(self.current)
+        if previous is not None and hasattr(previous, 'deactivate'):
+            previous.deactivate()
+
+        controller = self.controllers.get(name)
+        with span("window_open", screen=name, first=controller is None) as s:
+            if controller is None:
+                module_name, class_name, open_method = SCREENS[name]
+                try:
+                    controller_class = getattr(importlib.import_module(module_name), class_name)
+                    controller = controller_class(self.current_user, self)
+                    getattr(controller, open_method)()
+                except Exception as e:
+                    # Not registered: the next navigate builds the screen again
+                    # instead of reusing a controller without a view. Not
+                    # re-raised either - navigate runs in Qt slots, where an
+                    # unhandled exception ends the process
+                    s.fail(e)
+                    if controller is not None and hasattr(controller, 'deactivate'):
+                        controller.deactivate()
+                    QMessageBox.critical(self.window, "Screen Unavailable",
+                                         f"Could not open the {name.replace('_', ' ')} "
+                                         f"screen:\n{e}")
+                    if previous is None:
+                        # Nothing to go back to (first screen after login)
+                        self.logout()
+                        return None
+                    self.window.show_page(previous.view)
+                    if hasattr(previous, 'activate'):
+                        previous.activate()
+                    return previous
+                self.controllers[name] = controller
+                self.current = name
+                self._mark_loaded(name)
+                return controller
+
+            self.current = name
+
+            self.window.show_page(controller.view)
+            stale = self._is_stale(name)
+            s.set(refreshed=stale)
+            if stale:
+                controller.refresh()
+                self._mark_loaded(name)
+            if hasattr(controller, 'activate'):
+                controller.activate()
+        return controller
+
+    def show_view(self, view):
+        """Called by a controller once its view is built"""
+        self.window.show_page(view)
+
+    def _circuit_changed(self, state: str):
+        self.window.offline_changed.emit(state != CircuitBreaker.CLOSED)
+
+    def logout(self):
+        """End the session and return to the login window"""
+        get_breaker().remove_listener(self._circuit_changed)
+        for controller in self.controllers.values():
+            if hasattr(controller, 'deactivate'):
+                controller.deactivate()
+        self.window.close()
+        self.window.deleteLater()
+        self.controllers.clear()
+        self.current = None
+        set_terminal_user(None)
+
+        from Controller.Login.LoginController import LoginController
+        from Model.Authentication.LoginModel import LoginModel
+        from View.LoginGUI.Login import LoginView
+
+        login_view = LoginView()
+        self.login_controller = LoginController(LoginModel(), login_view)
+        login_view.show()
+
+    def shift_accumulator(self) -> ShiftAccumulator:
+        """Running totals for this cashier's day (a new one after midnight)"""
+        today = datetime.date.today()
+        if self._shift is None or self._shift.day != today:
+            self._shift = ShiftAccumulator(self.current_user.get('user_id'), today)
+        return self._shift
+
+    # ============================================================
+    # STALE DATA TRACKING
+    # ============================================================
+
+    def touch(self, topic: str):
+        """Record a write to a data topic (e.g. "sales" after a checkout)"""
+        self.versions[topic] = self.versions.get(topic, 0) + 1
+
+        # The screen that made the write already shows it
+        if self.current in self._loaded and topic in self._topics(self.current):
+            self._mark_loaded(self.current)
+
+    def _topics(self, name: str) -> tuple:
+        return getattr(self.controllers[name], 'STALE_TOPICS', ())
+
+    def _mark_loaded(self, name: str):
+        seen = {topic: self.versions.get(topic, 0) for topic in self._topics(name)}
+        self._loaded[name] = (seen, time.monotonic())
+
+    def _is_stale(self, name: str) -> bool:
+        seen, loaded_at = self._loaded[name]
+        if any(self.versions.get(topic, 0) != version for topic, version in seen.items()):
+            return True
+        max_age = getattr(self.controllers[name], 'MAX_DATA_AGE', None)
+        return max_age is not None and time.monotonic() - loaded_at > max_age
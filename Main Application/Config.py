@@ -0,0 +1,53 @@
+"""
+Configuration command for SyPoint POS System
+Shows the effective settings and where each came from (default, the config
+file or an environment variable), or prints a commented sypoint.ini to start
+from (Utilities/Config.py)
+
+Usage (from the project root):
+    python "Main Application/Config.py"
+    python "Main Application/Config.py" --example > sypoint.ini
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.Config import OPTIONS, ConfigError, example_config, load_config
+
+
+def main():
+    """Configuration entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint configuration")
+    parser.add_argument("--example", action="store_true",
+                        help="Print a commented sypoint.ini with every default")
+    args = parser.parse_args()
+
+    if args.example:
+        print(example_config(), end="")
+        return
+
+    try:
+        config = load_config()
+    except ConfigError as e:
+        print(e)
+        sys.exit(1)
+
+    print(f"Config file: {config.path}"
+          + ("" if os.path.exists(config.path) else " (not found, using defaults)"))
+    section = None
+    for option in OPTIONS:
+        if option.section != section:
+            section = option.section
+            print(f"\n[{section}]")
+        name = (option.section, option.key)
+        value = config.values[name]
+        if option.key == "password" and value:
+            value = "********"
+        print(f"    {option.key:<22} = {str(value):<32} ({config.sources[name]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Headless report generation for SyPoint POS System
+Runs AdminReportsModel reports without Qt and writes CSV/PDF files
+
+Usage (from the project root):
+    python "Main Application/GenerateReports.py" list
+    python "Main Application/GenerateReports.py" run daily-sales --from 2025-01-01 --to 2025-01-31
+    python "Main Application/GenerateReports.py" run daily-sales --from 2025-02-01 --to 2025-02-28 --compare last-year
+    python "Main Application/GenerateReports.py" package --from 2025-01-01 --to 2025-01-31
+    python "Main Application/GenerateReports.py" run daily-sales --from 2023-01-01 --to 2023-12-31 --include-archive
+    python "Main Application/GenerateReports.py" schedule --at 01:00 --end-of-day --end-of-month
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+# Allow running as a plain script (cron / task scheduler) from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.ReportRunner import (
+    REPORT_QUERIES, COMPARISON_REPORTS, comparison_period, report_slug, resolve_report_type,
+    run_report, run_report_package
+)
+from Utilities.ReportScheduler import ReportScheduler
+from Utilities.Settings import REPORT_WORKERS
+
+
+# --compare values -> ReportRunner comparison modes
+COMPARE_ARGS = {
+    "previous-period": "Previous Period",
+    "last-year": "Same Period Last Year",
+}
+
+
+def _parse_date(text: str) -> datetime.date:
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def _parse_time(text: str) -> datetime.time:
+    return datetime.datetime.strptime(text, "%H:%M").time()
+
+
+def _report_types(names: list) -> list:
+    return [resolve_report_type(name) for name in names] if names else list(REPORT_QUERIES)
+
+
+def cmd_list(args):
+    """List available reports"""
+    for report_type in REPORT_QUERIES:
+        print(f"{report_slug(report_type):<22} {report_type}")
+    return 0
+
+
+def _date_range(args):
+    today = datetime.date.today()
+    return args.from_date or today, args.to_date or today
+
+
+def cmd_run(args):
+    """Run reports once for a date range"""
+    from_date, to_date = _date_range(args)
+
+    if from_date > to_date:
+        print("From date cannot be later than To date.")
+        return 2
+
+    compare = COMPARE_ARGS.get(args.compare, "None")
+    report_types = _report_types(args.reports)
+    if compare != "None":
+        if not args.reports:
+            report_types = list(COMPARISON_REPORTS)
+        unsupported = [r for r in report_types if r not in COMPARISON_REPORTS]
+        if unsupported:
+            print(f"Comparison is not available for: {', '.join(unsupported)}")
+            return 2
+        try:
+            comparison_period(from_date, to_date, compare)
+        except ValueError as e:
+            print(e)
+            return 2
+
+    for report_type in report_types:
+        for path in run_report(report_type, from_date, to_date, args.output, args.format,
+                               compare, args.include_archive):
+            print(path)
+    return 0
+
+
+def cmd_package(args):
+    """Run all reports concurrently and write the combined PDF and workbook"""
+    from_date, to_date = _date_range(args)
+
+    if from_date > to_date:
+        print("From date cannot be later than To date.")
+        return 2
+
+    paths, timings, wall_clock = run_report_package(from_date, to_date, args.output,
+                                                    _report_types(args.reports), args.workers,
+                                                    args.include_archive)
+    for report_type, seconds in timings.items():
+        print(f"{report_type:<30} {seconds:>8.2f}s")
+    print(f"{'Total (wall-clock)':<30} {wall_clock:>8.2f}s")
+    for path in paths:
+        print(path)
+    return 0
+
+
+def cmd_schedule(args):
+    """Run reports on end-of-day / end-of-month schedules until interrupted"""
+    report_types = _report_types(args.reports)
+    jobs = []
+    if args.end_of_day:
+        jobs.append(("end-of-day", report_types, args.format))
+    if args.end_of_month:
+        jobs.append(("end-of-month", report_types, args.format))
+
+    if not jobs:
+        print("Select at least one schedule (--end-of-day and/or --end-of-month).")
+        return 2
+
+    scheduler = ReportScheduler(jobs, output_dir=args.output, run_at=args.at,
+                                max_workers=args.workers)
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main():
+    """Headless report entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint headless report generation")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = sub.add_parser("list", help="List available reports")
+    list_parser.set_defaults(func=cmd_list)
+
+    run_parser = sub.add_parser("run", help="Generate reports for a date range")
+    run_parser.add_argument("reports", nargs="*",
+                            help="Report names or slugs (default: all reports)")
+    run_parser.add_argument("--from", dest="from_date", type=_parse_date,
+                            help="Start date YYYY-MM-DD (default: today)")
+    run_parser.add_argument("--to", dest="to_date", type=_parse_date,
+                            help="End date YYYY-MM-DD (default: today)")
+    run_parser.add_argument("--compare", choices=list(COMPARE_ARGS),
+                            help="Compare against the previous period or the same period last year")
+    run_parser.set_defaults(func=cmd_run)
+
+    package_parser = sub.add_parser("package",
+                                    help="Generate all reports concurrently as one PDF/workbook")
+    package_parser.add_argument("reports", nargs="*",
+                                help="Report names or slugs (default: all reports)")
+    package_parser.add_argument("--from", dest="from_date", type=_parse_date,
+                                help="Start date YYYY-MM-DD (default: today)")
+    package_parser.add_argument("--to", dest="to_date", type=_parse_date,
+                                help="End date YYYY-MM-DD (default: today)")
+    package_parser.add_argument("--workers", type=int, default=REPORT_WORKERS,
+                                help=f"Concurrent queries / pooled connections "
+                                     f"(default: {REPORT_WORKERS})")
+    package_parser.add_argument("--output", default="reports", help="Output folder (default: reports)")
+    package_parser.set_defaults(func=cmd_package)
+
+    schedule_parser = sub.add_parser("schedule", help="Run reports on a schedule")
+    schedule_parser.add_argument("reports", nargs="*",
+                                 help="Report names or slugs (default: all reports)")
+    schedule_parser.add_argument("--end-of-day", action="store_true",
+                                 help="Run for the previous day, every day")
+    schedule_parser.add_argument("--end-of-month", action="store_true",
+                                 help="Run for the previous month, on the 1st")
+    schedule_parser.add_argument("--at", type=_parse_time, default=datetime.time(1, 0),
+                                 help="Time of day to run, HH:MM (default: 01:00)")
+    schedule_parser.add_argument("--workers", type=int, default=2,
+                                 help="Process pool size (default: 2)")
+    schedule_parser.set_defaults(func=cmd_schedule)
+
+    for p in (run_parser, schedule_parser):
+        p.add_argument("--format", nargs="+", choices=["csv", "pdf"], default=["csv", "pdf"])
+        p.add_argument("--output", default="reports", help="Output folder (default: reports)")
+
+    for p in (run_parser, package_parser):
+        p.add_argument("--include-archive", action="store_true",
+                       help="Also read years moved to the archive tables")
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Import-time profiler for SyPoint POS System
+Runs `python -X importtime` over the modules a startup path loads and prints
+a summary of where the import time goes
+
+Usage (from the project root):
+    python "Main Application/ImportProfile.py"
+    python "Main Application/ImportProfile.py" cashier --top 30
+    python "Main Application/ImportProfile.py" admin --min-ms 1
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported before each window can be shown
+LOGIN_MODULES = [
+    "PyQt6.QtWidgets",
+    "View.LoginGUI.Login",
+    "Model.Authentication.LoginModel",
+    "Controller.Login.LoginController",
+]
+TARGETS = {
+    "login": LOGIN_MODULES,
+    "cashier": LOGIN_MODULES + [
+        "Controller.Cashier.TransactionController",
+        "Controller.Cashier.ShiftSummaryController",
+    ],
+    "admin": LOGIN_MODULES + [
+        "Controller.Admin.AdminDashboardController",
+        "Controller.Admin.ReportsController",
+        "Controller.Admin.ProductsManagementController",
+        "Controller.Admin.UsersManagementController",
+    ],
+}
+
+
+def profile_imports(modules: list) -> list:
+    """
+    Import modules in a fresh interpreter with -X importtime
+    Returns: list of (module, self_us, cumulative_us, depth) in import order
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM="offscreen")
+    code = "import " + ", ".join(modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def top_level_totals(entries: list) -> dict:
+    """Self time per top-level package (PyQt6, mysql, matplotlib, ...)"""
+    totals = {}
+    for name, self_us, _, _ in entries:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+
+def print_summary(target: str, entries: list, top: int, min_ms: float):
+    total_us = sum(self_us for _, self_us, _, _ in entries)
+    print(f"Import profile: {target} ({len(entries)} modules, {total_us / 1000:.1f} ms total)")
+
+    print(f"\nBy package (self time, >= {min_ms:g} ms)")
+    for package, self_us in sorted(top_level_totals(entries).items(),
+                                   key=lambda item: item[1], reverse=True):
+        if self_us / 1000 >= min_ms:
+            print(f"  {package:<40} {self_us / 1000:>9.1f} ms")
+
+    print(f"\nSlowest modules (cumulative, top {top})")
+    project_packages = {"View", "Model", "Controller", "Utilities"}
+    for name, _, cumulative_us, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:top]:
+        marker = "*" if name.split(".")[0] in project_packages else " "
+        print(f" {marker}{name:<50} {cumulative_us / 1000:>9.1f} ms")
+    print("\n* = project module")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SyPoint import-time profiler")
+    parser.add_argument("target", nargs="?", default="login", choices=list(TARGETS),
+                        help="Startup path to profile (default: login)")
+    parser.add_argument("--top", type=int, default=20, help="Modules to list (default: 20)")
+    parser.add_argument("--min-ms", type=float, default=5.0,
+                        help="Hide packages below this self time (default: 5 ms)")
+    args = parser.parse_args()
+
+    try:
+        entries = profile_imports(TARGETS[args.target])
+    except RuntimeError as e:
+        print(f"Import failed: {e}")
+        sys.exit(1)
+
+    print_summary(args.target, entries, args.top, args.min_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,135 @@
 """
 Main Application Entry Point for SyPoint POS System
+
+Options:
+    --query-stats         write per-query statistics on exit
+    --profile[=SECONDS]   profile start-up and the first SECONDS (default [profiler] seconds)
+    --profile-next        profile the next checkout or report
+While running:
+    Ctrl+Shift+P          start a timed profile (press again to stop it early)
+    Ctrl+Shift+O          profile the next checkout or report
+Profiles are saved under [profiler] folder; read them with
+    python "Main Application/Profiles.py" show latest
 """
 
+import atexit
 import sys
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QMessageBox
 from View.LoginGUI.Login import LoginView
 from Model.Authentication.LoginModel import LoginModel
 from Controller.Login.LoginController import LoginController
+from Utilities.Profiler import get_profiler
+from Utilities.Settings import PROFILE_SECONDS
+from Utilities.Telemetry import start_metrics_server
+from Utilities.Terminals import start_terminal
+
+
+class ProfilerHotkeys(QObject):
+    """Application-wide profiling hotkeys and the timer that ends a timed capture"""
+
+    def __init__(self, app: QApplication):
+        super().__init__(app)
+        self.profiler = get_profiler()
+        self.profiler.on_saved.append(self._saved)
+        self._capture = 0  # so a stale timer cannot end a newer capture
+        app.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.KeyPress:
+            modifiers = event.modifiers()
+            shift_ctrl = (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier)
+            if modifiers & shift_ctrl == shift_ctrl:
+                if event.key() == Qt.Key.Key_P:
+                    self.toggle()
+                    return True
+                if event.key() == Qt.Key.Key_O:
+                    self.profile_next()
+                    return True
+        return super().eventFilter(obj, event)
+
+    def start(self, seconds: int = PROFILE_SECONDS, label: str = "manual"):
+        """Profile the next `seconds` seconds"""
+        if not self.profiler.start(label):
+            return
+        self._capture += 1
+        capture = self._capture
+        QTimer.singleShot(seconds * 1000, lambda: self._timeout(capture))
+        print(f"[Profiler] Profiling for {seconds}s (Ctrl+Shift+P stops early)")
+
+    def toggle(self):
+        if self.profiler.running:
+            self.profiler.stop()
+        else:
+            self.start()
+
+    def profile_next(self):
+        self.profiler.arm(("checkout", "report"))
+        print("[Profiler] The next checkout or report will be profiled")
+
+    def _timeout(self, capture: int):
+        if capture == self._capture and self.profiler.running:
+            self.profiler.stop()
+
+    def _saved(self, path: str):
+        print(f"[Profiler] Profile saved to {path}")
+        box = QMessageBox(QMessageBox.Icon.Information, "Profile Saved",
+                          f"Profile saved:\n{path}", parent=QApplication.activeWindow())
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.show()
+
+
+def _profile_seconds(argv: list):
+    """
+    Seconds from --profile / --profile=N (None without the flag)
+    A value that is not a positive whole number is reported and replaced by PROFILE_SECONDS
+    """
+    for arg in argv:
+        if arg == "--profile":
+            return PROFILE_SECONDS
+        if arg.startswith("--profile="):
+            value = arg.split("=", 1)[1]
+            try:
+                seconds = int(value)
+            except ValueError:
+                seconds = 0
+            if seconds > 0:
+                return seconds
+            print(f"Usage: --profile[=SECONDS] with SECONDS a positive whole number; "
+                  f"got {value!r}, profiling for {PROFILE_SECONDS}s instead")
+            return PROFILE_SECONDS
+    return None
+
 
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
 
+    # Profiling: hotkeys always, plus --profile / --profile-next
+    hotkeys = ProfilerHotkeys(app)
+    profile_seconds = _profile_seconds(sys.argv)
+    if profile_seconds:
+        hotkeys.start(profile_seconds, label="startup")
+    if "--profile-next" in sys.argv:
+        hotkeys.profile_next()
+
+    # --query-stats: write per-query latency/row statistics on exit
+    if "--query-stats" in sys.argv:
+        from Utilities.QueryStats import get_query_stats
+        atexit.register(lambda: print(f"Query statistics written to "
+                                      f"{get_query_stats().dump_summary()}"))
+
+    # Prometheus /metrics for this lane's spans ([telemetry] metrics_port, 0 = off)
+    start_metrics_server()
+
+    # Register this process as a terminal (lane) and start its heartbeat
+    terminal = start_terminal()
+    if terminal is not None and not terminal.is_active:
+        QMessageBox.critical(None, "Terminal Disabled",
+                             f"Terminal {terminal.display_name} has been disabled.\n"
+                             "Ask an administrator to enable it.")
+        sys.exit(1)
+
     # Initialize Model, View, and Controller
     model = LoginModel()
     view = LoginView()
@@ -0,0 +1,33 @@
+"""
+Schema migration entry point for SyPoint POS System
+Brings an existing database up to the current schema
+
+Usage (from the project root):
+    python "Main Application/Migrate.py"            apply pending migrations
+    python "Main Application/Migrate.py" --status   list pending migrations
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.Migrations import apply_migrations
+
+
+def main():
+    """Migration entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint schema migrations")
+    parser.add_argument("--status", action="store_true", help="Only list pending migrations")
+    args = parser.parse_args()
+
+    migrations = apply_migrations(dry_run=args.status)
+    if args.status:
+        print("\n".join(migrations) if migrations else "Database is up to date.")
+    else:
+        print(f"Applied {len(migrations)} migration(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Partition maintenance and archival for SyPoint POS System
+Keeps monthly partitions ahead of today on transactions / transaction_items
+and moves closed years to the archive tables (Utilities/Partitions.py)
+
+Usage (from the project root):
+    python "Main Application/Partitions.py" status
+    python "Main Application/Partitions.py" maintain                 run monthly (cron / task scheduler)
+    python "Main Application/Partitions.py" archive 2023
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.Dialect import sql
+from Utilities.Partitions import (
+    PARTITIONED_TABLES, archive_year, ensure_partitions, get_partitions
+)
+from Utilities.Settings import PARTITION_MONTHS_AHEAD
+
+
+def cmd_status(args):
+    """List the partitions of each table with their estimated row counts"""
+    if sql().name != "mysql":
+        print("SQLite tables are not partitioned.")
+        return 0
+    conn = getConnection()
+    cursor = conn.cursor()
+    try:
+        for table in PARTITIONED_TABLES:
+            print(table)
+            for name, bound, rows in get_partitions(cursor, table):
+                print(f"    {name:<10} < {bound:<14} {rows or 0:>12,} rows")
+    finally:
+        cursor.close()
+        conn.close()
+    return 0
+
+
+def cmd_maintain(args):
+    """Split p_future into monthly partitions up to --months-ahead past today"""
+    if sql().name != "mysql":
+        print("SQLite tables are not partitioned; nothing to do.")
+        return 0
+    created = ensure_partitions(months_ahead=args.months_ahead)
+    for table, name in created:
+        print(f"Created {table}.{name}")
+    print(f"Created {len(created)} partition(s).")
+    return 0
+
+
+def cmd_archive(args):
+    """Move a closed year to the archive tables"""
+    try:
+        archived = archive_year(args.year)
+    except ValueError as e:
+        print(e)
+        return 2
+    for table, rows in archived.items():
+        print(f"{table:<20} {rows:>12,} rows archived")
+    return 0
+
+
+def main():
+    """Partition maintenance entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint partition maintenance and archival")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    status_parser = sub.add_parser("status", help="List partitions and row estimates")
+    status_parser.set_defaults(func=cmd_status)
+
+    maintain_parser = sub.add_parser("maintain", help="Create upcoming monthly partitions")
+    maintain_parser.add_argument("--months-ahead", type=int, default=PARTITION_MONTHS_AHEAD,
+                                 help=f"Empty months to keep ahead of today "
+                                      f"(default: {PARTITION_MONTHS_AHEAD})")
+    maintain_parser.set_defaults(func=cmd_maintain)
+
+    archive_parser = sub.add_parser("archive", help="Move a closed year to the archive tables")
+    archive_parser.add_argument("year", type=int,
+                                help=f"Year to archive (before {datetime.date.today().year})")
+    archive_parser.set_defaults(func=cmd_archive)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
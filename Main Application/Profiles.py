@@ -0,0 +1,108 @@
+"""
+Profile viewer for SyPoint POS System
+Lists the profiles captured by the GUI (Main.py --profile, Ctrl+Shift+P /
+Ctrl+Shift+O) and summarises one as its hottest functions (Utilities/Profiler.py)
+
+Usage (from the project root):
+    python "Main Application/Profiles.py" list
+    python "Main Application/Profiles.py" show latest
+    python "Main Application/Profiles.py" show logs/profiles/profile_20261019_091403_checkout.prof --sort cumulative --limit 40
+    python "Main Application/Profiles.py" show latest --project     only SyPoint's own code
+"""
+
+import argparse
+import datetime
+import os
+import pstats
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.Profiler import list_profiles
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --sort choice -> index into a pstats entry (primitive calls, calls, own time, total time)
+SORT_KEYS = {"tottime": 2, "cumulative": 3, "calls": 1}
+
+
+def _where(filename: str, line: int, function: str) -> str:
+    """Function location, relative to the project root when it is SyPoint code"""
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    elif filename != "~":
+        filename = os.path.basename(filename)
+    return f"{function}  ({filename}:{line})" if filename != "~" else function
+
+
+def cmd_list(args):
+    """Saved profiles, newest first"""
+    paths = list_profiles()
+    if not paths:
+        print("No profiles saved yet.")
+        return 0
+    print(f"{'Saved':<20} {'Size':>9}  Profile")
+    print("-" * 80)
+    for path in paths[:args.limit]:
+        saved = datetime.datetime.fromtimestamp(os.path.getmtime(path))
+        print(f"{saved:%Y-%m-%d %H:%M:%S} {os.path.getsize(path) // 1024:>7} KB  "
+              f"{os.path.relpath(path, _ROOT)}")
+    return 0
+
+
+def cmd_show(args):
+    """Top functions of one profile"""
+    path = args.profile
+    if path == "latest":
+        paths = list_profiles()
+        if not paths:
+            print("No profiles saved yet.")
+            return 1
+        path = paths[0]
+    if not os.path.exists(path):
+        print(f"Profile not found: {path}")
+        return 1
+
+    stats = pstats.Stats(path)
+    entries = [(key, value) for key, value in stats.stats.items()
+               if not args.project or key[0].startswith(_ROOT)]
+    entries.sort(key=lambda entry: entry[1][SORT_KEYS[args.sort]], reverse=True)
+
+    print(f"{os.path.relpath(path, _ROOT)}: {stats.total_calls:,} calls in "
+          f"{stats.total_tt:.3f}s, sorted by {args.sort}"
+          + (" (SyPoint code only)" if args.project else ""))
+    print()
+    print(f"{'Calls':>10} {'Own s':>9} {'Total s':>9} {'ms/call':>9}  Function")
+    print("-" * 100)
+    for (filename, line, function), (_, calls, own, total, _) in entries[:args.limit]:
+        per_call = total / calls * 1000 if calls else 0.0
+        print(f"{calls:>10,} {own:>9.3f} {total:>9.3f} {per_call:>9.2f}  "
+              f"{_where(filename, line, function)}")
+    return 0
+
+
+def main():
+    """Profile viewer entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint profile viewer")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = sub.add_parser("list", help="List saved profiles")
+    list_parser.add_argument("--limit", type=int, default=20, help="profiles to list")
+    list_parser.set_defaults(func=cmd_list)
+
+    show_parser = sub.add_parser("show", help="Show a profile's hottest functions")
+    show_parser.add_argument("profile", help="Profile file, or 'latest'")
+    show_parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="tottime",
+                             help="tottime: time in the function itself (default); "
+                                  "cumulative: including what it calls")
+    show_parser.add_argument("--limit", type=int, default=25, help="functions to show")
+    show_parser.add_argument("--project", action="store_true",
+                             help="only functions in SyPoint's own modules")
+    show_parser.set_defaults(func=cmd_show)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
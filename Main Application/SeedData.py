@@ -0,0 +1,53 @@
+"""
+Synthetic history seed tool for SyPoint POS System
+Bulk-loads years of realistic transactions into a scratch database
+(see Utilities/SeedGenerator.py for the distributions used)
+
+Usage (from the project root):
+    python "Main Application/SeedData.py" --items 1M --years 3
+    python "Main Application/SeedData.py" --items 10M --years 3 --method load
+    python "Main Application/SeedData.py" --items 500k --from 2024-01-01 --to 2024-12-31
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utilities.SeedGenerator import SeedGenerator, parse_count
+from Utilities.Settings import SEED_BATCH_ROWS
+
+
+def _parse_date(text: str) -> datetime.date:
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def main():
+    """Seed entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint synthetic history seed tool")
+    parser.add_argument("--items", type=parse_count, required=True,
+                        help="transaction items to add, e.g. 1M, 10M, 250k")
+    parser.add_argument("--years", type=int, default=3, help="history length ending yesterday")
+    parser.add_argument("--from", dest="from_date", type=_parse_date, help="first day (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", type=_parse_date, help="last day (YYYY-MM-DD)")
+    parser.add_argument("--method", choices=("insert", "load"), default="insert",
+                        help="multi-row INSERTs or LOAD DATA LOCAL INFILE")
+    parser.add_argument("--batch-rows", type=int, default=SEED_BATCH_ROWS,
+                        help="rows per INSERT statement")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+
+    to_date = args.to_date or datetime.date.today() - datetime.timedelta(days=1)
+    from_date = args.from_date or to_date - datetime.timedelta(days=365 * args.years - 1)
+
+    print(f"Seeding ~{args.items:,} items from {from_date} to {to_date} ({args.method})")
+    generator = SeedGenerator(seed=args.seed, method=args.method, batch_rows=args.batch_rows)
+    totals = generator.seed(args.items, from_date, to_date)
+    print(f"Added {totals['transactions']:,} transactions / {totals['items']:,} items "
+          f"in {totals['seconds']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Terminal registry command for SyPoint POS System
+Lists the registered lanes with their heartbeat status and changes a
+terminal's configuration (Utilities/Terminals.py)
+
+Usage (from the project root):
+    python "Main Application/Terminals.py" list
+    python "Main Application/Terminals.py" set LANE-01 --name "Lane 1" --prefix L01
+    python "Main Application/Terminals.py" set LANE-01 --disable
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mysql.connector import Error
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.Statements import execute_statement
+from Utilities.Terminals import get_terminals
+from Model.TerminalModel import TerminalModel
+
+
+def cmd_list(args):
+    """List terminals, online first"""
+    try:
+        terminals = get_terminals()
+    except Error as e:
+        print(f"Database connection error: {e}")
+        return 1
+    if not terminals:
+        print("No terminals registered yet.")
+        return 0
+    print(f"{'Terminal':<20} {'Name':<20} {'Prefix':<8} {'Status':<9} "
+          f"{'Last heartbeat':<20} {'Signed in'}")
+    print("-" * 95)
+    for t in sorted(terminals, key=lambda t: not t['online']):
+        status = "disabled" if not t['is_active'] else "online" if t['online'] else "offline"
+        last = f"{t['last_heartbeat']:%Y-%m-%d %H:%M:%S}" if t['last_heartbeat'] else "-"
+        print(f"{t['terminal_code']:<20} {t['display_name'] or '-':<20} "
+              f"{t['number_prefix'] or 'T%03d' % t['terminal_id']:<8} {status:<9} "
+              f"{last:<20} {t['current_user_name'] or '-'}")
+    return 0
+
+
+def cmd_set(args):
+    """Change a terminal's display name, number prefix or enabled state"""
+    is_active = True if args.enable else False if args.disable else None
+    try:
+        conn = getConnection()
+    except Error as e:
+        print(f"Database connection error: {e}")
+        return 1
+    try:
+        if not execute_statement(conn, TerminalModel.get_terminal_query, args.terminal).rows:
+            print(f"Unknown terminal: {args.terminal}")
+            return 2
+        execute_statement(conn, TerminalModel.update_terminal_query, args.terminal,
+                          args.name, args.prefix, is_active)
+        conn.commit()
+    except Error as e:
+        print(f"Could not update {args.terminal}: {e}")
+        return 1
+    finally:
+        conn.close()
+
+    print(f"Updated {args.terminal}.")
+    if is_active is not None:
+        # Every checkout re-reads is_active (Utilities/CheckoutService.py)
+        print(f"{'Enabled' if is_active else 'Disabled'}; applies from the terminal's next sale.")
+    if args.name or args.prefix:
+        print("Running terminals show the new name and prefix after a restart.")
+    return 0
+
+def main():
+    """Terminal registry entry point"""
+    parser = argparse.ArgumentParser(description="SyPoint terminal registry")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = sub.add_parser("list", help="List terminals and their heartbeat status")
+    list_parser.set_defaults(func=cmd_list)
+
+    set_parser = sub.add_parser("set", help="Configure a terminal")
+    set_parser.add_argument("terminal", help="Terminal code (SYPOINT_TERMINAL / host name)")
+    set_parser.add_argument("--name", help="Display name")
+    set_parser.add_argument("--prefix", help="Transaction number prefix")
+    state = set_parser.add_mutually_exclusive_group()
+    state.add_argument("--enable", action="store_true", help="Allow the terminal to sell")
+    state.add_argument("--disable", action="store_true", help="Stop the terminal from selling")
+    set_parser.set_defaults(func=cmd_set)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
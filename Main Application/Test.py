@@ -1,16 +1,16 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 
-from Controller.Cashier.TransactionController import TransactionController
+from Controller.SessionManager import SessionManager
 
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
 
-    view = TransactionController()
-    view.open_transaction()
+    session = SessionManager({'user_id': 1, 'full_name': 'Test Cashier', 'role': 'cashier'})
+    session.navigate("transaction")
 
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,7 +4,9 @@ Model for Admin Dashboard operations - Returns queries and parameters
 Controller executes the queries
 No changes needed - provided for completeness
 """
-from datetime import date
+from datetime import date, timedelta
+
+from Utilities.Dialect import sql
 
 
 class AdminDashboardModel:
@@ -22,10 +24,10 @@ class AdminDashboardModel:
         query = """
             SELECT COALESCE(SUM(final_total), 0) as total_sales
             FROM transactions
-            WHERE DATE(transaction_date) = %s
+            WHERE transaction_date >= %s AND transaction_date < %s
               AND status = 'completed'
         """
-        params = (today,)
+        params = (today, today + timedelta(days=1))
         return query, params
 
     @staticmethod
@@ -37,10 +39,10 @@ class AdminDashboardModel:
         query = """
             SELECT COUNT(*) as transaction_count
             FROM transactions
-            WHERE DATE(transaction_date) = %s
+            WHERE transaction_date >= %s AND transaction_date < %s
               AND status = 'completed'
         """
-        params = (today,)
+        params = (today, today + timedelta(days=1))
         return query, params
 
     @staticmethod
@@ -52,11 +54,13 @@ class AdminDashboardModel:
         query = """
             SELECT COALESCE(SUM(ti.quantity), 0) as products_sold
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
-            WHERE DATE(t.transaction_date) = %s
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND ti.transaction_date >= %s AND ti.transaction_date < %s
               AND t.status = 'completed'
         """
-        params = (today,)
+        params = (today, today + timedelta(days=1)) * 2
         return query, params
 
     @staticmethod
@@ -70,22 +74,62 @@ class AdminDashboardModel:
                 DATE(transaction_date) as sale_date,
                 COALESCE(SUM(final_total), 0) as total_sales
             FROM transactions
-            WHERE DATE(transaction_date) BETWEEN %s AND %s
+            WHERE transaction_date >= %s AND transaction_date < %s
               AND status = 'completed'
             GROUP BY DATE(transaction_date)
             ORDER BY sale_date ASC
         """
-        params = (start_date, end_date)
+        params = (start_date, end_date + timedelta(days=1))
         return query, params
 
     @staticmethod
-    def get_sales_detail_query(today: date):
+    def get_sales_by_bucket_query(start_date: date, end_date: date, bucket: str):
         """
-        Get query for detailed sales today (no IDs exposed)
+        Get query for sales grouped by day, week (Monday start) or month
+        Buckets are computed in SQL so long ranges return few rows
         Returns: (query, params)
         """
-        query = """
-            SELECT 
+        bucket_expressions = {
+            'day': "DATE(transaction_date)",
+            'week': sql().week_start("transaction_date"),
+            'month': sql().month_start("transaction_date"),
+        }
+        if bucket not in bucket_expressions:
+            raise ValueError(f"Unknown bucket: {bucket}")
+
+        query = f"""
+            SELECT
+                {bucket_expressions[bucket]} as bucket_start,
+                COALESCE(SUM(final_total), 0) as total_sales
+            FROM transactions
+            WHERE transaction_date >= %s AND transaction_date < %s
+              AND status = 'completed'
+            GROUP BY bucket_start
+            ORDER BY bucket_start ASC
+        """
+        params = (start_date, end_date + timedelta(days=1))
+        return query, params
+
+    @staticmethod
+    def get_sales_detail_query(today: date, after: tuple = None, limit: int = 50):
+        """
+        Get query for one page of today's sales, newest first (no IDs shown)
+        Keyset paging: after = (transaction_date, transaction_id) of the last
+        row of the previous page; fetches limit + 1 rows so the caller can
+        tell whether another page follows
+        Returns: (query, params)
+        """
+        keyset = ""
+        params = [today, today + timedelta(days=1)]
+        if after is not None:
+            keyset = """
+              AND (t.transaction_date < %s
+                   OR (t.transaction_date = %s AND t.transaction_id < %s))"""
+            params += [after[0], after[0], after[1]]
+
+        query = f"""
+            SELECT
+                t.transaction_id,
                 t.transaction_number,
                 t.transaction_date,
                 u.full_name as cashier_name,
@@ -94,54 +138,125 @@ class AdminDashboardModel:
                 t.final_total
             FROM transactions t
             JOIN users u ON t.cashier_id = u.user_id
-            WHERE DATE(t.transaction_date) = %s
-              AND t.status = 'completed'
-            ORDER BY t.transaction_date DESC
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND t.status = 'completed'{keyset}
+            ORDER BY t.transaction_date DESC, t.transaction_id DESC
+            LIMIT %s
         """
-        params = (today,)
-        return query, params
+        params.append(limit + 1)
+        return query, tuple(params)
 
     @staticmethod
-    def get_transactions_detail_query(today: date):
+    def get_transactions_detail_query(today: date, after: tuple = None, limit: int = 50):
         """
-        Get query for detailed transactions today (no IDs exposed)
+        Get query for one page of today's transactions, newest first (no IDs shown)
+        Same keyset as get_sales_detail_query; items are counted only for
+        the transactions on the page
         Returns: (query, params)
         """
-        query = """
-            SELECT 
+        keyset = ""
+        params = [today, today + timedelta(days=1)]
+        if after is not None:
+            keyset = """
+              AND (t.transaction_date < %s
+                   OR (t.transaction_date = %s AND t.transaction_id < %s))"""
+            params += [after[0], after[0], after[1]]
+
+        query = f"""
+            SELECT
+                t.transaction_id,
                 t.transaction_number,
                 t.transaction_date,
                 u.full_name as cashier_name,
-                COUNT(ti.transaction_item_id) as items_count,
+                (SELECT COUNT(*) FROM transaction_items ti
+                 WHERE ti.transaction_id = t.transaction_id
+                   AND ti.transaction_date = t.transaction_date) as items_count,
                 t.final_total
             FROM transactions t
             JOIN users u ON t.cashier_id = u.user_id
-            LEFT JOIN transaction_items ti ON t.transaction_id = ti.transaction_id
-            WHERE DATE(t.transaction_date) = %s
-              AND t.status = 'completed'
-            GROUP BY t.transaction_id
-            ORDER BY t.transaction_date DESC
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND t.status = 'completed'{keyset}
+            ORDER BY t.transaction_date DESC, t.transaction_id DESC
+            LIMIT %s
+        """
+        params.append(limit + 1)
+        return query, tuple(params)
+
+    @staticmethod
+    def get_products_detail_query(today: date, after: tuple = None, limit: int = 50):
+        """
+        Get query for one page of products sold today, highest revenue first
+        Sums the terminals' product_daily_sales counters; after = (revenue,
+        product_id) of the last row of the previous page; fetches limit + 1 rows
+        Returns: (query, params)
+        """
+        keyset = ""
+        params = [today]
+        if after is not None:
+            keyset = """
+            HAVING SUM(revenue) < %s OR (SUM(revenue) = %s AND product_id > %s)"""
+            params += [after[0], after[0], after[1]]
+
+        query = f"""
+            SELECT
+                product_id,
+                MAX(product_name) as product_name,
+                SUM(quantity) as quantity_sold,
+                SUM(revenue) as revenue
+            FROM product_daily_sales
+            WHERE sale_date = %s
+            GROUP BY product_id{keyset}
+            ORDER BY SUM(revenue) DESC, product_id ASC
+            LIMIT %s
+        """
+        params.append(limit + 1)
+        return query, tuple(params)
+
+    @staticmethod
+    def get_latest_sales_event_id_query():
+        """
+        Get query for the newest sales event ID (live update watermark)
+        Returns: (query, params)
+        """
+        query = """
+            SELECT COALESCE(MAX(event_id), 0) as last_event_id
+            FROM sales_events
         """
-        params = (today,)
+        params = ()
         return query, params
 
     @staticmethod
-    def get_products_detail_query(today: date):
+    def get_sales_event_ids_after_query(after_event_id: int):
         """
-        Get query for products sold today with details (no IDs exposed)
+        Get query for the IDs of sales events after a point (finds IDs not
+        committed yet when the watermark was taken)
         Returns: (query, params)
         """
         query = """
-            SELECT 
-                ti.product_name,
-                SUM(ti.quantity) as quantity_sold,
-                SUM(ti.total_price) as revenue
-            FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
-            WHERE DATE(t.transaction_date) = %s
-              AND t.status = 'completed'
-            GROUP BY ti.product_name
-            ORDER BY revenue DESC
+            SELECT event_id
+            FROM sales_events
+            WHERE event_id > %s
+            ORDER BY event_id ASC
         """
-        params = (today,)
-        return query, params
\ No newline at end of file
+        params = (after_event_id,)
+        return query, params
+
+    @staticmethod
+    def get_sales_events_after_query(last_event_id: int, missing_ids=(), limit: int = 500):
+        """
+        Get query for sales events newer than the watermark, plus older IDs that
+        had not committed yet when the watermark passed them (missing_ids)
+        Returns: (query, params)
+        """
+        missing_ids = tuple(missing_ids)
+        missing = (f" OR event_id IN ({', '.join(['%s'] * len(missing_ids))})"
+                   if missing_ids else "")
+        query = f"""
+            SELECT event_id, event_time, final_total, items_count
+            FROM sales_events
+            WHERE event_id > %s{missing}
+            ORDER BY event_id ASC
+            LIMIT %s
+        """
+        params = (last_event_id,) + missing_ids + (limit,)
+        return query, params
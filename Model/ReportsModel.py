@@ -3,7 +3,9 @@ AdminReportsModel.py
 Model for Admin Reports operations - Returns queries and parameters
 Controller executes the queries
 """
-from datetime import date
+from datetime import date, datetime, timedelta
+
+from Utilities.Dialect import sql
 
 
 class AdminReportsModel:
@@ -17,22 +19,24 @@ class AdminReportsModel:
         """
         Get query for Daily Sales Report
         Shows total sales, transactions, discounts per day
+        Gross sales sum the stored subtotal and tax_amount columns; the date
+        range is a plain range on transaction_date so the index can be used
         Returns: (query, params)
         """
         query = """
             SELECT 
                 DATE(transaction_date) as sale_date,
                 COUNT(*) as transaction_count,
-                SUM(subtotal + (subtotal * 0.12)) as gross_sales,
+                SUM(subtotal) + SUM(tax_amount) as gross_sales,
                 COALESCE(SUM(discount_amount), 0) as total_discounts,
                 SUM(final_total) as net_sales
             FROM transactions
-            WHERE DATE(transaction_date) BETWEEN %s AND %s
+            WHERE transaction_date >= %s AND transaction_date < %s
               AND status = 'completed'
             GROUP BY DATE(transaction_date)
             ORDER BY sale_date DESC
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1))
         return query, params
 
     @staticmethod
@@ -52,12 +56,12 @@ class AdminReportsModel:
                 COALESCE(SUM(t.discount_amount), 0) as total_discounts
             FROM transactions t
             JOIN users u ON t.cashier_id = u.user_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
               AND t.status = 'completed'
             GROUP BY DATE(t.transaction_date), t.cashier_id, u.full_name, u.shift
             ORDER BY shift_date DESC, cashier_name
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1))
         return query, params
 
     @staticmethod
@@ -75,12 +79,12 @@ class AdminReportsModel:
                 AVG(t.final_total) as avg_transaction
             FROM transactions t
             JOIN users u ON t.cashier_id = u.user_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
               AND t.status = 'completed'
             GROUP BY t.cashier_id, u.full_name
             ORDER BY total_sales DESC
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1))
         return query, params
 
     @staticmethod
@@ -98,15 +102,17 @@ class AdminReportsModel:
                 SUM(ti.total_price) as revenue,
                 AVG(ti.unit_price) as avg_price
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
             JOIN products p ON ti.product_id = p.product_id
             JOIN categories c ON p.category_id = c.category_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND ti.transaction_date >= %s AND ti.transaction_date < %s
               AND t.status = 'completed'
             GROUP BY ti.product_id, ti.product_name, c.category_name
             ORDER BY revenue DESC
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1)) * 2
         return query, params
 
     @staticmethod
@@ -124,36 +130,57 @@ class AdminReportsModel:
                 COALESCE(AVG(t.discount_amount), 0) as avg_discount
             FROM transactions t
             LEFT JOIN discount_types dt ON t.discount_type_id = dt.discount_type_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
               AND t.status = 'completed'
             GROUP BY t.discount_type_id, dt.type_name
             ORDER BY total_discount_amount DESC
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1))
         return query, params
 
     @staticmethod
     def get_top_selling_products_query(from_date: date, to_date: date, limit: int = 10):
         """
         Get query for top selling products
+        Reads the product_daily_sales counters (one row per product per day
+        per terminal)
+        instead of aggregating every transaction item in the range
         Returns: (query, params)
         """
         query = """
-            SELECT 
-                ti.product_name,
-                SUM(ti.quantity) as total_quantity,
-                SUM(ti.total_price) as total_revenue
-            FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
-              AND t.status = 'completed'
-            GROUP BY ti.product_id, ti.product_name
+            SELECT
+                MAX(product_name) as product_name,
+                SUM(quantity) as total_quantity,
+                SUM(revenue) as total_revenue
+            FROM product_daily_sales
+            WHERE sale_date BETWEEN %s AND %s
+            GROUP BY product_id
             ORDER BY total_revenue DESC
             LIMIT %s
         """
         params = (from_date, to_date, limit)
         return query, params
 
+    @staticmethod
+    def get_product_daily_sales_query(from_date: date, to_date: date):
+        """
+        Get query for per-product totals over a range from the daily counters
+        (unsorted; AnalyticsService merges slices and picks the top N)
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                product_id,
+                MAX(product_name) as product_name,
+                SUM(quantity) as total_quantity,
+                SUM(revenue) as total_revenue
+            FROM product_daily_sales
+            WHERE sale_date BETWEEN %s AND %s
+            GROUP BY product_id
+        """
+        params = (from_date, to_date)
+        return query, params
+
     @staticmethod
     def get_category_performance_query(from_date: date, to_date: date):
         """
@@ -167,15 +194,45 @@ class AdminReportsModel:
                 SUM(ti.quantity) as items_sold,
                 SUM(ti.total_price) as revenue
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
             JOIN products p ON ti.product_id = p.product_id
             JOIN categories c ON p.category_id = c.category_id
-            WHERE DATE(t.transaction_date) BETWEEN %s AND %s
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND ti.transaction_date >= %s AND ti.transaction_date < %s
               AND t.status = 'completed'
             GROUP BY c.category_id, c.category_name
             ORDER BY revenue DESC
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1)) * 2
+        return query, params
+
+    @staticmethod
+    def get_product_sales_breakdown_query(from_date: date, to_date: date):
+        """
+        Get query for per-product sales with category
+        Finest grain of the product/category aggregates so date slices can be merged
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                ti.product_id,
+                ti.product_name,
+                c.category_id,
+                c.category_name,
+                SUM(ti.quantity) as total_quantity,
+                SUM(ti.total_price) as total_revenue
+            FROM transaction_items ti
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
+            JOIN products p ON ti.product_id = p.product_id
+            JOIN categories c ON p.category_id = c.category_id
+            WHERE t.transaction_date >= %s AND t.transaction_date < %s
+              AND ti.transaction_date >= %s AND ti.transaction_date < %s
+              AND t.status = 'completed'
+            GROUP BY ti.product_id, ti.product_name, c.category_id, c.category_name
+        """
+        params = (from_date, to_date + timedelta(days=1)) * 2
         return query, params
 
     @staticmethod
@@ -184,35 +241,146 @@ class AdminReportsModel:
         Get query for hourly sales distribution
         Returns: (query, params)
         """
-        query = """
+        query = f"""
             SELECT 
-                HOUR(transaction_date) as hour,
+                {sql().hour('transaction_date')} as hour,
                 COUNT(*) as transaction_count,
                 SUM(final_total) as total_sales
             FROM transactions
-            WHERE DATE(transaction_date) BETWEEN %s AND %s
+            WHERE transaction_date >= %s AND transaction_date < %s
               AND status = 'completed'
-            GROUP BY HOUR(transaction_date)
+            GROUP BY {sql().hour('transaction_date')}
             ORDER BY hour
         """
-        params = (from_date, to_date)
+        params = (from_date, to_date + timedelta(days=1))
         return query, params
 
     @staticmethod
     def get_payment_method_breakdown_query(from_date: date, to_date: date):
         """
-        Get query for payment method breakdown
-        Note: Placeholder since payment methods aren't stored separately yet
+        Get query for payment method breakdown (one row per method)
+        Split payments count once for each method they used
         Returns: (query, params)
         """
         query = """
-            SELECT 
-                'Cash' as payment_method,
+            SELECT
+                p.payment_method,
                 COUNT(*) as transaction_count,
-                SUM(final_total) as total_amount
+                SUM(p.amount) as total_amount
+            FROM payments p
+            JOIN transactions t ON t.transaction_id = p.transaction_id
+                              AND t.transaction_date = p.payment_date
+            WHERE p.payment_date >= %s AND p.payment_date < %s
+              AND t.status = 'completed'
+            GROUP BY p.payment_method
+            ORDER BY total_amount DESC
+        """
+        params = (from_date, to_date + timedelta(days=1))
+        return query, params
+    # =====================================================
+    # PERIOD-OVER-PERIOD COMPARISON QUERIES
+    # Both periods are fetched in one grouped scan; each aggregate is split
+    # into current_* / previous_* columns with CASE expressions.
+    # Period bounds are datetimes: [start, end) so the range predicates can
+    # use the transaction_date index.
+    # =====================================================
+
+    @staticmethod
+    def get_daily_sales_comparison_query(current_start: datetime, current_end: datetime,
+                                         previous_start: datetime, previous_end: datetime):
+        """
+        Get query comparing daily sales of two periods
+        Days are paired by their offset from the start of each period
+        Returns: (query, params)
+        """
+        query = f"""
+            SELECT
+                CASE WHEN transaction_date >= %s AND transaction_date < %s
+                     THEN {sql().days_between('transaction_date', '%s')}
+                     ELSE {sql().days_between('transaction_date', '%s')} END as day_offset,
+                SUM(CASE WHEN transaction_date >= %s AND transaction_date < %s
+                         THEN 1 ELSE 0 END) as current_transactions,
+                SUM(CASE WHEN transaction_date >= %s AND transaction_date < %s
+                         THEN 0 ELSE 1 END) as previous_transactions,
+                SUM(CASE WHEN transaction_date >= %s AND transaction_date < %s
+                         THEN final_total ELSE 0 END) as current_sales,
+                SUM(CASE WHEN transaction_date >= %s AND transaction_date < %s
+                         THEN 0 ELSE final_total END) as previous_sales
             FROM transactions
-            WHERE DATE(transaction_date) BETWEEN %s AND %s
+            WHERE ((transaction_date >= %s AND transaction_date < %s)
+                   OR (transaction_date >= %s AND transaction_date < %s))
               AND status = 'completed'
+            GROUP BY day_offset
+            ORDER BY day_offset
         """
-        params = (from_date, to_date)
-        return query, params
\ No newline at end of file
+        current = (current_start, current_end)
+        params = (current + (current_start, previous_start) + current * 4 +
+                  current + (previous_start, previous_end))
+        return query, params
+
+    @staticmethod
+    def get_product_sales_comparison_query(current_start: datetime, current_end: datetime,
+                                           previous_start: datetime, previous_end: datetime):
+        """
+        Get query comparing product sales of two periods
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                ti.product_name,
+                c.category_name,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN ti.quantity ELSE 0 END) as current_quantity,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN 0 ELSE ti.quantity END) as previous_quantity,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN ti.total_price ELSE 0 END) as current_revenue,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN 0 ELSE ti.total_price END) as previous_revenue
+            FROM transaction_items ti
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
+            JOIN products p ON ti.product_id = p.product_id
+            JOIN categories c ON p.category_id = c.category_id
+            WHERE ((t.transaction_date >= %s AND t.transaction_date < %s)
+                   OR (t.transaction_date >= %s AND t.transaction_date < %s))
+              AND ((ti.transaction_date >= %s AND ti.transaction_date < %s)
+                   OR (ti.transaction_date >= %s AND ti.transaction_date < %s))
+              AND t.status = 'completed'
+            GROUP BY ti.product_id, ti.product_name, c.category_name
+            ORDER BY current_revenue DESC
+        """
+        current = (current_start, current_end)
+        params = (current * 5 + (previous_start, previous_end)
+                  + current + (previous_start, previous_end))
+        return query, params
+
+    @staticmethod
+    def get_cashier_performance_comparison_query(current_start: datetime, current_end: datetime,
+                                                 previous_start: datetime, previous_end: datetime):
+        """
+        Get query comparing cashier performance of two periods
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                u.full_name as cashier_name,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN 1 ELSE 0 END) as current_transactions,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN 0 ELSE 1 END) as previous_transactions,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN t.final_total ELSE 0 END) as current_sales,
+                SUM(CASE WHEN t.transaction_date >= %s AND t.transaction_date < %s
+                         THEN 0 ELSE t.final_total END) as previous_sales
+            FROM transactions t
+            JOIN users u ON t.cashier_id = u.user_id
+            WHERE ((t.transaction_date >= %s AND t.transaction_date < %s)
+                   OR (t.transaction_date >= %s AND t.transaction_date < %s))
+              AND t.status = 'completed'
+            GROUP BY t.cashier_id, u.full_name
+            ORDER BY current_sales DESC
+        """
+        current = (current_start, current_end)
+        params = current * 5 + (previous_start, previous_end)
+        return query, params
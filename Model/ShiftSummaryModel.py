@@ -6,6 +6,8 @@ This ensures all cashiers see their transactions from today regardless of their
 """
 from datetime import datetime
 
+from Utilities.Dialect import sql
+
 
 class ShiftSummaryModel:
     """
@@ -44,12 +46,14 @@ class ShiftSummaryModel:
         query = """
             SELECT COALESCE(SUM(ti.quantity), 0) as items_sold
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
             WHERE t.cashier_id = %s
               AND t.status = 'completed'
               AND t.transaction_date >= %s
+              AND ti.transaction_date >= %s
         """
-        params = (cashier_id, today_start)
+        params = (cashier_id, today_start, today_start)
         return query, params
 
     @staticmethod
@@ -77,23 +81,21 @@ class ShiftSummaryModel:
         Returns: (query, params)
 
         FIXED: Uses today_start (midnight) instead of shift_start
-        Note: Since we don't have a separate payments table yet,
-        we'll return a placeholder query. Update when payments table is added.
+        Count is per tender, so a split payment counts once for each method
         """
         query = """
-            SELECT 
-                'Cash' as payment_method,
+            SELECT
+                p.payment_method,
                 COUNT(*) as count,
-                SUM(final_total) as total
-            FROM transactions
-            WHERE cashier_id = %s
-              AND status = 'completed'
-              AND transaction_date >= %s
-            UNION ALL
-            SELECT 
-                'GCash' as payment_method,
-                0 as count,
-                0 as total
+                SUM(p.amount) as total
+            FROM payments p
+            JOIN transactions t ON t.transaction_id = p.transaction_id
+                              AND t.transaction_date = p.payment_date
+            WHERE t.cashier_id = %s
+              AND t.status = 'completed'
+              AND p.payment_date >= %s
+            GROUP BY p.payment_method
+            ORDER BY total DESC
         """
         params = (cashier_id, today_start)
         return query, params
@@ -111,15 +113,17 @@ class ShiftSummaryModel:
                 ti.product_name,
                 SUM(ti.quantity) as total_qty
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
             WHERE t.cashier_id = %s
               AND t.status = 'completed'
               AND t.transaction_date >= %s
+              AND ti.transaction_date >= %s
             GROUP BY ti.product_id, ti.product_name
             ORDER BY total_qty DESC
             LIMIT 5
         """
-        params = (cashier_id, today_start)
+        params = (cashier_id, today_start, today_start)
         return query, params
 
     @staticmethod
@@ -138,7 +142,8 @@ class ShiftSummaryModel:
                 t.final_total,
                 dt.type_name as discount_type
             FROM transactions t
-            LEFT JOIN transaction_items ti ON t.transaction_id = ti.transaction_id
+            LEFT JOIN transaction_items ti ON ti.transaction_id = t.transaction_id
+                                        AND ti.transaction_date = t.transaction_date
             LEFT JOIN discount_types dt ON t.discount_type_id = dt.discount_type_id
             WHERE t.cashier_id = %s
               AND t.status = 'completed'
@@ -157,17 +162,67 @@ class ShiftSummaryModel:
 
         FIXED: Uses today_start (midnight) instead of shift_start
         """
-        query = """
+        query = f"""
             SELECT 
-                HOUR(transaction_date) as hour,
+                {sql().hour('transaction_date')} as hour,
                 COUNT(*) as transaction_count,
                 SUM(final_total) as total_sales
             FROM transactions
             WHERE cashier_id = %s
               AND status = 'completed'
               AND transaction_date >= %s
-            GROUP BY HOUR(transaction_date)
+            GROUP BY {sql().hour('transaction_date')}
             ORDER BY hour
         """
         params = (cashier_id, today_start)
-        return query, params
\ No newline at end of file
+        return query, params
+
+    @staticmethod
+    def get_shift_sales_lines_query(cashier_id: int, today_start: datetime):
+        """
+        Get query for every item line of today's transactions (shift reconcile)
+        One scan replaces the separate KPI/top product/transaction queries
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                t.transaction_id,
+                t.transaction_number,
+                t.transaction_date,
+                t.final_total,
+                dt.type_name as discount_type,
+                ti.product_name,
+                ti.quantity
+            FROM transactions t
+            LEFT JOIN transaction_items ti ON ti.transaction_id = t.transaction_id
+                                        AND ti.transaction_date = t.transaction_date
+            LEFT JOIN discount_types dt ON t.discount_type_id = dt.discount_type_id
+            WHERE t.cashier_id = %s
+              AND t.status = 'completed'
+              AND t.transaction_date >= %s
+            ORDER BY t.transaction_date ASC, t.transaction_id ASC
+        """
+        params = (cashier_id, today_start)
+        return query, params
+
+    @staticmethod
+    def get_shift_payments_query(cashier_id: int, today_start: datetime):
+        """
+        Get query for every tender of today's transactions (shift reconcile)
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                p.transaction_id,
+                p.payment_method,
+                p.amount
+            FROM payments p
+            JOIN transactions t ON t.transaction_id = p.transaction_id
+                              AND t.transaction_date = p.payment_date
+            WHERE t.cashier_id = %s
+              AND t.status = 'completed'
+              AND p.payment_date >= %s
+            ORDER BY p.payment_id ASC
+        """
+        params = (cashier_id, today_start)
+        return query, params
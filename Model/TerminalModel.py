@@ -0,0 +1,110 @@
+"""
+TerminalModel.py
+Model for the terminal registry - Returns queries and parameters
+Utilities/Terminals.py executes the queries
+"""
+from Utilities.Dialect import sql
+
+
+class TerminalModel:
+    """
+    Terminal model - Provides SQL queries and parameters
+    Every terminal only ever writes its own row
+    """
+
+    @staticmethod
+    def register_terminal_query(terminal_code: str, hostname: str, process_id: int):
+        """
+        Get query to register a terminal (or note where an existing one now runs)
+        Returns: (query, params)
+        """
+        query = f"""
+            INSERT INTO terminals
+            (terminal_code, hostname, process_id, registered_at, last_heartbeat)
+            VALUES (%s, %s, %s, {sql().now()}, {sql().now()})
+        """ + sql().upsert(("terminal_code",),
+                           replace_columns=("hostname", "process_id", "last_heartbeat"))
+        params = (terminal_code, hostname, process_id)
+        return query, params
+
+    @staticmethod
+    def get_terminal_query(terminal_code: str):
+        """
+        Get query for a terminal's ID and configuration
+        Returns: (query, params)
+        """
+        query = """
+            SELECT terminal_id, terminal_code, display_name, number_prefix, is_active
+            FROM terminals
+            WHERE terminal_code = %s
+        """
+        params = (terminal_code,)
+        return query, params
+
+    @staticmethod
+    def get_terminal_active_query(terminal_id: int):
+        """
+        Get query for whether a terminal may sell (read inside the checkout transaction)
+        Returns: (query, params)
+        """
+        query = """
+            SELECT is_active
+            FROM terminals
+            WHERE terminal_id = %s
+        """
+        params = (terminal_id,)
+        return query, params
+
+    @staticmethod
+    def heartbeat_query(terminal_id: int, user_id: int = None):
+        """
+        Get query to record that a terminal is alive (and who is signed in)
+        Returns: (query, params)
+        """
+        query = f"""
+            UPDATE terminals
+            SET last_heartbeat = {sql().now()}, current_user_id = %s
+            WHERE terminal_id = %s
+        """
+        params = (user_id, terminal_id)
+        return query, params
+
+    @staticmethod
+    def get_terminals_query():
+        """
+        Get query for every registered terminal with its signed-in user
+        Returns: (query, params)
+        """
+        query = """
+            SELECT
+                t.terminal_id,
+                t.terminal_code,
+                t.display_name,
+                t.number_prefix,
+                t.is_active,
+                t.hostname,
+                t.last_heartbeat,
+                u.full_name as current_user_name
+            FROM terminals t
+            LEFT JOIN users u ON u.user_id = t.current_user_id
+            ORDER BY t.terminal_code
+        """
+        params = ()
+        return query, params
+
+    @staticmethod
+    def update_terminal_query(terminal_code: str, display_name: str = None,
+                              number_prefix: str = None, is_active: bool = None):
+        """
+        Get query to change a terminal's configuration (None leaves a value as is)
+        Returns: (query, params)
+        """
+        query = """
+            UPDATE terminals
+            SET display_name = COALESCE(%s, display_name),
+                number_prefix = COALESCE(%s, number_prefix),
+                is_active = COALESCE(%s, is_active)
+            WHERE terminal_code = %s
+        """
+        params = (display_name, number_prefix, is_active, terminal_code)
+        return query, params
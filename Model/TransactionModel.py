@@ -3,6 +3,9 @@ TransactionModel.py
 Model for Transaction operations - Returns queries and parameters
 Controller executes the queries
 """
+from datetime import datetime
+
+from Utilities.Dialect import sql
 
 class TransactionModel:
     """
@@ -57,38 +60,102 @@ class TransactionModel:
 
     @staticmethod
     def create_transaction_query(transaction_number: str, cashier_id: int,
-                                 subtotal: float, discount_amount: float,
-                                 final_total: float, discount_type_id: int = None):
+                                 subtotal: float, tax_amount: float, discount_amount: float,
+                                 final_total: float, discount_type_id: int = None,
+                                 transaction_date: datetime = None, terminal_id: int = None):
         """
         Get query to create new transaction
+        transaction_date (whole seconds) is also written on the sale's items,
+        payments and counters; NOW() when not given
+        terminal_id is the selling terminal (Utilities/Terminals.py)
         Returns: (query, params)
         """
-        query = """
+        sold_at = "%s" if transaction_date is not None else sql().now()
+        query = f"""
             INSERT INTO transactions 
-            (transaction_number, cashier_id, transaction_date, subtotal, 
+            (transaction_number, cashier_id, terminal_id, transaction_date, subtotal, tax_amount,
              discount_amount, final_total, discount_type_id, status)
-            VALUES (%s, %s, NOW(), %s, %s, %s, %s, 'completed')
+            VALUES (%s, %s, %s, {sold_at}, %s, %s, %s, %s, %s, 'completed')
         """
-        params = (transaction_number, cashier_id, subtotal, discount_amount,
-                  final_total, discount_type_id)
+        params = (transaction_number, cashier_id, terminal_id)
+        if transaction_date is not None:
+            params += (transaction_date,)
+        params += (subtotal, tax_amount, discount_amount, final_total, discount_type_id)
         return query, params
 
     @staticmethod
     def add_transaction_item_query(transaction_id: int, product_id: int,
                                    product_name: str, quantity: int,
-                                   unit_price: float, total_price: float):
+                                   unit_price: float, total_price: float,
+                                   transaction_date: datetime):
         """
         Get query to add transaction item
+        transaction_date is the transaction's own (items are partitioned by it)
         Returns: (query, params)
         """
         query = """
             INSERT INTO transaction_items
             (transaction_id, product_id, product_name, quantity, 
-             unit_price, total_price)
-            VALUES (%s, %s, %s, %s, %s, %s)
+             unit_price, total_price, transaction_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
         """
         params = (transaction_id, product_id, product_name, quantity,
-                  unit_price, total_price)
+                  unit_price, total_price, transaction_date)
+        return query, params
+
+    @staticmethod
+    def add_payment_query(transaction_id: int, payment_method: str, amount: float,
+                          tendered: float, change_amount: float, transaction_date: datetime):
+        """
+        Get query to record one tender of a transaction
+        payment_date is the transaction's own transaction_date so both agree
+        exactly (reports join on the pair)
+        Returns: (query, params)
+        """
+        query = """
+            INSERT INTO payments
+            (transaction_id, payment_method, amount, tendered, change_amount, payment_date)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        params = (transaction_id, payment_method, amount, tendered, change_amount,
+                  transaction_date)
+        return query, params
+
+    @staticmethod
+    def add_product_daily_sales_query(product_id: int, product_name: str,
+                                      quantity: int, revenue: float, transaction_date: datetime,
+                                      terminal_id: int = None):
+        """
+        Get query to add one cart line to the per-day product sales counters
+        (creates the day's row for the product or adds to it)
+        Each terminal adds to its own row (0 = no terminal), so lanes selling
+        the same product never wait on one another's row lock; readers sum
+        the terminals' rows
+        Returns: (query, params)
+        """
+        query = """
+            INSERT INTO product_daily_sales
+            (sale_date, product_id, terminal_id, product_name, quantity, revenue)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """ + sql().upsert(("sale_date", "product_id", "terminal_id"),
+                           add_columns=("quantity", "revenue"), replace_columns=("product_name",))
+        params = (transaction_date.date(), product_id, terminal_id or 0, product_name, quantity,
+                  revenue)
+        return query, params
+
+    @staticmethod
+    def add_sales_event_query(transaction_id: int, cashier_id: int,
+                              final_total: float, items_count: float):
+        """
+        Get query to append a completed sale to the sales_events outbox
+        Returns: (query, params)
+        """
+        query = f"""
+            INSERT INTO sales_events
+            (transaction_id, cashier_id, event_time, final_total, items_count)
+            VALUES (%s, %s, {sql().now()}, %s, %s)
+        """
+        params = (transaction_id, cashier_id, final_total, items_count)
         return query, params
 
     @staticmethod
@@ -97,12 +164,12 @@ class TransactionModel:
         Get query for today's total sales
         Returns: (query, params)
         """
-        query = """
+        query = f"""
             SELECT COALESCE(SUM(final_total), 0) as total_sales
             FROM transactions
             WHERE cashier_id = %s
               AND status = 'completed'
-              AND DATE(transaction_date) = CURDATE()
+              AND transaction_date >= {sql().today()}
         """
         params = (cashier_id,)
         return query, params
@@ -113,13 +180,15 @@ class TransactionModel:
         Get query for today's items sold
         Returns: (query, params)
         """
-        query = """
+        query = f"""
             SELECT COALESCE(SUM(ti.quantity), 0) as items_sold
             FROM transaction_items ti
-            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            JOIN transactions t ON t.transaction_id = ti.transaction_id
+                              AND t.transaction_date = ti.transaction_date
             WHERE t.cashier_id = %s
               AND t.status = 'completed'
-              AND DATE(t.transaction_date) = CURDATE()
+              AND t.transaction_date >= {sql().today()}
+              AND ti.transaction_date >= {sql().today()}
         """
         params = (cashier_id,)
         return query, params
@@ -130,7 +199,7 @@ class TransactionModel:
         Get query for today's transactions list
         Returns: (query, params)
         """
-        query = """
+        query = f"""
             SELECT 
                 t.transaction_number,
                 t.transaction_date,
@@ -138,11 +207,12 @@ class TransactionModel:
                 t.final_total,
                 u.full_name as cashier_name
             FROM transactions t
-            LEFT JOIN transaction_items ti ON t.transaction_id = ti.transaction_id
+            LEFT JOIN transaction_items ti ON ti.transaction_id = t.transaction_id
+                                        AND ti.transaction_date = t.transaction_date
             JOIN users u ON t.cashier_id = u.user_id
             WHERE t.cashier_id = %s
               AND t.status = 'completed'
-              AND DATE(t.transaction_date) = CURDATE()
+              AND t.transaction_date >= {sql().today()}
             GROUP BY t.transaction_id
             ORDER BY t.transaction_date DESC
         """
@@ -0,0 +1,340 @@
+"""
+AnalyticsService.py
+Cached, typed access to the sales aggregates used by the dashboard and reports
+
+Date ranges are split into two slices:
+    history  - days before today; closed, so cached for a long time
+    open day - today; still receiving sales, so cached briefly and recomputed
+A range that reaches today only re-queries today's slice and merges it with
+the cached history instead of rescanning the whole range.
+"""
+import datetime
+import heapq
+from dataclasses import dataclass, asdict
+from datetime import date
+
+from Utilities.Cache import TTLCache
+from Utilities.DatabaseConnection import fetchAll, getConnection
+from Utilities.Resilience import DatabaseUnavailable, retry_read
+from Utilities.Settings import ANALYTICS_HISTORY_TTL, ANALYTICS_OPEN_DAY_TTL
+from Utilities.Settings import DETAIL_PAGE_SIZE as _DETAIL_PAGE_SIZE
+from Utilities.Settings import LIVE_GAP_WINDOW
+from Utilities.ReportRunner import REPORT_QUERIES, fetch_report_rows, fetch_comparison_rows
+from Model.ReportsModel import AdminReportsModel
+from Model.AdminDashboardModel import AdminDashboardModel
+
+
+# Seconds to keep results for closed days / the open day (0 with the cache off)
+HISTORY_TTL = ANALYTICS_HISTORY_TTL
+OPEN_DAY_TTL = ANALYTICS_OPEN_DAY_TTL
+
+# Rows per page in the KPI detail dialogs
+DETAIL_PAGE_SIZE = _DETAIL_PAGE_SIZE
+
+# KPI detail kind -> (paged AdminDashboardModel query builder name, keyset of a row);
+# the builder is looked up by name per call, like ReportRunner.REPORT_QUERIES
+KPI_DETAIL_QUERIES = {
+    "sales": ("get_sales_detail_query",
+              lambda row: (row['transaction_date'], row['transaction_id'])),
+    "transactions": ("get_transactions_detail_query",
+                     lambda row: (row['transaction_date'], row['transaction_id'])),
+    "products": ("get_products_detail_query",
+                 lambda row: (row['revenue'], row['product_id'])),
+}
+
+
+@dataclass
+class HourlySales:
+    hour: int
+    transaction_count: int
+    total_sales: float
+
+
+@dataclass
+class CategoryPerformance:
+    category_name: str
+    product_count: int
+    items_sold: float
+    revenue: float
+
+
+@dataclass
+class TopProduct:
+    product_name: str
+    total_quantity: float
+    total_revenue: float
+
+
+@dataclass
+class DailySales:
+    sale_date: date
+    total_sales: float
+
+
+@dataclass
+class SalesBucket:
+    bucket_start: date
+    total_sales: float
+
+
+@dataclass
+class DetailPage:
+    rows: list
+    next_after: tuple = None  # keyset of the next page; None on the last page
+
+
+@dataclass
+class DashboardKPIs:
+    total_sales: float
+    transactions: int
+    products: int
+    avg_sale: float
+    last_event_id: int = 0  # sales_events watermark the figures include
+    # IDs at or below the watermark that were not committed in the snapshot (a
+    # lane mid-checkout); live updates keep re-reading them
+    missing_event_ids: tuple = ()
+
+
+class AnalyticsService:
+    """
+    Typed, cached analytics over AdminReportsModel / AdminDashboardModel queries
+    Use get_analytics_service() so every window shares one cache
+    """
+
+    def __init__(self, cache: TTLCache = None):
+        # While the database is unreachable, expired results are shown rather than nothing
+        self.cache = cache or TTLCache(serve_stale_on=(DatabaseUnavailable,))
+
+    # ============================================================
+    # QUERY EXECUTION
+    # ============================================================
+
+    @staticmethod
+    def _fetch(query_builder, *args, conn=None) -> list:
+        """Execute a model query and return all rows as dicts"""
+        query, params = query_builder(*args)
+        return fetchAll(query, params, conn)
+
+    @staticmethod
+    def _slices(from_date: date, to_date: date):
+        """
+        Split a range into closed history and the open day
+        Returns: list of (from_date, to_date, ttl)
+        """
+        today = datetime.date.today()
+        slices = []
+        if from_date < today:
+            slices.append((from_date, min(to_date, today - datetime.timedelta(days=1)), HISTORY_TTL))
+        if from_date <= today <= to_date:
+            slices.append((today, today, OPEN_DAY_TTL))
+        return slices
+
+    def _cached(self, name: str, query_builder, from_date: date, to_date: date, ttl: float,
+                *extra) -> list:
+        key = (name, from_date, to_date) + extra
+        return self.cache.get_or_load(
+            key, lambda: self._fetch(query_builder, from_date, to_date, *extra), ttl)
+
+    def _sliced(self, name: str, query_builder, from_date: date, to_date: date) -> list:
+        """Rows for every slice of the range, each slice cached on its own"""
+        rows = []
+        for slice_from, slice_to, ttl in self._slices(from_date, to_date):
+            rows.extend(self._cached(name, query_builder, slice_from, slice_to, ttl))
+        return rows
+
+    def _range_ttl(self, to_date: date) -> float:
+        return OPEN_DAY_TTL if to_date >= datetime.date.today() else HISTORY_TTL
+
+    def _product_breakdown(self, from_date: date, to_date: date) -> dict:
+        """Per-product totals merged across slices: {product_id: row}"""
+        merged = {}
+        for row in self._sliced("product_breakdown",
+                                AdminReportsModel.get_product_sales_breakdown_query,
+                                from_date, to_date):
+            current = merged.get(row['product_id'])
+            if current is None:
+                merged[row['product_id']] = dict(row)
+            else:
+                current['total_quantity'] += row['total_quantity']
+                current['total_revenue'] += row['total_revenue']
+        return merged
+
+    # ============================================================
+    # AGGREGATES
+    # ============================================================
+
+    def hourly_sales(self, from_date: date, to_date: date) -> list:
+        """Transactions and sales per hour of day over the range"""
+        by_hour = {}
+        for row in self._sliced("hourly", AdminReportsModel.get_hourly_sales_distribution_query,
+                                from_date, to_date):
+            hour = int(row['hour'])
+            current = by_hour.setdefault(hour, HourlySales(hour, 0, 0.0))
+            current.transaction_count += int(row['transaction_count'])
+            current.total_sales += float(row['total_sales'] or 0)
+        return [by_hour[hour] for hour in sorted(by_hour)]
+
+    def category_performance(self, from_date: date, to_date: date) -> list:
+        """Products, items and revenue per category, highest revenue first"""
+        if len(self._slices(from_date, to_date)) == 1:
+            rows = self._cached("category", AdminReportsModel.get_category_performance_query,
+                                from_date, to_date, self._range_ttl(to_date))
+            return [CategoryPerformance(row['category_name'], int(row['product_count']),
+                                        float(row['items_sold'] or 0), float(row['revenue'] or 0))
+                    for row in rows]
+
+        by_category = {}
+        for row in self._product_breakdown(from_date, to_date).values():
+            current = by_category.setdefault(
+                row['category_id'], CategoryPerformance(row['category_name'], 0, 0.0, 0.0))
+            current.product_count += 1
+            current.items_sold += float(row['total_quantity'] or 0)
+            current.revenue += float(row['total_revenue'] or 0)
+        return sorted(by_category.values(), key=lambda c: c.revenue, reverse=True)
+
+    def product_counters(self, from_date: date, to_date: date) -> dict:
+        """
+        Per-product totals from the product_daily_sales counters, merged
+        across slices: {product_id: TopProduct}
+        """
+        merged = {}
+        for row in self._sliced("product_counters", AdminReportsModel.get_product_daily_sales_query,
+                                from_date, to_date):
+            current = merged.get(row['product_id'])
+            if current is None:
+                merged[row['product_id']] = TopProduct(row['product_name'],
+                                                       float(row['total_quantity'] or 0),
+                                                       float(row['total_revenue'] or 0))
+            else:
+                current.total_quantity += float(row['total_quantity'] or 0)
+                current.total_revenue += float(row['total_revenue'] or 0)
+        return merged
+
+    def top_products(self, from_date: date, to_date: date, limit: int = 10,
+                     by: str = "total_revenue") -> list:
+        """Best selling products by revenue (or by="total_quantity")"""
+        return heapq.nlargest(limit, self.product_counters(from_date, to_date).values(),
+                              key=lambda product: getattr(product, by))
+
+    def daily_sales(self, from_date: date, to_date: date) -> list:
+        """Net sales per day over the range (days without sales are omitted)"""
+        rows = self._sliced("daily_sales", AdminDashboardModel.get_sales_by_date_query,
+                            from_date, to_date)
+        return [DailySales(row['sale_date'], float(row['total_sales'] or 0)) for row in rows]
+
+    def sales_by_bucket(self, from_date: date, to_date: date, bucket: str) -> list:
+        """
+        Net sales per day/week/month bucket (buckets without sales are omitted)
+        A bucket that spans history and today is merged from both slices
+        """
+        by_bucket = {}
+        for slice_from, slice_to, ttl in self._slices(from_date, to_date):
+            for row in self._cached("sales_by_bucket", AdminDashboardModel.get_sales_by_bucket_query,
+                                    slice_from, slice_to, ttl, bucket):
+                start = row['bucket_start']
+                by_bucket[start] = by_bucket.get(start, 0.0) + float(row['total_sales'] or 0)
+        return [SalesBucket(start, by_bucket[start]) for start in sorted(by_bucket)]
+
+    def today_kpis(self) -> DashboardKPIs:
+        """Dashboard KPI figures for today (open day, short TTL)"""
+        today = datetime.date.today()
+
+        def load():
+            # One consistent snapshot so the figures match the event watermark
+            # exactly; live updates then apply only events after it
+            conn = getConnection()
+            try:
+                conn.start_transaction(consistent_snapshot=True, readonly=True)
+                last_event_id = int(self._fetch(AdminDashboardModel.get_latest_sales_event_id_query,
+                                                conn=conn)[0]['last_event_id'])
+                # Lanes commit out of ID order: look back a window for IDs not visible yet
+                window_start = max(0, last_event_id - LIVE_GAP_WINDOW)
+                committed = {int(row['event_id']) for row in self._fetch(
+                    AdminDashboardModel.get_sales_event_ids_after_query, window_start, conn=conn)}
+                missing_event_ids = tuple(event_id for event_id in range(window_start + 1, last_event_id)
+                                          if event_id not in committed)
+                total_sales = float(self._fetch(AdminDashboardModel.get_total_sales_today_query,
+                                                today, conn=conn)[0]['total_sales'] or 0)
+                transactions = int(self._fetch(AdminDashboardModel.get_transactions_today_query,
+                                               today, conn=conn)[0]['transaction_count'] or 0)
+                products = int(self._fetch(AdminDashboardModel.get_products_sold_today_query,
+                                           today, conn=conn)[0]['products_sold'] or 0)
+                conn.commit()
+            finally:
+                conn.close()
+            avg_sale = total_sales / transactions if transactions > 0 else 0
+            return DashboardKPIs(total_sales, transactions, products, avg_sale, last_event_id,
+                                 missing_event_ids)
+
+        return self.cache.get_or_load(("kpis", today), lambda: retry_read(load), OPEN_DAY_TTL)
+
+    def kpi_detail_page(self, kind: str, day: date, after: tuple = None,
+                        limit: int = DETAIL_PAGE_SIZE) -> DetailPage:
+        """
+        One keyset page of a KPI card's detail rows ("sales", "transactions",
+        "products"); cached like the KPI figures and dropped with them
+        """
+        builder_name, keyset = KPI_DETAIL_QUERIES[kind]
+        query_builder = getattr(AdminDashboardModel, builder_name)
+
+        def load():
+            rows = self._fetch(query_builder, day, after, limit)
+            if len(rows) > limit:
+                rows = rows[:limit]
+                return DetailPage(rows, keyset(rows[-1]))
+            return DetailPage(rows)
+
+        ttl = OPEN_DAY_TTL if day >= datetime.date.today() else HISTORY_TTL
+        # The keyset goes last so invalidate_open_day only sees plain dates
+        return self.cache.get_or_load(("kpi_detail", day, kind, limit, after), load, ttl)
+
+    # ============================================================
+    # REPORTS
+    # ============================================================
+
+    def report_rows(self, report_type: str, from_date: date, to_date: date) -> list:
+        """
+        Rows for any ReportRunner report type
+        Analytics reports come from the sliced aggregates above; the rest are
+        cached per range (briefly when the range includes today)
+        """
+        if report_type == "Hourly Sales Report":
+            return [asdict(r) for r in self.hourly_sales(from_date, to_date)]
+        if report_type == "Category Performance Report":
+            return [asdict(r) for r in self.category_performance(from_date, to_date)]
+        if report_type == "Top Selling Products Report":
+            return [asdict(r) for r in self.top_products(from_date, to_date)]
+
+        if report_type not in REPORT_QUERIES:
+            raise ValueError(f"Unknown report type: {report_type}")
+        return self.cache.get_or_load(
+            ("report", report_type, from_date, to_date),
+            lambda: fetch_report_rows(report_type, from_date, to_date),
+            self._range_ttl(to_date))
+
+    def comparison_rows(self, report_type: str, from_date: date, to_date: date, mode: str):
+        """
+        Comparison variant of a report (both periods in one scan), cached per range
+        Returns: (comparison report type, rows)
+        """
+        return self.cache.get_or_load(
+            ("comparison", report_type, mode, from_date, to_date),
+            lambda: fetch_comparison_rows(report_type, from_date, to_date, mode),
+            self._range_ttl(to_date))
+
+    def invalidate_open_day(self):
+        """Drop every cached result that covers today (e.g. after a new sale)"""
+        today = datetime.date.today()
+        self.cache.invalidate(lambda key: any(isinstance(part, date) and part >= today
+                                              for part in key[1:]))
+
+
+_service = None
+
+
+def get_analytics_service() -> AnalyticsService:
+    """Shared service instance (one cache for dashboard and reports)"""
+    global _service
+    if _service is None:
+        _service = AnalyticsService()
+    return _service
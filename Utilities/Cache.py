@@ -0,0 +1,72 @@
+"""
+Cache.py
+Small thread-safe TTL cache shared by the analytics and dashboard code
+Expired entries are kept until evicted so they can stand in while the
+database is unreachable (serve_stale_on)
+"""
+import threading
+import time
+
+
+class TTLCache:
+    """Key/value cache where every entry expires after its own time-to-live (seconds)"""
+
+    def __init__(self, default_ttl: float = 60, max_entries: int = 512, serve_stale_on: tuple = ()):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        # Exceptions from a loader for which get_or_load() returns the expired value instead
+        self.serve_stale_on = serve_stale_on
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl: float = None):
+        """Store a value for ttl seconds (default_ttl if not given)"""
+        expires = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # Drop the entry closest to expiry to make room
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (expires, value)
+
+    def get_or_load(self, key, loader, ttl: float = None):
+        """
+        Return the cached value, calling loader() and caching its result on a miss
+        If loader() raises one of serve_stale_on, the expired value is returned when there is one
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            try:
+                value = loader()
+            except self.serve_stale_on:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is None:
+                        raise
+                    self.stale_hits += 1
+                    return entry[1]
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, predicate=None):
+        """Remove every entry, or only the keys for which predicate(key) is true"""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if predicate(k)]:
+                    del self._entries[key]
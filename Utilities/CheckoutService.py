@@ -0,0 +1,180 @@
+"""
+CheckoutService.py
+Qt-free checkout path - product scans and transaction creation
+
+TransactionController calls these for the cashier window; the checkout
+benchmark drives the same functions from many simulated lanes, so what is
+measured is exactly what the till runs.
+
+Every statement on this path goes through Utilities/Statements.py, so on
+the pooled connections used by default each one is prepared on the server
+once per connection and afterwards only executed.
+
+Concurrent lanes do not contend on shared rows: a sale only inserts new
+rows plus an upsert of the selling terminal's own product_daily_sales rows,
+and transaction numbers carry the terminal's prefix, so two lanes never
+race for the same number (Utilities/Terminals.py).
+"""
+import datetime
+
+from mysql.connector import errorcode, Error, IntegrityError
+
+from Utilities.DatabaseConnection import getPooledConnection
+from Utilities.Statements import execute_statement
+from Utilities.Terminals import Terminal, TerminalDisabled, current_terminal
+from Model.TerminalModel import TerminalModel
+from Model.TransactionModel import TransactionModel
+
+
+# Attempts at a fresh transaction number when one is already taken
+TRANSACTION_NUMBER_ATTEMPTS = 3
+
+
+def generate_transaction_number(prefix: str = "TXN", now: datetime.datetime = None) -> str:
+    """e.g. TXN-20250101-093015-123456 (microseconds keep concurrent tills apart)"""
+    now = now or datetime.datetime.now()
+    return f"{prefix}-{now:%Y%m%d-%H%M%S}-{now.microsecond:06d}"
+
+
+def find_product(reference_number: str, conn=None) -> dict:
+    """Active product for a scanned reference number, or None"""
+    own_connection = conn is None
+    if own_connection:
+        conn = getPooledConnection()
+    try:
+        rows = execute_statement(conn, TransactionModel.get_product_query, reference_number,
+                                 dictionary=True).rows
+        return rows[0] if rows else None
+    finally:
+        if own_connection:
+            conn.close()
+
+
+def create_transaction(cashier_id: int, payment_data: dict, cart_items: list,
+                       conn=None, number_prefix: str = None, terminal: Terminal = None):
+    """
+    Save a paid cart as one DB transaction: header, items, product counters,
+    payments and the sales event
+    payment_data: PaymentPopup.get_payment_data() shape (subtotal, tax,
+                  discount, total, payments, discount_type)
+    cart_items:   [{'product_id', 'product_name', 'price', 'qty', 'subtotal'}, ...]
+    terminal:     selling terminal (default: this process's, if registered)
+    number_prefix defaults to the terminal's prefix ("TXN" without a terminal)
+    Returns: (transaction_id, transaction_number)
+    Raises: TerminalDisabled if the terminal was disabled since it started;
+            the database error after rolling back
+    """
+    terminal = terminal or current_terminal()
+    terminal_id = terminal.terminal_id if terminal else None
+    number_prefix = number_prefix or (terminal.number_prefix if terminal else "TXN")
+
+    own_connection = conn is None
+    if own_connection:
+        conn = getPooledConnection()
+
+    try:
+        for attempt in range(TRANSACTION_NUMBER_ATTEMPTS):
+            now = datetime.datetime.now()
+            try:
+                if terminal is not None:
+                    _check_terminal_active(conn, terminal)
+                result = _insert_transaction(conn, cashier_id, terminal_id, payment_data,
+                                             cart_items,
+                                             generate_transaction_number(number_prefix, now),
+                                             now.replace(microsecond=0))
+                conn.commit()
+                return result
+            except IntegrityError as e:
+                conn.rollback()
+                if e.errno != errorcode.ER_DUP_ENTRY or attempt == TRANSACTION_NUMBER_ATTEMPTS - 1:
+                    raise
+    except Exception:
+        try:
+            conn.rollback()
+        except Error:
+            pass
+        raise
+    finally:
+        if own_connection:
+            conn.close()
+
+
+def _check_terminal_active(conn, terminal: Terminal):
+    """Refuse the sale if the terminal is disabled (read in the sale's own transaction)"""
+    rows = execute_statement(conn, TerminalModel.get_terminal_active_query,
+                             terminal.terminal_id).rows
+    terminal.is_active = bool(rows and rows[0][0])
+    if not terminal.is_active:
+        raise TerminalDisabled(terminal)
+
+
+def _insert_transaction(conn, cashier_id: int, terminal_id: int, payment_data: dict,
+                        cart_items: list, transaction_number: str, sold_at: datetime.datetime):
+    # Get discount type ID
+    discount_type_id = None
+    if payment_data.get('discount_type', "None") != "None":
+        discount_rows = execute_statement(conn, TransactionModel.get_discount_type_id_query,
+                                          payment_data['discount_type']).rows
+        if discount_rows:
+            discount_type_id = discount_rows[0][0]
+
+    # Insert transaction
+    transaction_id = execute_statement(
+        conn, TransactionModel.create_transaction_query,
+        transaction_number=transaction_number,
+        cashier_id=cashier_id,
+        subtotal=payment_data['subtotal'],
+        tax_amount=payment_data['tax'],
+        discount_amount=payment_data['discount'],
+        final_total=payment_data['total'],
+        discount_type_id=discount_type_id,
+        transaction_date=sold_at,
+        terminal_id=terminal_id
+    ).lastrowid
+
+    # Insert transaction items
+    for item in cart_items:
+        execute_statement(
+            conn, TransactionModel.add_transaction_item_query,
+            transaction_id=transaction_id,
+            product_id=item['product_id'],
+            product_name=item['product_name'],
+            quantity=item['qty'],
+            unit_price=item['price'],
+            total_price=item['subtotal'],
+            transaction_date=sold_at
+        )
+
+        # Keep the per-day product counters in step (same DB transaction)
+        execute_statement(
+            conn, TransactionModel.add_product_daily_sales_query,
+            product_id=item['product_id'],
+            product_name=item['product_name'],
+            quantity=item['qty'],
+            revenue=item['subtotal'],
+            transaction_date=sold_at,
+            terminal_id=terminal_id
+        )
+
+    # One payments row per tender
+    for payment in payment_data['payments']:
+        execute_statement(
+            conn, TransactionModel.add_payment_query,
+            transaction_id=transaction_id,
+            payment_method=payment['method'],
+            amount=payment['amount'],
+            tendered=payment['tendered'],
+            change_amount=payment['change'],
+            transaction_date=sold_at
+        )
+
+    # Append to the sales event outbox (same DB transaction)
+    execute_statement(
+        conn, TransactionModel.add_sales_event_query,
+        transaction_id=transaction_id,
+        cashier_id=cashier_id,
+        final_total=payment_data['total'],
+        items_count=sum(item['qty'] for item in cart_items)
+    )
+
+    return transaction_id, transaction_number
@@ -0,0 +1,264 @@
+"""
+Config.py
+Configuration loaded once at start-up: built-in defaults, then the config
+file, then environment variables (later sources win)
+
+    sypoint.ini in the project root (SYPOINT_CONFIG names another file):
+        [database]
+        host = db.example.lan
+        pool_size = 10
+    SYPOINT_<SECTION>_<KEY> overrides one option, e.g. SYPOINT_DATABASE_POOL_SIZE=10
+    (the older SYPOINT_DB_BACKEND, SYPOINT_SQLITE_PATH and SYPOINT_TERMINAL
+    are still read)
+
+Every value is converted to its option's type and range-checked, and unknown
+sections/keys are rejected (typos); all problems are reported together as one
+ConfigError. Utilities/Settings.py exposes the values as the constants the
+rest of the code imports.
+    python "Main Application/Config.py"             effective values and their source
+    python "Main Application/Config.py" --example   a commented sypoint.ini
+"""
+import configparser
+import os
+from dataclasses import dataclass, field
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_FILE = os.path.join(_ROOT, "sypoint.ini")
+
+
+class ConfigError(ValueError):
+    """One or more configuration values are invalid"""
+
+
+@dataclass(frozen=True)
+class Option:
+    section: str
+    key: str
+    type: type
+    default: object
+    help: str
+    choices: tuple = None
+    minimum: float = None
+    maximum: float = None
+    env: str = None  # older environment variable, also accepted
+
+    @property
+    def env_name(self) -> str:
+        return f"SYPOINT_{self.section}_{self.key}".upper()
+
+
+OPTIONS = (
+    # Storage
+    Option("database", "backend", str, "mysql", "mysql (shared server) or sqlite (embedded file)",
+           choices=("mysql", "sqlite"), env="SYPOINT_DB_BACKEND"),
+    Option("database", "host", str, "localhost", "MySQL server host"),
+    Option("database", "port", int, 3306, "MySQL server port", minimum=1, maximum=65535),
+    Option("database", "user", str, "root", "MySQL user"),
+    Option("database", "password", str, "", "MySQL password"),
+    Option("database", "name", str, "projectsypoint", "MySQL database (schema) name"),
+    Option("database", "connect_timeout", int, 5,
+           "Seconds to wait for the MySQL server when connecting", minimum=1, maximum=300),
+    Option("database", "read_timeout", int, 30,
+           "Seconds to wait for a MySQL reply before giving up (0 = wait forever)",
+           minimum=0, maximum=3600),
+    Option("database", "write_timeout", int, 30,
+           "Seconds to wait when sending to MySQL before giving up (0 = wait forever)",
+           minimum=0, maximum=3600),
+    Option("database", "pool_size", int, 5, "Pooled MySQL connections per process",
+           minimum=1, maximum=32),
+    Option("database", "sqlite_path", str, "data/projectsypoint.sqlite3",
+           "SQLite database file (relative to the project root)", env="SYPOINT_SQLITE_PATH"),
+    Option("database", "sqlite_busy_timeout", float, 5.0,
+           "Seconds a SQLite writer waits for another lane's write lock", minimum=0, maximum=600),
+
+    # Resilience (Utilities/Resilience.py)
+    Option("resilience", "retry_attempts", int, 3,
+           "Tries for a read that failed on a lost connection or lock wait", minimum=1, maximum=10),
+    Option("resilience", "retry_base_ms", float, 100,
+           "Backoff before the first retry (doubles each time, jittered)", minimum=0),
+    Option("resilience", "retry_max_ms", float, 2000, "Longest backoff between retries", minimum=0),
+    Option("resilience", "retry_budget_ms", float, 5000,
+           "No read retry once this long has gone by since the first try (a read that "
+           "timed out is never retried)", minimum=0),
+    Option("resilience", "breaker_failures", int, 3,
+           "Connection failures in a row that open the circuit (lane goes offline)",
+           minimum=1, maximum=100),
+    Option("resilience", "breaker_reset_seconds", float, 15,
+           "Seconds the circuit stays open before one connection attempt probes", minimum=1),
+
+    # Business
+    Option("store", "code", str, "", "Store name in telemetry (lanes of one store share it)"),
+    Option("store", "tax_rate", float, 0.12, "VAT added to the cart subtotal (0.12 = 12%)",
+           minimum=0, maximum=1),
+    Option("receipts", "folder", str, "receipts", "Folder receipts are saved to"),
+    Option("receipts", "width", int, 42, "Receipt width in characters", minimum=24, maximum=80),
+
+    # Query instrumentation
+    Option("queries", "slow_query_ms", float, 250, "Queries slower than this are logged",
+           minimum=0),
+    Option("queries", "slow_query_log", str, "logs/slow_queries.log", "Slow query log file"),
+    Option("queries", "stats_report", str, "logs/query_stats.txt",
+           "Where --query-stats writes the per-query summary"),
+
+    # Caches and polling
+    Option("cache", "history_ttl", float, 6 * 60 * 60,
+           "Seconds analytics for closed days stay cached", minimum=0),
+    Option("cache", "open_day_ttl", float, 30,
+           "Seconds analytics for today stay cached", minimum=0),
+    Option("dashboard", "live_poll_ms", int, 3000,
+           "Milliseconds between polls of the sales event outbox", minimum=250),
+    Option("dashboard", "live_gap_seconds", int, 120,
+           "Seconds to keep re-reading a skipped sales event ID (another lane had not "
+           "committed it yet, or it was rolled back)", minimum=0),
+    Option("dashboard", "live_gap_window", int, 500,
+           "Sales event IDs below the dashboard snapshot's watermark checked for "
+           "sales still uncommitted when it was taken", minimum=0),
+    Option("dashboard", "detail_page_size", int, 50, "Rows per page in the KPI detail dialogs",
+           minimum=1, maximum=1000),
+
+    # Batches and concurrency
+    Option("reports", "workers", int, 5, "Concurrent report queries for a report package",
+           minimum=1, maximum=32),
+    Option("batches", "backfill_batch_size", int, 10000,
+           "Rows per statement in migration backfills", minimum=100),
+    Option("batches", "seed_batch_rows", int, 5000, "Rows per INSERT in the seed tool", minimum=1),
+    Option("partitions", "months_ahead", int, 3,
+           "Empty monthly partitions kept ahead of today (MySQL)", minimum=1, maximum=36),
+
+    # Telemetry (Utilities/Telemetry.py)
+    Option("telemetry", "jsonl_path", str, "logs/telemetry.jsonl",
+           "Span log, one JSON object per line (empty = no file)"),
+    Option("telemetry", "max_bytes", int, 5_000_000, "Size at which the span log is rotated",
+           minimum=10_000),
+    Option("telemetry", "backups", int, 5, "Rotated span logs kept", minimum=0, maximum=100),
+    Option("telemetry", "metrics_host", str, "127.0.0.1", "Address the /metrics endpoint listens on"),
+    Option("telemetry", "metrics_port", int, 0,
+           "Port of the Prometheus /metrics endpoint (0 = off)", minimum=0, maximum=65535),
+
+    # Profiler (Utilities/Profiler.py)
+    Option("profiler", "folder", str, "logs/profiles", "Where captured profiles are saved"),
+    Option("profiler", "seconds", int, 30,
+           "Length of a timed capture (--profile / Ctrl+Shift+P)", minimum=1, maximum=3600),
+
+    # Terminal
+    Option("terminal", "code", str, "", "This lane's terminal code (empty = host name)",
+           env="SYPOINT_TERMINAL"),
+    Option("terminal", "heartbeat_seconds", float, 30, "Seconds between terminal heartbeats",
+           minimum=1),
+    Option("terminal", "offline_seconds", float, 90,
+           "Seconds without a heartbeat before a terminal shows as offline", minimum=1),
+
+    # Performance feature toggles
+    Option("features", "prepared_statements", bool, True,
+           "Prepare and cache checkout statements on pooled MySQL connections"),
+    Option("features", "analytics_cache", bool, True,
+           "Cache dashboard/report aggregates (off = always query)"),
+    Option("features", "live_dashboard", bool, True,
+           "Apply new sales to the admin dashboard as they happen"),
+    Option("features", "query_instrumentation", bool, True,
+           "Time every query for the statistics summary and slow query log"),
+    Option("features", "telemetry", bool, True,
+           "Record timed spans for scans, checkouts, receipts, reports and screens"),
+)
+
+_BOOLEANS = {"1": True, "true": True, "yes": True, "on": True,
+             "0": False, "false": False, "no": False, "off": False}
+
+
+def _convert(option: Option, text: str):
+    """Value of an option from its text in the file or environment"""
+    if option.type is bool:
+        try:
+            return _BOOLEANS[text.strip().lower()]
+        except KeyError:
+            raise ValueError("expected true/false") from None
+    if option.type is str:
+        value = text
+    else:
+        try:
+            value = option.type(text.strip())
+        except ValueError:
+            raise ValueError("expected a whole number" if option.type is int
+                             else "expected a number") from None
+    if option.choices and value not in option.choices:
+        raise ValueError(f"expected one of {', '.join(option.choices)}")
+    if option.minimum is not None and value < option.minimum:
+        raise ValueError(f"must be at least {option.minimum:g}")
+    if option.maximum is not None and value > option.maximum:
+        raise ValueError(f"must be at most {option.maximum:g}")
+    return value
+
+
+@dataclass
+class Config:
+    """Effective configuration: values and where each came from"""
+    path: str
+    values: dict = field(default_factory=dict)   # (section, key) -> value
+    sources: dict = field(default_factory=dict)  # (section, key) -> "default" / file / env var
+
+    def get(self, section: str, key: str):
+        return self.values[(section, key)]
+
+
+def load_config(path: str = None, environ=None) -> Config:
+    """
+    Defaults, then the config file (if it exists), then the environment
+    Raises: ConfigError listing every invalid or unknown setting
+    """
+    environ = os.environ if environ is None else environ
+    path = path or environ.get("SYPOINT_CONFIG") or DEFAULT_CONFIG_FILE
+    config = Config(path)
+    errors = []
+
+    parser = configparser.ConfigParser(interpolation=None)
+    if os.path.exists(path):
+        try:
+            parser.read(path, encoding="utf-8")
+        except configparser.Error as e:
+            raise ConfigError(f"{path}: {e}") from e
+    known = {(option.section, option.key) for option in OPTIONS}
+    for section in parser.sections():
+        for key in parser[section]:
+            if (section, key) not in known:
+                errors.append(f"{path}: unknown setting [{section}] {key}")
+
+    for option in OPTIONS:
+        name = (option.section, option.key)
+        config.values[name], config.sources[name] = option.default, "default"
+        candidates = []
+        if parser.has_option(option.section, option.key):
+            candidates.append((parser.get(option.section, option.key), path))
+        for env_name in (option.env, option.env_name):
+            if env_name and env_name in environ:
+                candidates.append((environ[env_name], env_name))
+        for text, source in candidates:
+            try:
+                config.values[name], config.sources[name] = _convert(option, text), source
+            except ValueError as e:
+                errors.append(f"{source}: [{option.section}] {option.key} = {text!r}: {e}")
+
+    if (config.get("terminal", "offline_seconds")
+            <= config.get("terminal", "heartbeat_seconds")):
+        errors.append("[terminal] offline_seconds must be longer than heartbeat_seconds")
+
+    if errors:
+        raise ConfigError("Invalid configuration:\n    " + "\n    ".join(errors))
+    return config
+
+
+def example_config() -> str:
+    """A sypoint.ini with every option commented out at its default"""
+    lines = ["; SyPoint configuration - uncomment a line to change it",
+             "; SYPOINT_<SECTION>_<KEY> environment variables override this file"]
+    section = None
+    for option in OPTIONS:
+        if option.section != section:
+            section = option.section
+            lines += ["", f"[{section}]"]
+        default = option.default
+        if option.type is bool:
+            default = "true" if default else "false"
+        lines.append(f"; {option.help}")
+        lines.append(f";{option.key} = {default}")
+    return "\n".join(lines) + "\n"
@@ -1,13 +1,112 @@
+import threading
+import time
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 
-def getConnection():
+from Utilities import SQLiteBackend
+from Utilities.QueryStats import instrument_connection, instrument_models
+from Utilities.Resilience import DatabaseUnavailable, get_breaker, is_connection_error, retry_read
+from Utilities.Settings import DB_BACKEND, DB_POOL_SIZE, MYSQL_CONFIG
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def getConnection(**options):
+    """
+    New connection to the configured backend (Settings.DB_BACKEND)
+    options are passed on to mysql.connector.connect()
+    Raises: DatabaseUnavailable when the server cannot be reached or the
+    circuit breaker is open (Utilities/Resilience.py); other connection
+    errors (e.g. bad credentials) are raised as they are
+    """
+    started = time.perf_counter()
+    conn = get_breaker().call(_connect, **options)
+    return instrument_connection(conn, "connect", (time.perf_counter() - started) * 1000)
+
+
+def _connect(**options):
+    try:
+        if DB_BACKEND == "sqlite":
+            return SQLiteBackend.connect(**options)
+        return mysql.connector.connect(**MYSQL_CONFIG, **options)
+    except DatabaseUnavailable:
+        raise
+    except Error as e:
+        if is_connection_error(e):
+            raise DatabaseUnavailable(f"Database unavailable: {e.msg}") from e
+        raise
+
+
+def getPooledConnection(pool_size: int = None):
+    """
+    Returns a connection from a shared pool (created on first use)
+    pool_size applies when the pool is created (default: DB_POOL_SIZE)
+    conn.close() hands the connection back to the pool instead of closing it
+    (SQLite connections are cheap to open, so that backend is not pooled).
+    Sessions are not reset on return, so prepared statements cached by
+    Utilities/Statements.py stay valid for the next borrower.
+    Raises: as getConnection()
+    """
+    if DB_BACKEND == "sqlite":
+        return getConnection()
+    started = time.perf_counter()
+    conn = get_breaker().call(_borrow, pool_size)
+    return instrument_connection(conn, "pool", (time.perf_counter() - started) * 1000)
+
+
+def _borrow(pool_size: int = None):
+    global _pool
     try:
-       return mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password ="",
-            database="projectsypoint"
-        )
-    except Error:
-        print("Database connection error.")
\ No newline at end of file
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="sypoint_pool",
+                    pool_size=pool_size or DB_POOL_SIZE,
+                    pool_reset_session=False,
+                    **MYSQL_CONFIG
+                )
+        conn = _pool.get_connection()
+        # Without a session reset, end whatever transaction the last borrower left open
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except Error:
+                conn.close()
+                raise
+        return conn
+    except Error as e:
+        if is_connection_error(e):
+            raise DatabaseUnavailable(f"Database unavailable: {e.msg}") from e
+        raise
+
+
+def fetchAll(query: str, params=(), conn=None) -> list:
+    """
+    Run a read-only query and return every row as a dict
+    Without conn it runs on its own connection and is retried with jittered
+    backoff when the connection drops or a lock wait times out (retry_read)
+    """
+    if conn is not None:
+        return _fetch_all(conn, query, params)
+
+    def attempt():
+        own = getConnection()
+        try:
+            return _fetch_all(own, query, params)
+        finally:
+            own.close()
+    return retry_read(attempt)
+
+
+def _fetch_all(conn, query: str, params) -> list:
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+# Name the Model query builders before the first one is called (Utilities/QueryStats.py)
+instrument_models()
@@ -0,0 +1,89 @@
+"""
+Dialect.py
+SQL fragments that differ between the storage backends
+
+Model query builders are written once in the MySQL-flavoured "format"
+paramstyle (%s placeholders, %% for a literal percent) and call sql() for
+the few date functions and the upsert clause that MySQL and SQLite spell
+differently. The SQLite connection adapter turns the placeholders into
+qmark style at execute time (see Utilities/SQLiteBackend.py).
+"""
+from Utilities.Settings import DB_BACKEND
+
+
+class MySQLDialect:
+    name = "mysql"
+    explain = "EXPLAIN "
+
+    def today(self) -> str:
+        return "CURDATE()"
+
+    def now(self) -> str:
+        return "NOW()"
+
+    def hour(self, expr: str) -> str:
+        return f"HOUR({expr})"
+
+    def week_start(self, expr: str) -> str:
+        """Monday of the week containing expr"""
+        return f"DATE_SUB(DATE({expr}), INTERVAL WEEKDAY({expr}) DAY)"
+
+    def month_start(self, expr: str) -> str:
+        return f"DATE(DATE_FORMAT({expr}, '%%Y-%%m-01'))"
+
+    def days_between(self, later: str, earlier: str) -> str:
+        """Whole days from earlier to later (date parts only)"""
+        return f"DATEDIFF({later}, {earlier})"
+
+    def upsert(self, key_columns: tuple, add_columns: tuple = (), replace_columns: tuple = ()) -> str:
+        """
+        Clause appended to an INSERT: on a duplicate key, add the new values of
+        add_columns to the row and overwrite replace_columns
+        """
+        assignments = [f"{column} = VALUES({column})" for column in replace_columns]
+        assignments += [f"{column} = {column} + VALUES({column})" for column in add_columns]
+        return " ON DUPLICATE KEY UPDATE " + ", ".join(assignments)
+
+
+class SQLiteDialect(MySQLDialect):
+    name = "sqlite"
+    explain = "EXPLAIN QUERY PLAN "
+
+    def today(self) -> str:
+        return "DATE('now', 'localtime')"
+
+    def now(self) -> str:
+        return "DATETIME('now', 'localtime')"
+
+    def hour(self, expr: str) -> str:
+        return f"CAST(STRFTIME('%%H', {expr}) AS INTEGER)"
+
+    def week_start(self, expr: str) -> str:
+        # 'weekday 0' moves forward to Sunday (or stays on it); Monday is 6 days before
+        return f"DATE({expr}, 'weekday 0', '-6 days')"
+
+    def month_start(self, expr: str) -> str:
+        return f"DATE({expr}, 'start of month')"
+
+    def days_between(self, later: str, earlier: str) -> str:
+        return f"CAST(JULIANDAY(DATE({later})) - JULIANDAY(DATE({earlier})) AS INTEGER)"
+
+    def upsert(self, key_columns: tuple, add_columns: tuple = (), replace_columns: tuple = ()) -> str:
+        assignments = [f"{column} = excluded.{column}" for column in replace_columns]
+        assignments += [f"{column} = {column} + excluded.{column}" for column in add_columns]
+        return (f" ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET "
+                + ", ".join(assignments))
+
+
+DIALECTS = {
+    "mysql": MySQLDialect(),
+    "sqlite": SQLiteDialect(),
+}
+
+
+def sql():
+    """Dialect of the configured backend (Settings.DB_BACKEND)"""
+    try:
+        return DIALECTS[DB_BACKEND]
+    except KeyError:
+        raise ValueError(f"Unknown DB_BACKEND: {DB_BACKEND}") from None
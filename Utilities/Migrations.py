@@ -0,0 +1,375 @@
+"""
+Migrations.py
+Ordered schema migrations for existing databases
+projectsypoint_database_schema.txt always shows the current schema for new
+installs; each migration brings an older database up to the same shape.
+Applied migrations are recorded in the schema_migrations table.
+SQL text steps are MySQL DDL: SQLite databases are created at the current
+schema with every migration already recorded (Utilities/SQLiteBackend.py).
+Callable steps that also bring an older SQLite file forward check sql().name.
+"""
+import datetime
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.Dialect import sql
+from Utilities.Partitions import (
+    PARTITIONED_TABLES, add_months, create_archive_tables, create_archive_views, month_start,
+    partition_table
+)
+from Utilities.Settings import BACKFILL_BATCH_SIZE, PARTITION_MONTHS_AHEAD
+
+
+# Rate every transaction recorded before tax_amount existed was charged
+HISTORICAL_TAX_RATE = 0.12
+
+
+def _backfill_tax_amount(conn, cursor):
+    """Fill tax_amount for existing transactions in small batches"""
+    while True:
+        cursor.execute("""
+            UPDATE transactions
+            SET tax_amount = ROUND(subtotal * %s, 2)
+            WHERE tax_amount IS NULL
+            LIMIT %s
+        """, (HISTORICAL_TAX_RATE, BACKFILL_BATCH_SIZE))
+        conn.commit()
+        if cursor.rowcount < BACKFILL_BATCH_SIZE:
+            break
+
+
+def _backfill_cash_payments(conn, cursor):
+    """Record every existing transaction as one exact cash tender, in small batches"""
+    while True:
+        cursor.execute("""
+            INSERT INTO payments
+            (transaction_id, payment_method, amount, tendered, change_amount, payment_date)
+            SELECT t.transaction_id, 'Cash', t.final_total, t.final_total, 0, t.transaction_date
+            FROM transactions t
+            LEFT JOIN payments p ON p.transaction_id = t.transaction_id
+            WHERE p.payment_id IS NULL
+            ORDER BY t.transaction_id
+            LIMIT %s
+        """, (BACKFILL_BATCH_SIZE,))
+        conn.commit()
+        if cursor.rowcount < BACKFILL_BATCH_SIZE:
+            break
+
+
+def _backfill_product_daily_sales(conn, cursor):
+    """Build the per-day product counters from existing items, a batch of transactions at a time"""
+    cursor.execute("SELECT COALESCE(MAX(transaction_id), 0) FROM transactions")
+    last_id = cursor.fetchone()[0]
+    for first_id in range(1, last_id + 1, BACKFILL_BATCH_SIZE):
+        cursor.execute("""
+            INSERT INTO product_daily_sales
+            (sale_date, product_id, product_name, quantity, revenue)
+            SELECT DATE(t.transaction_date), ti.product_id, MAX(ti.product_name),
+                   SUM(ti.quantity), SUM(ti.total_price)
+            FROM transaction_items ti
+            JOIN transactions t ON ti.transaction_id = t.transaction_id
+            WHERE t.transaction_id >= %s AND t.transaction_id < %s
+              AND t.status = 'completed'
+            GROUP BY DATE(t.transaction_date), ti.product_id
+            ON DUPLICATE KEY UPDATE
+                quantity = quantity + VALUES(quantity),
+                revenue = revenue + VALUES(revenue)
+        """, (first_id, first_id + BACKFILL_BATCH_SIZE))
+        conn.commit()
+
+
+def _add_item_transaction_date(conn, cursor):
+    """transaction_items gets its transaction's date (the partition key)"""
+    if sql().name == "mysql":
+        cursor.execute("ALTER TABLE transaction_items "
+                       "ADD COLUMN transaction_date DATETIME NULL AFTER transaction_id")
+    else:
+        cursor.execute("ALTER TABLE transaction_items ADD COLUMN transaction_date DATETIME")
+
+
+def _backfill_transaction_dates(conn, cursor):
+    """
+    Copy transaction_date onto existing items, and onto payments whose
+    payment_date drifted from it, in batches of row IDs
+    """
+    for table, id_column, date_column in (("transaction_items", "transaction_item_id",
+                                           "transaction_date"),
+                                          ("payments", "payment_id", "payment_date")):
+        cursor.execute(f"SELECT COALESCE(MAX({id_column}), 0) FROM {table}")
+        last_id = cursor.fetchone()[0]
+        for first_id in range(1, last_id + 1, BACKFILL_BATCH_SIZE):
+            if sql().name == "mysql":
+                cursor.execute(f"""
+                    UPDATE {table} x
+                    JOIN transactions t ON t.transaction_id = x.transaction_id
+                    SET x.{date_column} = t.transaction_date
+                    WHERE x.{id_column} >= %s AND x.{id_column} < %s
+                """, (first_id, first_id + BACKFILL_BATCH_SIZE))
+            else:
+                cursor.execute(f"""
+                    UPDATE {table}
+                    SET {date_column} = (SELECT t.transaction_date FROM transactions t
+                                         WHERE t.transaction_id = {table}.transaction_id)
+                    WHERE {id_column} >= %s AND {id_column} < %s
+                """, (first_id, first_id + BACKFILL_BATCH_SIZE))
+            conn.commit()
+
+
+def _drop_transaction_foreign_keys(conn, cursor):
+    """Partitioned InnoDB tables can neither have nor be referenced by foreign keys"""
+    if sql().name != "mysql":
+        return
+    tables = ", ".join(f"'{table}'" for table in PARTITIONED_TABLES)
+    cursor.execute(f"""
+        SELECT TABLE_NAME, CONSTRAINT_NAME
+        FROM information_schema.REFERENTIAL_CONSTRAINTS
+        WHERE CONSTRAINT_SCHEMA = DATABASE()
+          AND (TABLE_NAME IN ({tables}) OR REFERENCED_TABLE_NAME IN ({tables}))
+    """)
+    for table, constraint in cursor.fetchall():
+        cursor.execute(f"ALTER TABLE {table} DROP FOREIGN KEY `{constraint}`")
+
+
+def _rekey_transaction_tables(conn, cursor):
+    """Every unique key of a partitioned table must include transaction_date"""
+    if sql().name != "mysql":
+        return
+    cursor.execute("""
+        ALTER TABLE transactions
+            DROP PRIMARY KEY,
+            ADD PRIMARY KEY (transaction_id, transaction_date),
+            DROP INDEX transaction_number,
+            ADD UNIQUE KEY uq_transactions_number (transaction_number, transaction_date)
+    """)
+    cursor.execute("""
+        ALTER TABLE transaction_items
+            MODIFY transaction_date DATETIME NOT NULL,
+            DROP PRIMARY KEY,
+            ADD PRIMARY KEY (transaction_item_id, transaction_date),
+            ADD INDEX idx_transaction_items_transaction (transaction_id, transaction_date)
+    """)
+    # The index the dropped foreign key left behind is covered by the new one
+    cursor.execute("""
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'transaction_items' AND INDEX_NAME = 'transaction_id'
+    """)
+    if cursor.fetchall():
+        cursor.execute("ALTER TABLE transaction_items DROP INDEX transaction_id")
+
+
+def _partition_transaction_tables(conn, cursor):
+    """One partition per month from the oldest transaction to PARTITION_MONTHS_AHEAD past today"""
+    if sql().name != "mysql":
+        return
+    cursor.execute("SELECT MIN(transaction_date) FROM transactions")
+    oldest = cursor.fetchone()[0]
+    today = datetime.date.today()
+    first_month = month_start(min(oldest.date(), today) if oldest else today)
+    last_month = add_months(month_start(today), PARTITION_MONTHS_AHEAD)
+    for table in PARTITIONED_TABLES:
+        partition_table(cursor, table, first_month, last_month)
+
+
+def _create_archive_tables(conn, cursor):
+    create_archive_tables(cursor)
+
+
+def _create_terminals_table(conn, cursor):
+    """Terminal registry (Utilities/Terminals.py)"""
+    key = ("terminal_id INT AUTO_INCREMENT PRIMARY KEY" if sql().name == "mysql"
+           else "terminal_id INTEGER PRIMARY KEY")
+    cursor.execute(f"""
+        CREATE TABLE terminals (
+            {key},
+            terminal_code VARCHAR(50) NOT NULL UNIQUE,
+            display_name VARCHAR(100),
+            number_prefix VARCHAR(20),
+            is_active BOOLEAN DEFAULT TRUE,
+            hostname VARCHAR(100),
+            process_id INT,
+            current_user_id INT,
+            registered_at DATETIME NOT NULL,
+            last_heartbeat DATETIME
+        )
+    """)
+
+
+def _add_transaction_terminal(conn, cursor):
+    """terminal_id on transactions (and their archive, which must keep the same columns)"""
+    for table in ("transactions", "transactions_archive"):
+        if sql().name == "mysql":
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN terminal_id INT NULL AFTER cashier_id")
+        else:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN terminal_id INT")
+    cursor.execute("CREATE INDEX idx_transactions_terminal_date "
+                   "ON transactions (terminal_id, transaction_date)")
+    create_archive_views(cursor)
+
+
+def _split_counters_by_terminal(conn, cursor):
+    """product_daily_sales gets one row per terminal; existing rows become terminal 0"""
+    if sql().name == "mysql":
+        cursor.execute("""
+            ALTER TABLE product_daily_sales
+                ADD COLUMN terminal_id INT NOT NULL DEFAULT 0 AFTER product_id,
+                DROP PRIMARY KEY,
+                ADD PRIMARY KEY (sale_date, product_id, terminal_id)
+        """)
+        return
+    # SQLite cannot change a primary key in place: rebuild the table
+    cursor.execute("""
+        CREATE TABLE product_daily_sales_new (
+            sale_date DATE NOT NULL,
+            product_id INT NOT NULL REFERENCES products(product_id),
+            terminal_id INT NOT NULL DEFAULT 0,
+            product_name VARCHAR(200) NOT NULL,
+            quantity DECIMAL(12,2) NOT NULL DEFAULT 0,
+            revenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (sale_date, product_id, terminal_id)
+        )
+    """)
+    cursor.execute("""
+        INSERT INTO product_daily_sales_new (sale_date, product_id, product_name, quantity, revenue)
+        SELECT sale_date, product_id, product_name, quantity, revenue FROM product_daily_sales
+    """)
+    cursor.execute("DROP TABLE product_daily_sales")
+    cursor.execute("ALTER TABLE product_daily_sales_new RENAME TO product_daily_sales")
+
+
+# (migration_id, description, steps) - a step is SQL text or a callable(conn, cursor)
+MIGRATIONS = [
+    ("001_transaction_tax_amount",
+     "Store tax on transactions at checkout and index transaction_date",
+     [
+         "ALTER TABLE transactions ADD COLUMN tax_amount DECIMAL(10,2) NULL AFTER subtotal",
+         _backfill_tax_amount,
+         "ALTER TABLE transactions MODIFY tax_amount DECIMAL(10,2) NOT NULL DEFAULT 0",
+         "CREATE INDEX idx_transactions_date_status ON transactions (transaction_date, status)",
+     ]),
+    ("002_sales_events",
+     "Outbox of completed sales tailed by the live dashboard",
+     [
+         """
+         CREATE TABLE sales_events (
+             event_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+             transaction_id INT NOT NULL,
+             cashier_id INT NOT NULL,
+             event_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+             final_total DECIMAL(10,2) NOT NULL,
+             items_count DECIMAL(10,2) NOT NULL,
+             INDEX idx_sales_events_time (event_time)
+         )
+         """,
+     ]),
+    ("003_payments",
+     "Store payment methods and split tenders per transaction",
+     [
+         """
+         CREATE TABLE payments (
+             payment_id INT AUTO_INCREMENT PRIMARY KEY,
+             transaction_id INT NOT NULL,
+             payment_method VARCHAR(20) NOT NULL,
+             amount DECIMAL(10,2) NOT NULL,
+             tendered DECIMAL(10,2) NOT NULL,
+             change_amount DECIMAL(10,2) NOT NULL DEFAULT 0,
+             payment_date DATETIME NOT NULL,
+             FOREIGN KEY (transaction_id) REFERENCES transactions(transaction_id),
+             INDEX idx_payments_method_date (payment_method, payment_date),
+             INDEX idx_payments_date (payment_date)
+         )
+         """,
+         _backfill_cash_payments,
+     ]),
+    ("004_product_daily_sales",
+     "Per-day product sales counters maintained at checkout (top sellers)",
+     [
+         """
+         CREATE TABLE product_daily_sales (
+             sale_date DATE NOT NULL,
+             product_id INT NOT NULL,
+             product_name VARCHAR(200) NOT NULL,
+             quantity DECIMAL(12,2) NOT NULL DEFAULT 0,
+             revenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+             PRIMARY KEY (sale_date, product_id),
+             FOREIGN KEY (product_id) REFERENCES products(product_id)
+         )
+         """,
+         _backfill_product_daily_sales,
+     ]),
+    ("005_partition_transactions",
+     "Partition transactions and items by month; archive tables for closed years",
+     [
+         _add_item_transaction_date,
+         _backfill_transaction_dates,
+         _drop_transaction_foreign_keys,
+         _rekey_transaction_tables,
+         _partition_transaction_tables,
+         _create_archive_tables,
+     ]),
+    ("006_terminals",
+     "Terminal registry, terminal_id on transactions and per-terminal product counters",
+     [
+         _create_terminals_table,
+         _add_transaction_terminal,
+         _split_counters_by_terminal,
+     ]),
+]
+
+
+def _ensure_migrations_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            migration_id VARCHAR(100) PRIMARY KEY,
+            applied_at DATETIME NOT NULL
+        )
+    """)
+
+
+def get_applied_migrations(conn) -> set:
+    """IDs of migrations already applied to this database"""
+    cursor = conn.cursor()
+    try:
+        _ensure_migrations_table(cursor)
+        cursor.execute("SELECT migration_id FROM schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def apply_migrations(conn=None, dry_run: bool = False) -> list:
+    """
+    Apply every pending migration in order
+    Returns: list of applied (or, with dry_run, pending) migration IDs
+    """
+    own_connection = conn is None
+    if own_connection:
+        conn = getConnection()
+
+    try:
+        applied = get_applied_migrations(conn)
+        pending = [m for m in MIGRATIONS if m[0] not in applied]
+        if dry_run:
+            return [migration_id for migration_id, _, _ in pending]
+
+        done = []
+        for migration_id, description, steps in pending:
+            print(f"[Migrations] Applying {migration_id}: {description}")
+            cursor = conn.cursor()
+            try:
+                for step in steps:
+                    if callable(step):
+                        step(conn, cursor)
+                    else:
+                        cursor.execute(step)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (migration_id, applied_at) VALUES (%s, %s)",
+                    (migration_id, datetime.datetime.now()))
+                conn.commit()
+            finally:
+                cursor.close()
+            done.append(migration_id)
+        return done
+
+    finally:
+        if own_connection and conn:
+            conn.close()
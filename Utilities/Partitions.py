@@ -0,0 +1,240 @@
+"""
+Partitions.py
+Monthly range partitions on transactions / transaction_items and archival
+of closed years
+
+Both tables are partitioned by RANGE COLUMNS(transaction_date), one
+partition per month (pYYYYMM) plus a catch-all p_future. Report queries
+filter on transaction_date ranges, so MySQL only reads the months asked for.
+ensure_partitions() keeps PARTITION_MONTHS_AHEAD empty months split off
+p_future ahead of today; run it from Main Application/Partitions.py.
+
+archive_year() moves a closed year into the compressed transactions_archive
+/ transaction_items_archive tables and drops its months from the live
+tables. Reports leave archived years out unless asked: with_archive()
+points a query at the *_all views (live UNION ALL archive).
+
+SQLite has no partitions: maintenance is a no-op there and archival moves
+the rows with INSERT ... SELECT / DELETE.
+"""
+import datetime
+import re
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.Dialect import sql
+from Utilities.QueryStats import get_query_stats
+from Utilities.Settings import PARTITION_MONTHS_AHEAD
+
+
+PARTITIONED_TABLES = ("transactions", "transaction_items")
+FUTURE_PARTITION = "p_future"
+
+_LIVE_TABLE = re.compile(r"\b(FROM|JOIN)\s+(transactions|transaction_items)\b", re.IGNORECASE)
+
+
+def month_start(day) -> datetime.date:
+    return datetime.date(day.year, day.month, 1)
+
+
+def add_months(month: datetime.date, count: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _months(first_month: datetime.date, last_month: datetime.date):
+    month = first_month
+    while month <= last_month:
+        yield month
+        month = add_months(month, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    """Partition holding a month, e.g. p202501"""
+    return f"p{month:%Y%m}"
+
+
+def _partition_month(name: str):
+    """Month of a pYYYYMM partition (None for p_future)"""
+    try:
+        return datetime.datetime.strptime(name, "p%Y%m").date()
+    except ValueError:
+        return None
+
+
+def _partition_clauses(first_month: datetime.date, last_month: datetime.date) -> str:
+    clauses = [f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1)}')"
+               for month in _months(first_month, last_month)]
+    clauses.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ", ".join(clauses)
+
+
+def with_archive(query: str) -> str:
+    """Point a report query at live + archived rows (transactions_all / transaction_items_all)"""
+    rewritten = _LIVE_TABLE.sub(lambda match: f"{match.group(1)} {match.group(2)}_all", query)
+    get_query_stats().rewritten(rewritten, query)  # still filed under the report's builder
+    return rewritten
+
+
+# ============================================================
+# SCHEMA (migration 005)
+# ============================================================
+
+def partition_table(cursor, table: str, first_month: datetime.date, last_month: datetime.date):
+    """Partition a table by month from first_month to last_month (MySQL)"""
+    cursor.execute(f"ALTER TABLE {table} PARTITION BY RANGE COLUMNS(transaction_date) "
+                   f"({_partition_clauses(first_month, last_month)})")
+
+
+def create_archive_tables(cursor):
+    """Archive tables for closed years and the *_all views reports use to include them"""
+    for table in PARTITIONED_TABLES:
+        if sql().name == "mysql":
+            cursor.execute(f"CREATE TABLE {table}_archive LIKE {table}")
+            cursor.execute(f"ALTER TABLE {table}_archive REMOVE PARTITIONING")
+            cursor.execute(f"ALTER TABLE {table}_archive ROW_FORMAT=COMPRESSED")
+        else:
+            cursor.execute(f"CREATE TABLE {table}_archive AS SELECT * FROM {table} WHERE 0")
+    create_archive_views(cursor)
+
+
+def create_archive_views(cursor):
+    """
+    (Re)create the *_all views; MySQL fixes a view's columns when it is
+    created, so this runs again after a column is added to a live table
+    and its archive
+    """
+    for table in PARTITIONED_TABLES:
+        if sql().name == "mysql":
+            create = "CREATE OR REPLACE VIEW"
+        else:
+            cursor.execute(f"DROP VIEW IF EXISTS {table}_all")
+            create = "CREATE VIEW"
+        cursor.execute(f"""
+            {create} {table}_all AS
+            SELECT * FROM {table}
+            UNION ALL
+            SELECT * FROM {table}_archive
+        """)
+
+
+# ============================================================
+# MAINTENANCE
+# ============================================================
+
+def get_partitions(cursor, table: str) -> list:
+    """(partition name, upper bound, estimated rows) of a table, oldest first"""
+    cursor.execute("""
+        SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = %s
+          AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """, (table,))
+    return [tuple(row) for row in cursor.fetchall()]
+
+
+def ensure_partitions(conn=None, months_ahead: int = PARTITION_MONTHS_AHEAD,
+                      today: datetime.date = None) -> list:
+    """
+    Split p_future so every month up to months_ahead past today has its own
+    partition (rows already waiting in p_future are moved into their months)
+    Returns: list of (table, partition name) created
+    """
+    if sql().name != "mysql":
+        return []
+    today = today or datetime.date.today()
+    last_month = add_months(month_start(today), months_ahead)
+
+    own_connection = conn is None
+    if own_connection:
+        conn = getConnection()
+    cursor = None
+    created = []
+    try:
+        cursor = conn.cursor()
+        for table in PARTITIONED_TABLES:
+            partitions = get_partitions(cursor, table)
+            if not partitions:
+                print(f"[Partitions] {table} is not partitioned - apply the migrations first.")
+                continue
+
+            months = [m for m in (_partition_month(row[0]) for row in partitions) if m]
+            if months:
+                first_month = add_months(max(months), 1)
+            else:
+                # Only p_future so far: start at the oldest row waiting in it
+                cursor.execute(f"SELECT MIN(transaction_date) FROM {table}")
+                oldest = cursor.fetchone()[0]
+                first_month = month_start(min(oldest.date(), today) if oldest else today)
+            if first_month > last_month:
+                continue
+
+            cursor.execute(f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} "
+                           f"INTO ({_partition_clauses(first_month, last_month)})")
+            created += [(table, partition_name(month)) for month in _months(first_month, last_month)]
+        return created
+    finally:
+        if cursor:
+            cursor.close()
+        if own_connection and conn:
+            conn.close()
+
+
+def archive_year(year: int, conn=None, today: datetime.date = None) -> dict:
+    """
+    Move a closed year's transactions and items into the archive tables,
+    a month at a time: copy the month into *_archive, then drop its partition
+    (MySQL) or delete its rows (SQLite). Safe to re-run after an interruption.
+    Returns: {table: rows archived}
+    """
+    today = today or datetime.date.today()
+    if year >= today.year:
+        raise ValueError(f"Only closed years can be archived (before {today.year}), not {year}")
+    partitioned = sql().name == "mysql"
+
+    own_connection = conn is None
+    if own_connection:
+        conn = getConnection()
+    cursor = None
+    archived = {table: 0 for table in PARTITIONED_TABLES}
+    try:
+        cursor = conn.cursor()
+        for month in _months(datetime.date(year, 1, 1), datetime.date(year, 12, 1)):
+            name = partition_name(month)
+            moved = {}
+            for table in PARTITIONED_TABLES:
+                if partitioned:
+                    if name not in {row[0] for row in get_partitions(cursor, table)}:
+                        continue
+                    # REPLACE: a re-run after the copy but before the drop copies the month again
+                    cursor.execute(f"REPLACE INTO {table}_archive "
+                                   f"SELECT * FROM {table} PARTITION ({name})")
+                    moved[table] = cursor.rowcount
+                    conn.commit()
+                    cursor.execute(f"ALTER TABLE {table} DROP PARTITION {name}")
+                else:
+                    bounds = (month, add_months(month, 1))
+                    cursor.execute(f"""
+                        INSERT INTO {table}_archive
+                        SELECT * FROM {table}
+                        WHERE transaction_date >= %s AND transaction_date < %s
+                    """, bounds)
+                    moved[table] = cursor.rowcount
+                    cursor.execute(f"""
+                        DELETE FROM {table}
+                        WHERE transaction_date >= %s AND transaction_date < %s
+                    """, bounds)
+                    conn.commit()
+
+            if any(moved.values()):
+                print(f"[Partitions] Archived {month:%Y-%m}: "
+                      + ", ".join(f"{rows} {table}" for table, rows in moved.items()))
+            for table, rows in moved.items():
+                archived[table] += rows
+        return archived
+    finally:
+        if cursor:
+            cursor.close()
+        if own_connection and conn:
+            conn.close()
@@ -0,0 +1,58 @@
+"""
+Payments.py
+Payment methods and split-tender allocation for checkout
+A sale can be paid with up to two tenders (e.g. part GCash, rest cash).
+Only cash can be over-tendered; change is always given in cash.
+"""
+
+CASH = "Cash"
+PAYMENT_METHODS = (CASH, "GCash")
+
+
+def allocate_tenders(total: float, tenders: list):
+    """
+    Split the bill over the tenders handed over
+    tenders: [(method, tendered_amount), ...] in the order entered
+    Returns: (payments, change) where payments is a list of dicts with
+             method, amount (applied to the bill), tendered, change
+    Raises: ValueError when the tenders do not cover the bill, a non-cash
+            tender is larger than what is left to pay, or cash is entered
+            for a bill the other tenders already cover
+    """
+    tenders = [(method, round(float(tendered), 2)) for method, tendered in tenders if tendered > 0]
+    if not tenders:
+        raise ValueError("No payment entered.")
+    unknown = [method for method, _ in tenders if method not in PAYMENT_METHODS]
+    if unknown:
+        raise ValueError(f"Unknown payment method: {unknown[0]}")
+
+    remaining = round(total, 2)
+    payments = []
+
+    # Exact-amount tenders first, so any over-payment lands on cash
+    for method, tendered in tenders:
+        if method == CASH:
+            continue
+        if tendered > remaining:
+            raise ValueError(f"{method} amount is more than the amount due.")
+        payments.append({'method': method, 'amount': tendered, 'tendered': tendered, 'change': 0.0})
+        remaining = round(remaining - tendered, 2)
+
+    cash_tendered = round(sum(tendered for method, tendered in tenders if method == CASH), 2)
+    if cash_tendered < remaining:
+        raise ValueError("Amount received is less than the total.")
+
+    if cash_tendered > 0 and remaining <= 0:
+        # A zero-amount cash row would still count as a tender in the breakdowns
+        raise ValueError("The bill is already paid - remove the cash amount.")
+
+    change = round(cash_tendered - remaining, 2)
+    if remaining > 0:
+        payments.append({'method': CASH, 'amount': remaining, 'tendered': cash_tendered,
+                         'change': change})
+    return payments, change
+
+
+def describe_methods(payments: list) -> str:
+    """'Cash', 'GCash' or 'GCash + Cash' for receipts and tables"""
+    return " + ".join(dict.fromkeys(payment['method'] for payment in payments))
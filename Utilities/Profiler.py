@@ -0,0 +1,123 @@
+"""
+Profiler.py
+On-demand cProfile capture for a running lane ("the POS is slow" reports)
+
+Two ways to capture, both saving a pstats file named after the time it
+started, e.g. logs/profiles/profile_20261019_091403_checkout.prof:
+    start(label) ... stop()     - everything in between (Main.py stops it
+                                  after PROFILE_SECONDS or on the hotkey)
+    arm(("checkout", "report")) - exactly the next span with one of those
+                                  names (Utilities/Telemetry.py), then disarm
+
+Only the thread that started the capture is profiled - the GUI thread, where
+controllers scan, check out and build reports. Work handed to report worker
+threads shows up as the time the GUI thread spent waiting for it.
+
+Read a capture with: python "Main Application/Profiles.py" show latest
+"""
+import cProfile
+import datetime
+import os
+import threading
+
+from Utilities.Settings import PROFILE_FOLDER
+from Utilities.Telemetry import get_telemetry
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profiles_folder() -> str:
+    return os.path.join(_ROOT, PROFILE_FOLDER)
+
+
+class Profiler:
+    """One capture at a time, started by hand or by the next matching span"""
+
+    def __init__(self):
+        self._profile = None
+        self._label = None
+        self._started_at = None
+        self._thread = None
+        self._armed = ()
+        self._span = None  # the span an armed capture is following
+        self._lock = threading.Lock()
+        self.on_saved = []  # callbacks(path) after each capture is written
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    @property
+    def armed(self) -> tuple:
+        return self._armed
+
+    def start(self, label: str = "manual") -> bool:
+        """Start profiling this thread; False if a capture is already running"""
+        with self._lock:
+            if self._profile is not None:
+                return False
+            self._profile = cProfile.Profile()
+            self._label = label
+            self._started_at = datetime.datetime.now()
+            self._thread = threading.get_ident()
+        self._profile.enable()
+        return True
+
+    def stop(self) -> str:
+        """
+        Stop the running capture (on the thread that started it) and save it
+        Returns: path of the saved profile, or None if nothing was running
+        """
+        with self._lock:
+            profile, self._profile = self._profile, None
+            if profile is None:
+                return None
+            if threading.get_ident() != self._thread:
+                self._profile = profile
+                raise RuntimeError("stop() must run on the thread that started the profile")
+        profile.disable()
+
+        os.makedirs(profiles_folder(), exist_ok=True)
+        path = os.path.join(profiles_folder(),
+                            f"profile_{self._started_at:%Y%m%d_%H%M%S}_{self._label}.prof")
+        profile.dump_stats(path)
+        for callback in list(self.on_saved):
+            callback(path)
+        return path
+
+    def arm(self, span_names=("checkout", "report")):
+        """Profile the next span with one of these names"""
+        self._armed = tuple(span_names)
+
+    def disarm(self):
+        self._armed = ()
+
+    # Telemetry span listener
+    def span_started(self, span):
+        if span.name in self._armed and self._span is None and self.start(span.name):
+            self._armed = ()
+            self._span = span
+
+    def span_finished(self, span, ok: bool):
+        if span is self._span:
+            self._span = None
+            self.stop()
+
+
+_profiler = Profiler()
+get_telemetry().listeners.append(_profiler)
+
+
+def get_profiler() -> Profiler:
+    """Process-wide profiler hooked into the telemetry spans"""
+    return _profiler
+
+
+def list_profiles() -> list:
+    """Saved profile paths, newest first"""
+    folder = profiles_folder()
+    if not os.path.isdir(folder):
+        return []
+    paths = [os.path.join(folder, name) for name in os.listdir(folder) if name.endswith(".prof")]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
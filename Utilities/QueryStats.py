@@ -0,0 +1,395 @@
+"""
+QueryStats.py
+Query-level instrumentation for every database call
+
+DatabaseConnection wraps each connection so every cursor.execute() is timed
+(execute + fetch), counted and filed under the name of the Model query
+builder that produced the SQL, e.g. "AdminReportsModel.get_daily_sales_report_query".
+Model builders keep their (query, params) contract: instrument_models() wraps
+them only to remember which builder returned which SQL text (look builders up
+on their class when called, not when a module loads, or the wrapper is
+missed). SQL written
+inline (migrations, scripts) is filed under its verb and table, e.g. "UPDATE transactions".
+
+Queries slower than SLOW_QUERY_MS are appended to SLOW_QUERY_LOG with their
+EXPLAIN plan. format_summary()/dump_summary() report latency histograms,
+row counts, server-side prepares and connection wait times per name, plus
+the connection circuit breaker's trips and recoveries (Utilities/Resilience.py).
+"""
+import bisect
+import datetime
+import functools
+import importlib
+import os
+import re
+import threading
+import time
+
+from Utilities.Dialect import sql as dialect
+from Utilities.Resilience import resilience_stats
+from Utilities.Settings import (
+    QUERY_INSTRUMENTATION, QUERY_STATS_REPORT, SLOW_QUERY_LOG, SLOW_QUERY_MS
+)
+
+
+# Model classes whose query builders are named in the statistics
+MODEL_CLASSES = [
+    ("Model.Authentication.LoginModel", "LoginModel"),
+    ("Model.AdminDashboardModel", "AdminDashboardModel"),
+    ("Model.ProductsModel", "AdminProductsModel"),
+    ("Model.ReportsModel", "AdminReportsModel"),
+    ("Model.ShiftSummaryModel", "ShiftSummaryModel"),
+    ("Model.TerminalModel", "TerminalModel"),
+    ("Model.TransactionModel", "TransactionModel"),
+    ("Model.UsersModel", "AdminUsersModel"),
+]
+
+# Latency histogram bucket upper bounds (ms); the last bucket is open-ended
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_INLINE_NAME = re.compile(r"^\s*(SELECT|INSERT\s+INTO|UPDATE|DELETE\s+FROM|CREATE\s+\w+|ALTER\s+TABLE|\w+)"
+                          r"(?:.*?\bFROM\s+(\w+)|\s+(\w+))?", re.IGNORECASE | re.DOTALL)
+
+
+class QueryStat:
+    """Latency histogram and totals for one query name"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.prepares = 0     # server-side prepares (Utilities/Statements.py)
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, elapsed_ms: float, rows: int, failed: bool = False):
+        self.count += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += max(rows, 0)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the given fraction of calls (capped at max)"""
+        target = fraction * self.count
+        seen = 0
+        for index, calls in enumerate(self.histogram):
+            seen += calls
+            if calls and seen >= target:
+                if index < len(HISTOGRAM_BOUNDS_MS):
+                    return min(HISTOGRAM_BOUNDS_MS[index], round(self.max_ms, 1))
+                return round(self.max_ms, 1)
+        return 0.0
+
+
+class QueryStats:
+    """Thread-safe registry of QueryStat per query name, plus connection waits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self.queries = {}
+        self.waits = {}       # connection source -> QueryStat (rows unused)
+        self.names = {}       # SQL text -> model builder name
+        self.started = datetime.datetime.now()
+
+    def name_for(self, sql: str) -> str:
+        name = self.names.get(sql)
+        if name is None:
+            match = _INLINE_NAME.match(sql)
+            if not match:
+                return "inline"
+            verb = " ".join(match.group(1).upper().split())
+            table = match.group(2) or match.group(3) or ""
+            name = f"{verb} {table}".strip()
+        return name
+
+    def rewritten(self, sql: str, original: str):
+        """File SQL derived from a builder's text (e.g. Partitions.with_archive) under its name"""
+        name = self.names.get(original)
+        if name is not None:
+            self.names[sql] = name
+
+    def record(self, name: str, elapsed_ms: float, rows: int, failed: bool = False):
+        with self._lock:
+            stat = self.queries.get(name)
+            if stat is None:
+                stat = self.queries[name] = QueryStat(name)
+            stat.add(elapsed_ms, rows, failed)
+
+    def record_prepare(self, name: str):
+        with self._lock:
+            stat = self.queries.get(name)
+            if stat is None:
+                stat = self.queries[name] = QueryStat(name)
+            stat.prepares += 1
+
+    def record_wait(self, source: str, elapsed_ms: float):
+        with self._lock:
+            stat = self.waits.get(source)
+            if stat is None:
+                stat = self.waits[source] = QueryStat(source)
+            stat.add(elapsed_ms, 0)
+
+    def reset(self):
+        with self._lock:
+            self.queries.clear()
+            self.waits.clear()
+            self.started = datetime.datetime.now()
+
+    # ============================================================
+    # SLOW QUERY LOG
+    # ============================================================
+
+    def log_slow(self, name: str, elapsed_ms: float, rows: int, sql: str, params, plan: list):
+        """Append one slow query (and its EXPLAIN rows) to SLOW_QUERY_LOG"""
+        lines = [
+            f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] {name}: {elapsed_ms:.1f} ms, {rows} rows",
+            "  " + " ".join(sql.split()),
+            f"  params: {params!r}",
+        ]
+        for row in plan:
+            lines.append("  explain: " + ", ".join(f"{key}={value}" for key, value in row.items()
+                                                   if value is not None))
+        path = os.path.join(_ROOT, SLOW_QUERY_LOG)
+        try:
+            with self._log_lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "a", encoding="utf-8") as log:
+                    log.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Could not write slow query log: {e}")
+
+    # ============================================================
+    # SUMMARY
+    # ============================================================
+
+    def format_summary(self) -> str:
+        """Plain-text report: one row per query name, slowest total first"""
+        with self._lock:
+            queries = sorted(self.queries.values(), key=lambda s: s.total_ms, reverse=True)
+            waits = sorted(self.waits.values(), key=lambda s: s.total_ms, reverse=True)
+
+        lines = [
+            f"Query statistics since {self.started:%Y-%m-%d %H:%M:%S}",
+            "",
+            f"{'Query':<58} {'Calls':>6} {'Prep':>5} {'Err':>4} {'Total ms':>10} {'Avg':>8} "
+            f"{'p50':>6} {'p95':>6} {'p99':>6} {'Max':>8} {'Rows':>8}",
+            "-" * 134,
+        ]
+        for stat in queries:
+            lines.append(
+                f"{stat.name[:58]:<58} {stat.count:>6} {stat.prepares:>5} {stat.errors:>4} "
+                f"{stat.total_ms:>10.1f} {stat.avg_ms:>8.2f} {stat.percentile(0.50):>6g} {stat.percentile(0.95):>6g} "
+                f"{stat.percentile(0.99):>6g} {stat.max_ms:>8.1f} {stat.rows:>8}")
+
+        if waits:
+            lines += ["", f"{'Connection wait':<58} {'Calls':>6} {'Total ms':>15} {'Avg':>8} {'Max':>8}",
+                      "-" * 100]
+            for stat in waits:
+                lines.append(f"{stat.name:<58} {stat.count:>6} {stat.total_ms:>15.1f} "
+                             f"{stat.avg_ms:>8.2f} {stat.max_ms:>8.1f}")
+
+        circuit = resilience_stats()
+        lines += ["", f"Connection circuit: {circuit['state']}, {circuit['trips']} trips, "
+                      f"{circuit['recoveries']} recoveries, {circuit['rejected']} calls failed fast, "
+                      f"{circuit['read_retries']} read retries"]
+        return "\n".join(lines)
+
+    def dump_summary(self, path: str = None) -> str:
+        """Write format_summary() to path (default QUERY_STATS_REPORT); returns the path"""
+        path = path or os.path.join(_ROOT, QUERY_STATS_REPORT)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as report:
+            report.write(self.format_summary() + "\n")
+        return path
+
+
+_stats = QueryStats()
+_models_instrumented = set()  # MODEL_CLASSES entries already wrapped
+_instrument_lock = threading.Lock()
+
+
+def get_query_stats() -> QueryStats:
+    """Process-wide statistics shared by every connection"""
+    return _stats
+
+
+# ============================================================
+# MODEL NAMING
+# ============================================================
+
+def _name_queries(name: str, builder):
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        result = builder(*args, **kwargs)
+        sql = result[0] if isinstance(result, tuple) else result
+        if isinstance(sql, str):
+            _stats.names[sql] = name
+        return result
+    return wrapper
+
+
+def instrument_models():
+    """
+    Wrap every Model query builder so its SQL is filed under its own name (once)
+    Runs when DatabaseConnection loads, before any builder is called; a Model
+    class still being imported then (it imports DatabaseConnection itself) is
+    wrapped on the next connection instead
+    """
+    if not QUERY_INSTRUMENTATION or len(_models_instrumented) == len(MODEL_CLASSES):
+        return
+    with _instrument_lock:
+        for module_name, class_name in MODEL_CLASSES:
+            if (module_name, class_name) in _models_instrumented:
+                continue
+            model = getattr(importlib.import_module(module_name), class_name, None)
+            if model is None:
+                continue
+            _models_instrumented.add((module_name, class_name))
+            for attr, value in list(vars(model).items()):
+                if isinstance(value, staticmethod) and (attr.endswith("_query") or attr.endswith("Query")):
+                    setattr(model, attr,
+                            staticmethod(_name_queries(f"{class_name}.{attr}", value.__func__)))
+
+
+# ============================================================
+# CONNECTION / CURSOR WRAPPERS
+# ============================================================
+
+class InstrumentedCursor:
+    """Cursor proxy that times execute + fetch of each statement"""
+
+    def __init__(self, cursor, connection):
+        self._cursor = cursor
+        self._connection = connection
+        self._pending = None  # [name, sql, params, elapsed_ms, rows, failed]
+
+    def __getattr__(self, attr):
+        return getattr(self._cursor, attr)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _finish(self):
+        """Record the statement once its results have been read (or abandoned)"""
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        name, sql, params, elapsed_ms, rows, failed = pending
+        if rows == 0 and not failed:
+            rows = max(getattr(self._cursor, "rowcount", 0) or 0, 0)
+        _stats.record(name, elapsed_ms, rows, failed)
+        if elapsed_ms >= SLOW_QUERY_MS and not failed:
+            _stats.log_slow(name, elapsed_ms, rows, sql, params, self._explain(sql, params))
+
+    def _explain(self, sql: str, params) -> list:
+        """EXPLAIN (QUERY PLAN) for a slow SELECT (empty if it cannot be obtained)"""
+        if not sql.lstrip().upper().startswith("SELECT"):
+            return []
+        try:
+            cursor = self._connection.cursor(dictionary=True, buffered=True)
+            try:
+                cursor.execute(dialect().explain + sql, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception:
+            return []
+
+    def _timed(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            if self._pending is not None:
+                self._pending[3] += (time.perf_counter() - started) * 1000
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._finish()
+        self._pending = [_stats.name_for(operation), operation, params, 0.0, 0, False]
+        try:
+            return self._timed(self._cursor.execute, operation, params, *args, **kwargs)
+        except Exception:
+            self._pending[5] = True
+            self._finish()
+            raise
+
+    def executemany(self, operation, seq_params):
+        self._finish()
+        self._pending = [_stats.name_for(operation), operation, None, 0.0, 0, False]
+        try:
+            return self._timed(self._cursor.executemany, operation, seq_params)
+        except Exception:
+            self._pending[5] = True
+            self._finish()
+            raise
+
+    def fetchone(self):
+        row = self._timed(self._cursor.fetchone)
+        if self._pending is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._pending[4] += 1
+        return row
+
+    def fetchmany(self, size=1):
+        rows = self._timed(self._cursor.fetchmany, size)
+        if self._pending is not None:
+            self._pending[4] += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(self._cursor.fetchall)
+        if self._pending is not None:
+            self._pending[4] += len(rows)
+            self._finish()
+        return rows
+
+    def flush(self):
+        """Record the last statement now (for cursors that are kept and reused)"""
+        self._finish()
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors are InstrumentedCursor"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __getattr__(self, attr):
+        return getattr(self._connection, attr)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs), self._connection)
+
+
+def instrument_connection(connection, source: str, wait_ms: float):
+    """
+    Wrap a new connection and record how long obtaining it took
+    ([features] query_instrumentation = false hands the connection back unwrapped)
+    """
+    if connection is None or not QUERY_INSTRUMENTATION:
+        return connection
+    instrument_models()
+    _stats.record_wait(source, wait_ms)
+    return InstrumentedConnection(connection)
@@ -0,0 +1,706 @@
+"""
+ReportRunner.py
+Headless report generation - runs AdminReportsModel reports without Qt
+Shared by the Reports window and the batch report command so both produce
+the same columns, summaries and PDF layout
+"""
+import csv
+import datetime
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from Utilities.DatabaseConnection import fetchAll, getPooledConnection
+from Utilities.Partitions import with_archive
+from Utilities.Resilience import retry_read
+from Utilities.Settings import REPORT_WORKERS
+from Utilities.Telemetry import span
+from Model.ReportsModel import AdminReportsModel
+
+
+# Report name -> AdminReportsModel query builder name (same names as the reportTypeCombo
+# entries). Builders are looked up by name when a report runs, so the wrapper
+# QueryStats.instrument_models() installs on the first connection is the one called
+REPORT_QUERIES = {
+    "Daily Sales Report": "get_daily_sales_report_query",
+    "Shift Summary Report": "get_shift_summary_report_query",
+    "Cashier Performance Report": "get_cashier_performance_report_query",
+    "Product Sales Report": "get_product_sales_report_query",
+    "Discount Usage Report": "get_discount_usage_report_query",
+    "Hourly Sales Report": "get_hourly_sales_distribution_query",
+    "Category Performance Report": "get_category_performance_query",
+    "Top Selling Products Report": "get_top_selling_products_query",
+    "Payment Method Report": "get_payment_method_breakdown_query",
+}
+
+# Comparison modes offered next to the date range
+COMPARE_MODES = ("None", "Previous Period", "Same Period Last Year")
+
+# Base report -> (comparison report type, single-scan comparison query builder name)
+COMPARISON_REPORTS = {
+    "Daily Sales Report": ("Daily Sales Comparison",
+                           "get_daily_sales_comparison_query"),
+    "Product Sales Report": ("Product Sales Comparison",
+                             "get_product_sales_comparison_query"),
+    "Cashier Performance Report": ("Cashier Performance Comparison",
+                                   "get_cashier_performance_comparison_query"),
+}
+
+# reportTypeCombo entry that generates every report as one package
+ALL_REPORTS = "All Reports (Package)"
+
+# Rows per page when tables are rendered into the combined PDF
+PDF_ROWS_PER_PAGE = 25
+
+REPORT_COLUMNS = {
+    "Daily Sales Report": ["Date", "Transactions", "Gross Sales", "Discounts", "Net Sales"],
+    "Shift Summary Report": ["Date", "Cashier", "Shift", "Transactions", "Total Sales", "Discounts"],
+    "Cashier Performance Report": ["Cashier", "Transactions", "Total Sales", "Avg Transaction", "Efficiency"],
+    "Product Sales Report": ["Product Name", "Category", "Qty Sold", "Revenue", "Avg Price"],
+    "Discount Usage Report": ["Discount Type", "Usage Count", "Total Discount", "Avg Discount", "% of Total"],
+    "Hourly Sales Report": ["Hour", "Transactions", "Total Sales", "Avg Transaction"],
+    "Category Performance Report": ["Category", "Products", "Items Sold", "Revenue"],
+    "Top Selling Products Report": ["Rank", "Product Name", "Qty Sold", "Revenue"],
+    "Payment Method Report": ["Payment Method", "Payments", "Amount", "% of Total"],
+    "Daily Sales Comparison": ["Date", "Transactions", "Sales", "Prev Date",
+                               "Prev Transactions", "Prev Sales", "Change", "Growth"],
+    "Product Sales Comparison": ["Product Name", "Category", "Qty Sold", "Prev Qty",
+                                 "Revenue", "Prev Revenue", "Change", "Growth"],
+    "Cashier Performance Comparison": ["Cashier", "Transactions", "Prev Transactions",
+                                       "Sales", "Prev Sales", "Change", "Growth"],
+}
+
+
+def report_slug(report_type: str) -> str:
+    """'Daily Sales Report' -> 'daily-sales' (used for CLI names and file names)"""
+    return report_type.lower().replace(" report", "").replace(" ", "-")
+
+
+def resolve_report_type(name: str) -> str:
+    """Accept either the display name or the slug of a report"""
+    for report_type in REPORT_QUERIES:
+        if name == report_type or name == report_slug(report_type):
+            return report_type
+    raise ValueError(f"Unknown report type: {name}")
+
+
+# ============================================================
+# QUERY EXECUTION
+# ============================================================
+
+def fetch_report_rows(report_type: str, from_date: date, to_date: date, conn=None,
+                      include_archive: bool = False) -> list:
+    """
+    Execute the report query and return the raw rows (list of dicts)
+    Opens its own connection (retrying on a dropped connection) unless one is passed in
+    include_archive also reads years moved to the archive tables (Utilities/Partitions.py)
+    """
+    query, params = getattr(AdminReportsModel, REPORT_QUERIES[report_type])(from_date, to_date)
+    if include_archive:
+        query = with_archive(query)
+    return fetchAll(query, params, conn)
+
+
+def fetch_all_reports(from_date: date, to_date: date, report_types=None,
+                      max_workers: int = REPORT_WORKERS,
+                      include_archive: bool = False):
+    """
+    Fan the report queries out concurrently, one pooled connection per worker
+    Returns: (results, timings, wall_clock)
+        results  - {report_type: rows}
+        timings  - {report_type: seconds spent on that report}
+        wall_clock - total seconds for the whole package
+    """
+    report_types = list(report_types or REPORT_QUERIES)
+
+    def read(report_type):
+        conn = getPooledConnection(pool_size=max_workers)
+        try:
+            return fetch_report_rows(report_type, from_date, to_date, conn=conn,
+                                     include_archive=include_archive)
+        finally:
+            conn.close()  # Returns the connection to the pool
+
+    def run_one(report_type):
+        started = time.perf_counter()
+        rows = retry_read(read, report_type)
+        return rows, time.perf_counter() - started
+
+    started = time.perf_counter()
+    results, timings = {}, {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(report_types))) as pool:
+        futures = {report_type: pool.submit(run_one, report_type) for report_type in report_types}
+        for report_type, future in futures.items():
+            results[report_type], timings[report_type] = future.result()
+
+    return results, timings, time.perf_counter() - started
+
+
+def comparison_period(from_date: date, to_date: date, mode: str):
+    """
+    Period to compare a date range against
+    Returns: (previous_from, previous_to)
+    Raises: ValueError when the periods would overlap (a year-on-year comparison
+            of more than a year) - the comparison queries give each sale to one
+            period only, so the previous figures would be wrong
+    """
+    if mode == "Previous Period":
+        length = to_date - from_date + datetime.timedelta(days=1)
+        return from_date - length, to_date - length
+
+    if mode == "Same Period Last Year":
+        def last_year(d):
+            try:
+                return d.replace(year=d.year - 1)
+            except ValueError:  # Feb 29
+                return d.replace(year=d.year - 1, day=28)
+        previous_from, previous_to = last_year(from_date), last_year(to_date)
+        if previous_to >= from_date:
+            raise ValueError("Same Period Last Year needs a range of one year or less "
+                             f"({from_date:%Y-%m-%d} to {to_date:%Y-%m-%d} would overlap "
+                             "the period it is compared with).")
+        return previous_from, previous_to
+
+    raise ValueError(f"Unknown comparison mode: {mode}")
+
+
+def fetch_comparison_rows(report_type: str, from_date: date, to_date: date, mode: str,
+                          conn=None, include_archive: bool = False):
+    """
+    Run the comparison variant of a report: both periods in one grouped scan,
+    then change and growth per row
+    Returns: (comparison report type, rows)
+    """
+    comparison_type, builder_name = COMPARISON_REPORTS[report_type]
+    query_builder = getattr(AdminReportsModel, builder_name)
+    previous_from, previous_to = comparison_period(from_date, to_date, mode)
+
+    def bounds(start, end):
+        return (datetime.datetime.combine(start, datetime.time.min),
+                datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time.min))
+
+    query, params = query_builder(*bounds(from_date, to_date), *bounds(previous_from, previous_to))
+    if include_archive:
+        query = with_archive(query)
+    rows = fetchAll(query, params, conn)
+
+    metric = "revenue" if comparison_type == "Product Sales Comparison" else "sales"
+    for row in rows:
+        current = float(row[f'current_{metric}'] or 0)
+        previous = float(row[f'previous_{metric}'] or 0)
+        row['change'] = current - previous
+        row['growth'] = (current - previous) / previous * 100 if previous else None
+
+        if comparison_type == "Daily Sales Comparison":
+            offset = datetime.timedelta(days=int(row['day_offset']))
+            row['sale_date'] = from_date + offset
+            row['previous_date'] = previous_from + offset
+
+    return comparison_type, rows
+
+
+# ============================================================
+# FORMATTING
+# ============================================================
+
+def _format_growth(growth) -> str:
+    return "New" if growth is None else f"{growth:+.1f}%"
+
+
+def format_report_rows(report_type: str, rows: list):
+    """
+    Convert raw rows into display rows
+    Returns: (columns, data)
+    """
+    columns = REPORT_COLUMNS[report_type]
+    data = []
+
+    if report_type == "Daily Sales Report":
+        for row in rows:
+            data.append([
+                row['sale_date'].strftime("%Y-%m-%d"),
+                str(row['transaction_count']),
+                f"PHP {row['gross_sales']:.2f}",
+                f"PHP {row['total_discounts']:.2f}",
+                f"PHP {row['net_sales']:.2f}"
+            ])
+
+    elif report_type == "Shift Summary Report":
+        for row in rows:
+            data.append([
+                row['shift_date'].strftime("%Y-%m-%d"),
+                row['cashier_name'],
+                row['shift'].capitalize(),
+                str(row['transaction_count']),
+                f"PHP {row['total_sales']:.2f}",
+                f"PHP {row['total_discounts']:.2f}"
+            ])
+
+    elif report_type == "Cashier Performance Report":
+        for row in rows:
+            avg_trans = float(row['avg_transaction'])
+            efficiency = "High" if avg_trans > 500 else "Medium" if avg_trans > 200 else "Low"
+            data.append([
+                row['cashier_name'],
+                str(row['transaction_count']),
+                f"PHP {row['total_sales']:.2f}",
+                f"PHP {avg_trans:.2f}",
+                efficiency
+            ])
+
+    elif report_type == "Product Sales Report":
+        for row in rows:
+            data.append([
+                row['product_name'],
+                row['category_name'],
+                str(row['quantity_sold']),
+                f"PHP {row['revenue']:.2f}",
+                f"PHP {row['avg_price']:.2f}"
+            ])
+
+    elif report_type == "Discount Usage Report":
+        # Calculate total discount for percentage
+        total_discount = sum(float(row['total_discount_amount'] or 0) for row in rows)
+        for row in rows:
+            discount_amt = float(row['total_discount_amount'] or 0)
+            percentage = (discount_amt / total_discount * 100) if total_discount > 0 else 0
+            data.append([
+                row['discount_type'] or "None",
+                str(row['usage_count']),
+                f"PHP {discount_amt:.2f}",
+                f"PHP {row['avg_discount']:.2f}",
+                f"{percentage:.1f}%"
+            ])
+
+    elif report_type == "Hourly Sales Report":
+        for row in rows:
+            count = int(row['transaction_count'])
+            total = float(row['total_sales'] or 0)
+            hour = int(row['hour'])
+            data.append([
+                f"{hour % 12 or 12}:00 {'AM' if hour < 12 else 'PM'}",
+                str(count),
+                f"PHP {total:.2f}",
+                f"PHP {total / count if count else 0:.2f}"
+            ])
+
+    elif report_type == "Category Performance Report":
+        for row in rows:
+            data.append([
+                row['category_name'],
+                str(row['product_count']),
+                f"{float(row['items_sold'] or 0):,.0f}",
+                f"PHP {row['revenue']:.2f}"
+            ])
+
+    elif report_type == "Top Selling Products Report":
+        for rank, row in enumerate(rows, 1):
+            data.append([
+                str(rank),
+                row['product_name'],
+                f"{float(row['total_quantity'] or 0):,.0f}",
+                f"PHP {row['total_revenue']:.2f}"
+            ])
+
+    elif report_type == "Payment Method Report":
+        total_amount = sum(float(row['total_amount'] or 0) for row in rows)
+        for row in rows:
+            amount = float(row['total_amount'] or 0)
+            percentage = (amount / total_amount * 100) if total_amount > 0 else 0
+            data.append([
+                row['payment_method'],
+                str(row['transaction_count']),
+                f"PHP {amount:.2f}",
+                f"{percentage:.1f}%"
+            ])
+
+    elif report_type == "Daily Sales Comparison":
+        for row in rows:
+            data.append([
+                row['sale_date'].strftime("%Y-%m-%d"),
+                str(int(row['current_transactions'])),
+                f"PHP {row['current_sales']:.2f}",
+                row['previous_date'].strftime("%Y-%m-%d"),
+                str(int(row['previous_transactions'])),
+                f"PHP {row['previous_sales']:.2f}",
+                f"PHP {row['change']:+.2f}",
+                _format_growth(row['growth'])
+            ])
+
+    elif report_type == "Product Sales Comparison":
+        for row in rows:
+            data.append([
+                row['product_name'],
+                row['category_name'],
+                f"{float(row['current_quantity'] or 0):,.0f}",
+                f"{float(row['previous_quantity'] or 0):,.0f}",
+                f"PHP {row['current_revenue']:.2f}",
+                f"PHP {row['previous_revenue']:.2f}",
+                f"PHP {row['change']:+.2f}",
+                _format_growth(row['growth'])
+            ])
+
+    elif report_type == "Cashier Performance Comparison":
+        for row in rows:
+            data.append([
+                row['cashier_name'],
+                str(int(row['current_transactions'])),
+                str(int(row['previous_transactions'])),
+                f"PHP {row['current_sales']:.2f}",
+                f"PHP {row['previous_sales']:.2f}",
+                f"PHP {row['change']:+.2f}",
+                _format_growth(row['growth'])
+            ])
+
+    return columns, data
+
+
+def build_summary_text(report_type: str, rows: list) -> str:
+    """Generate summary statistics text"""
+    summary_lines = []
+    summary_lines.append(f"Report: {report_type}")
+    summary_lines.append(f"Total Records: {len(rows)}")
+    summary_lines.append("-" * 50)
+
+    if not rows:
+        summary_lines.append("No data found for the selected period")
+        return "\n".join(summary_lines)
+
+    if report_type == "Daily Sales Report":
+        total_trans = sum(int(row['transaction_count']) for row in rows)
+        total_gross = sum(float(row['gross_sales']) for row in rows)
+        total_discounts = sum(float(row['total_discounts']) for row in rows)
+        total_net = sum(float(row['net_sales']) for row in rows)
+
+        summary_lines.append(f"Total Transactions: {total_trans}")
+        summary_lines.append(f"Total Gross Sales: PHP {total_gross:,.2f}")
+        summary_lines.append(f"Total Discounts: PHP {total_discounts:,.2f}")
+        summary_lines.append(f"Total Net Sales: PHP {total_net:,.2f}")
+        summary_lines.append(f"Average Daily Sales: PHP {total_net / len(rows):,.2f}")
+
+    elif report_type == "Shift Summary Report":
+        total_trans = sum(int(row['transaction_count']) for row in rows)
+        total_sales = sum(float(row['total_sales']) for row in rows)
+
+        summary_lines.append(f"Total Shifts: {len(rows)}")
+        summary_lines.append(f"Total Transactions: {total_trans}")
+        summary_lines.append(f"Total Sales: PHP {total_sales:,.2f}")
+        summary_lines.append(f"Average per Shift: PHP {total_sales / len(rows):,.2f}")
+
+    elif report_type == "Cashier Performance Report":
+        total_trans = sum(int(row['transaction_count']) for row in rows)
+        total_sales = sum(float(row['total_sales']) for row in rows)
+
+        top_cashier = max(rows, key=lambda x: float(x['total_sales']))
+
+        summary_lines.append(f"Total Cashiers: {len(rows)}")
+        summary_lines.append(f"Total Transactions: {total_trans}")
+        summary_lines.append(f"Total Sales: PHP {total_sales:,.2f}")
+        summary_lines.append(f"Top Performer: {top_cashier['cashier_name']}")
+        summary_lines.append(f"  Sales: PHP {top_cashier['total_sales']:,.2f}")
+
+    elif report_type == "Product Sales Report":
+        total_qty = sum(int(row['quantity_sold']) for row in rows)
+        total_revenue = sum(float(row['revenue']) for row in rows)
+
+        top_product = max(rows, key=lambda x: float(x['revenue']))
+
+        summary_lines.append(f"Total Products: {len(rows)}")
+        summary_lines.append(f"Total Quantity Sold: {total_qty}")
+        summary_lines.append(f"Total Revenue: PHP {total_revenue:,.2f}")
+        summary_lines.append(f"Best Seller: {top_product['product_name']}")
+        summary_lines.append(f"  Revenue: PHP {top_product['revenue']:,.2f}")
+
+    elif report_type == "Discount Usage Report":
+        total_usage = sum(int(row['usage_count']) for row in rows)
+        total_discount = sum(float(row['total_discount_amount']) for row in rows)
+
+        summary_lines.append(f"Discount Types: {len(rows)}")
+        summary_lines.append(f"Total Usage: {total_usage}")
+        summary_lines.append(f"Total Discount Amount: PHP {total_discount:,.2f}")
+        summary_lines.append(f"Average Discount: PHP {total_discount / total_usage:,.2f}")
+
+    elif report_type == "Hourly Sales Report":
+        total_trans = sum(int(row['transaction_count']) for row in rows)
+        total_sales = sum(float(row['total_sales'] or 0) for row in rows)
+        peak = max(rows, key=lambda x: float(x['total_sales'] or 0))
+
+        summary_lines.append(f"Active Hours: {len(rows)}")
+        summary_lines.append(f"Total Transactions: {total_trans}")
+        summary_lines.append(f"Total Sales: PHP {total_sales:,.2f}")
+        summary_lines.append(f"Peak Hour: {int(peak['hour']):02d}:00")
+        summary_lines.append(f"  Sales: PHP {float(peak['total_sales']):,.2f}")
+
+    elif report_type == "Category Performance Report":
+        total_items = sum(float(row['items_sold'] or 0) for row in rows)
+        total_revenue = sum(float(row['revenue'] or 0) for row in rows)
+        top_category = max(rows, key=lambda x: float(x['revenue'] or 0))
+
+        summary_lines.append(f"Categories: {len(rows)}")
+        summary_lines.append(f"Total Items Sold: {total_items:,.0f}")
+        summary_lines.append(f"Total Revenue: PHP {total_revenue:,.2f}")
+        summary_lines.append(f"Top Category: {top_category['category_name']}")
+        summary_lines.append(f"  Revenue: PHP {float(top_category['revenue']):,.2f}")
+
+    elif report_type == "Top Selling Products Report":
+        total_qty = sum(float(row['total_quantity'] or 0) for row in rows)
+        total_revenue = sum(float(row['total_revenue'] or 0) for row in rows)
+
+        summary_lines.append(f"Products Listed: {len(rows)}")
+        summary_lines.append(f"Combined Quantity: {total_qty:,.0f}")
+        summary_lines.append(f"Combined Revenue: PHP {total_revenue:,.2f}")
+        summary_lines.append(f"Best Seller: {rows[0]['product_name']}")
+
+    elif report_type == "Payment Method Report":
+        total_payments = sum(int(row['transaction_count']) for row in rows)
+        total_amount = sum(float(row['total_amount'] or 0) for row in rows)
+
+        summary_lines.append(f"Payment Methods: {len(rows)}")
+        summary_lines.append(f"Total Payments: {total_payments}")
+        summary_lines.append(f"Total Collected: PHP {total_amount:,.2f}")
+        summary_lines.append(f"Most Used: {rows[0]['payment_method']}")
+
+    elif report_type in ("Daily Sales Comparison", "Product Sales Comparison",
+                         "Cashier Performance Comparison"):
+        metric = "revenue" if report_type == "Product Sales Comparison" else "sales"
+        current = sum(float(row[f'current_{metric}'] or 0) for row in rows)
+        previous = sum(float(row[f'previous_{metric}'] or 0) for row in rows)
+        growth = (current - previous) / previous * 100 if previous else None
+
+        summary_lines.append(f"Current Period {metric.title()}: PHP {current:,.2f}")
+        summary_lines.append(f"Previous Period {metric.title()}: PHP {previous:,.2f}")
+        summary_lines.append(f"Change: PHP {current - previous:+,.2f} ({_format_growth(growth)})")
+
+        if report_type != "Daily Sales Comparison":
+            best = max(rows, key=lambda x: x['change'])
+            worst = min(rows, key=lambda x: x['change'])
+            name_key = "product_name" if report_type == "Product Sales Comparison" else "cashier_name"
+            summary_lines.append(f"Biggest Gain: {best[name_key]} (PHP {best['change']:+,.2f})")
+            summary_lines.append(f"Biggest Drop: {worst[name_key]} (PHP {worst['change']:+,.2f})")
+
+    return "\n".join(summary_lines)
+
+
+# ============================================================
+# OUTPUT
+# ============================================================
+
+def write_csv(filename: str, report_type: str, rows: list):
+    """Write the formatted report table to a CSV file"""
+    columns, data = format_report_rows(report_type, rows)
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(data)
+
+
+def write_pdf(filename: str, report_type: str, rows: list, from_date: date, to_date: date):
+    """
+    Generate PDF report using matplotlib
+    Uses Figure directly (no pyplot) so it works without a GUI backend
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with PdfPages(filename) as pdf:
+        fig = Figure(figsize=(11, 8.5))
+
+        # Header
+        fig.text(0.5, 0.95, "SYPOINT POS SYSTEM", ha='center', fontsize=20,
+                 fontweight='bold')
+        fig.text(0.5, 0.92, report_type, ha='center', fontsize=16,
+                 fontweight='bold')
+
+        # Date range
+        fig.text(0.5, 0.88,
+                 f"Period: {from_date.strftime('%b %d, %Y')} to {to_date.strftime('%b %d, %Y')}",
+                 ha='center', fontsize=11)
+
+        # Generated date
+        now = datetime.datetime.now()
+        fig.text(0.5, 0.85, f"Generated: {now.strftime('%B %d, %Y %I:%M %p')}",
+                 ha='center', fontsize=10, style='italic', color='gray')
+
+        # Summary statistics
+        summary_text = build_summary_text(report_type, rows)
+        fig.text(0.1, 0.75, summary_text, fontsize=10, family='monospace',
+                 verticalalignment='top')
+
+        # Footer
+        fig.text(0.5, 0.05, "This is a computer-generated report", ha='center',
+                 fontsize=8, style='italic', color='gray')
+
+        pdf.savefig(fig, bbox_inches='tight')
+
+
+def write_combined_pdf(filename: str, results: dict, from_date: date, to_date: date,
+                       timings: dict = None, wall_clock: float = None):
+    """
+    Write every report into one PDF: a cover page with the package summary,
+    then each report's summary and table (split over pages as needed)
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    period = f"Period: {from_date.strftime('%b %d, %Y')} to {to_date.strftime('%b %d, %Y')}"
+    now = datetime.datetime.now()
+
+    with PdfPages(filename) as pdf:
+        # Cover page
+        fig = Figure(figsize=(11, 8.5))
+        fig.text(0.5, 0.95, "SYPOINT POS SYSTEM", ha='center', fontsize=20,
+                 fontweight='bold')
+        fig.text(0.5, 0.92, "Report Package", ha='center', fontsize=16,
+                 fontweight='bold')
+        fig.text(0.5, 0.88, period, ha='center', fontsize=11)
+        fig.text(0.5, 0.85, f"Generated: {now.strftime('%B %d, %Y %I:%M %p')}",
+                 ha='center', fontsize=10, style='italic', color='gray')
+
+        contents = [f"{'Report':<30}{'Records':>10}{'Time':>10}", "-" * 50]
+        for report_type, rows in results.items():
+            seconds = f"{timings[report_type]:.2f}s" if timings else ""
+            contents.append(f"{report_type:<30}{len(rows):>10}{seconds:>10}")
+        if wall_clock is not None:
+            contents.append("-" * 50)
+            contents.append(f"Total wall-clock: {wall_clock:.2f}s")
+        fig.text(0.1, 0.75, "\n".join(contents), fontsize=10, family='monospace',
+                 verticalalignment='top')
+        pdf.savefig(fig, bbox_inches='tight')
+
+        # One section per report
+        for report_type, rows in results.items():
+            columns, data = format_report_rows(report_type, rows)
+            pages = [data[i:i + PDF_ROWS_PER_PAGE]
+                     for i in range(0, len(data), PDF_ROWS_PER_PAGE)] or [[]]
+
+            for page_number, page in enumerate(pages, 1):
+                fig = Figure(figsize=(11, 8.5))
+                fig.text(0.5, 0.95, report_type, ha='center', fontsize=16,
+                         fontweight='bold')
+                fig.text(0.5, 0.92, f"{period}  (page {page_number} of {len(pages)})",
+                         ha='center', fontsize=10)
+
+                if page_number == 1:
+                    fig.text(0.1, 0.88, build_summary_text(report_type, rows), fontsize=9,
+                             family='monospace', verticalalignment='top')
+
+                if page:
+                    ax = fig.add_axes([0.05, 0.05, 0.9, 0.5 if page_number == 1 else 0.82])
+                    ax.axis('off')
+                    table = ax.table(cellText=page, colLabels=columns, loc='upper center',
+                                     cellLoc='center')
+                    table.auto_set_font_size(False)
+                    table.set_fontsize(8)
+
+                pdf.savefig(fig)
+
+
+def write_workbook(filename: str, results: dict) -> str:
+    """
+    Write every report into one workbook, one sheet per report
+    Uses openpyxl when it is installed; otherwise writes a .zip of CSV files
+    Returns: path actually written
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        Workbook = None
+
+    if Workbook is None:
+        filename = os.path.splitext(filename)[0] + ".zip"
+        with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+            for report_type, rows in results.items():
+                columns, data = format_report_rows(report_type, rows)
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(columns)
+                writer.writerows(data)
+                archive.writestr(f"{report_slug(report_type)}.csv", buffer.getvalue())
+        return filename
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for report_type, rows in results.items():
+        columns, data = format_report_rows(report_type, rows)
+        sheet = workbook.create_sheet(report_type.replace(" Report", "")[:31])
+        sheet.append(columns)
+        for row in data:
+            sheet.append(row)
+    workbook.save(filename)
+    return filename
+
+
+def report_filename(report_type: str, from_date: date, to_date: date, extension: str,
+                    compare: str = "None") -> str:
+    """
+    Default file name for a generated report
+    A comparison mode is part of the name (..._vs-previous-period), so the same
+    report compared two ways does not overwrite itself
+    """
+    report_type_safe = report_type.replace(" ", "_")
+    mode = "" if compare == "None" else f"_vs-{compare.lower().replace(' ', '-')}"
+    return (f"SyPoint_{report_type_safe}_{from_date.strftime('%Y%m%d')}"
+            f"-{to_date.strftime('%Y%m%d')}{mode}.{extension}")
+
+
+def run_report(report_type: str, from_date: date, to_date: date,
+               output_dir: str = "reports", formats=("csv", "pdf"), compare: str = "None",
+               include_archive: bool = False) -> list:
+    """
+    Run one report end to end: query, then write each requested format
+    compare selects a comparison variant (see COMPARE_MODES)
+    include_archive also reads archived years
+    Module-level so it can be submitted to a process pool
+    Returns: list of written file paths
+    """
+    with span("report", report_type=report_type, compare=compare,
+              days=(to_date - from_date).days + 1, formats=list(formats)) as s:
+        if compare != "None":
+            report_type, rows = fetch_comparison_rows(report_type, from_date, to_date, compare,
+                                                      include_archive=include_archive)
+        else:
+            rows = fetch_report_rows(report_type, from_date, to_date,
+                                     include_archive=include_archive)
+        s.set(rows=len(rows))
+
+        os.makedirs(output_dir, exist_ok=True)
+        written = []
+        for fmt in formats:
+            filepath = os.path.join(output_dir,
+                                    report_filename(report_type, from_date, to_date, fmt,
+                                                    compare))
+            if fmt == "csv":
+                write_csv(filepath, report_type, rows)
+            elif fmt == "pdf":
+                write_pdf(filepath, report_type, rows, from_date, to_date)
+            else:
+                raise ValueError(f"Unsupported report format: {fmt}")
+            written.append(filepath)
+
+    return written
+
+
+def run_report_package(from_date: date, to_date: date, output_dir: str = "reports",
+                       report_types=None, max_workers: int = REPORT_WORKERS,
+                       include_archive: bool = False):
+    """
+    Generate every report concurrently and assemble the combined PDF and workbook
+    Returns: (written file paths, timings, wall_clock)
+    """
+    with span("report", report_type=ALL_REPORTS, days=(to_date - from_date).days + 1,
+              workers=max_workers):
+        results, timings, wall_clock = fetch_all_reports(from_date, to_date, report_types,
+                                                         max_workers, include_archive)
+
+        os.makedirs(output_dir, exist_ok=True)
+        pdf_path = os.path.join(output_dir,
+                                report_filename("Report Package", from_date, to_date, "pdf"))
+        write_combined_pdf(pdf_path, results, from_date, to_date, timings, wall_clock)
+        workbook_path = write_workbook(
+            os.path.join(output_dir, report_filename("Report Package", from_date, to_date, "xlsx")),
+            results)
+
+    return [pdf_path, workbook_path], timings, wall_clock
@@ -0,0 +1,119 @@
+"""
+ReportScheduler.py
+Built-in scheduler for off-hours report runs
+End-of-day jobs cover the previous day, end-of-month jobs cover the previous month
+Each due report is executed in a process pool so heavy reports run in parallel
+"""
+import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Utilities.ReportRunner import REPORT_QUERIES, run_report
+
+
+SCHEDULES = ("end-of-day", "end-of-month")
+
+
+def report_period(schedule: str, run_date: datetime.date):
+    """
+    Date range a scheduled run covers
+    Returns: (from_date, to_date)
+    """
+    if schedule == "end-of-day":
+        day = run_date - datetime.timedelta(days=1)
+        return day, day
+    if schedule == "end-of-month":
+        last_month_end = run_date.replace(day=1) - datetime.timedelta(days=1)
+        return last_month_end.replace(day=1), last_month_end
+    raise ValueError(f"Unknown schedule: {schedule}")
+
+
+def next_run_time(schedule: str, now: datetime.datetime, run_at: datetime.time) -> datetime.datetime:
+    """Next time the schedule fires strictly after now"""
+    if schedule == "end-of-day":
+        candidate = datetime.datetime.combine(now.date(), run_at)
+        if candidate <= now:
+            candidate += datetime.timedelta(days=1)
+        return candidate
+
+    if schedule == "end-of-month":
+        candidate = datetime.datetime.combine(now.date().replace(day=1), run_at)
+        if candidate <= now:
+            # First day of next month
+            next_month = (now.date().replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+            candidate = datetime.datetime.combine(next_month, run_at)
+        return candidate
+
+    raise ValueError(f"Unknown schedule: {schedule}")
+
+
+class ReportScheduler:
+    """
+    Runs report jobs on end-of-day / end-of-month schedules
+    A job is (schedule, report_types, formats)
+    """
+
+    def __init__(self, jobs: list, output_dir: str = "reports",
+                 run_at: datetime.time = datetime.time(1, 0), max_workers: int = 2):
+        for schedule, _, _ in jobs:
+            if schedule not in SCHEDULES:
+                raise ValueError(f"Unknown schedule: {schedule}")
+
+        self.jobs = jobs
+        self.output_dir = output_dir
+        self.run_at = run_at
+        self.max_workers = max_workers
+
+        now = datetime.datetime.now()
+        self.next_runs = {schedule: next_run_time(schedule, now, run_at)
+                          for schedule, _, _ in jobs}
+
+    def run_due(self, now: datetime.datetime) -> list:
+        """Run every job whose next run time has passed; returns written files"""
+        due = [job for job in self.jobs if self.next_runs[job[0]] <= now]
+        if not due:
+            return []
+
+        written = self.run_jobs(due, now.date())
+
+        for schedule, _, _ in due:
+            self.next_runs[schedule] = next_run_time(schedule, now, self.run_at)
+
+        return written
+
+    def run_jobs(self, jobs: list, run_date: datetime.date) -> list:
+        """Execute the given jobs for run_date in a process pool"""
+        written = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {}
+            for schedule, report_types, formats in jobs:
+                from_date, to_date = report_period(schedule, run_date)
+                for report_type in report_types or REPORT_QUERIES.keys():
+                    future = pool.submit(run_report, report_type, from_date, to_date,
+                                         self.output_dir, formats)
+                    futures[future] = (schedule, report_type)
+
+            for future in as_completed(futures):
+                schedule, report_type = futures[future]
+                try:
+                    paths = future.result()
+                    written.extend(paths)
+                    print(f"[ReportScheduler] {schedule} {report_type}: {', '.join(paths)}")
+                except Exception as e:
+                    print(f"[ReportScheduler] {schedule} {report_type} failed: {e}")
+
+        return written
+
+    def run_forever(self, poll_seconds: int = 30):
+        """Block and run jobs as they come due"""
+        for schedule, run_time in sorted(self.next_runs.items(), key=lambda x: x[1]):
+            print(f"[ReportScheduler] Next {schedule} run at {run_time:%Y-%m-%d %H:%M}")
+
+        while True:
+            now = datetime.datetime.now()
+            if self.run_due(now):
+                for schedule, run_time in self.next_runs.items():
+                    print(f"[ReportScheduler] Next {schedule} run at {run_time:%Y-%m-%d %H:%M}")
+
+            sleep_for = (min(self.next_runs.values()) - datetime.datetime.now()).total_seconds()
+            time.sleep(max(1, min(poll_seconds, sleep_for)))
@@ -0,0 +1,228 @@
+"""
+Resilience.py
+Fail-fast database access for the lanes
+
+    CircuitBreaker - wraps every connect (Utilities/DatabaseConnection.py).
+                     After BREAKER_FAILURES connection failures in a row the
+                     circuit opens and connects fail at once with
+                     DatabaseUnavailable instead of waiting out a TCP timeout;
+                     after BREAKER_RESET_SECONDS one probe is let through
+                     (half open) and its result closes or re-opens the circuit
+    retry_read()   - runs an idempotent read again with jittered exponential
+                     backoff when the connection drops or a lock wait times out,
+                     within RETRY_BUDGET_MS; a connection lost mid-read also
+                     counts as a breaker failure
+
+Writes (checkout, stock, users) are never retried here: a lost connection
+mid-commit leaves their outcome unknown. Trips, recoveries, rejected calls and
+retries are counted for the query statistics summary (resilience_stats()).
+"""
+import random
+import threading
+import time
+
+from mysql.connector import Error, InterfaceError, errorcode
+from mysql.connector.errors import ReadTimeoutError, WriteTimeoutError
+
+from Utilities.Settings import (
+    BREAKER_FAILURES, BREAKER_RESET_SECONDS, RETRY_ATTEMPTS, RETRY_BASE_MS, RETRY_BUDGET_MS,
+    RETRY_MAX_MS
+)
+
+
+# The server could not be reached or the session was lost
+CONNECTION_ERRNOS = {
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+}
+# Worth running a read again: the connection errors plus lock contention
+RETRYABLE_ERRNOS = CONNECTION_ERRNOS | {errorcode.ER_LOCK_WAIT_TIMEOUT, errorcode.ER_LOCK_DEADLOCK}
+
+
+class DatabaseUnavailable(Error):
+    """The database cannot be reached (or the circuit is open); the lane is offline"""
+
+    def __init__(self, msg: str = "Database unavailable.", retry_in: float = 0.0):
+        super().__init__(msg=msg, errno=errorcode.CR_CONN_HOST_ERROR)
+        self.retry_in = retry_in  # seconds until the next connection attempt is allowed
+
+
+def is_connection_error(error: Exception) -> bool:
+    """The error means the server is unreachable, not that the statement was wrong"""
+    if isinstance(error, DatabaseUnavailable):
+        return True
+    if not isinstance(error, Error):
+        return False
+    return error.errno in CONNECTION_ERRNOS or (isinstance(error, InterfaceError)
+                                                and error.errno is None)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Running the same read again may succeed (and not just time out again)"""
+    return (not isinstance(error, (DatabaseUnavailable, ReadTimeoutError, WriteTimeoutError))
+            and isinstance(error, Error)
+            and (error.errno in RETRYABLE_ERRNOS or is_connection_error(error)))
+
+
+class CircuitBreaker:
+    """closed -> (failure_threshold failures in a row) -> open -> (reset_seconds) -> half open"""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURES,
+                 reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0          # consecutive
+        self.opened_at = 0.0
+        self.trips = 0
+        self.recoveries = 0
+        self.rejected = 0
+        self._probing = False
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback):
+        """callback(state) runs whenever the circuit opens or closes (on the caller's thread)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, state: str):
+        for callback in list(self._listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"[Resilience] Circuit listener failed: {e}")
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def before_call(self):
+        """Raise DatabaseUnavailable when the circuit is open (or a probe is already out)"""
+        with self._lock:
+            if self.state == self.OPEN and self.retry_in() <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_in = self.retry_in()
+        raise DatabaseUnavailable(f"Database unavailable (circuit open, retrying in "
+                                  f"{retry_in:.0f}s).", retry_in)
+
+    def record_success(self):
+        with self._lock:
+            recovered = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+            if recovered:
+                self.recoveries += 1
+        if recovered:
+            print("[Resilience] Database reachable again; circuit closed.")
+            self._notify(self.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            tripped = (self.state == self.HALF_OPEN
+                       or (self.state == self.CLOSED and self.failures >= self.failure_threshold))
+            if tripped:
+                # A failed half-open probe re-opens the same outage, not a new trip
+                self.trips += self.state == self.CLOSED
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+        if tripped:
+            print(f"[Resilience] Database unreachable after {self.failures} failures; "
+                  f"circuit open for {self.reset_seconds:g}s.")
+            self._notify(self.OPEN)
+
+    def call(self, func, *args, **kwargs):
+        """Run func (a connect) through the breaker; connection errors count as failures"""
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Error as e:
+            if is_connection_error(e):
+                self.record_failure()
+            else:
+                # Not the network (bad credentials, pool exhausted...): say nothing
+                # about the server, just let the next caller probe
+                with self._lock:
+                    self._probing = False
+            raise
+        self.record_success()
+        return result
+
+
+_breaker = CircuitBreaker()
+_retries = 0
+_retry_lock = threading.Lock()
+
+
+def get_breaker() -> CircuitBreaker:
+    """Process-wide breaker shared by every connection"""
+    return _breaker
+
+
+def is_offline() -> bool:
+    """True while the circuit is open: the lane should use cached data and not sell"""
+    return _breaker.state != CircuitBreaker.CLOSED
+
+
+def backoff_delay(attempt: int, base_ms: float = RETRY_BASE_MS,
+                  max_ms: float = RETRY_MAX_MS) -> float:
+    """Seconds to wait before retry number `attempt` (1, 2, ...): full jitter, capped"""
+    return random.uniform(0, min(max_ms, base_ms * 2 ** (attempt - 1))) / 1000
+
+
+def retry_read(func, *args, attempts: int = RETRY_ATTEMPTS,
+               budget_ms: float = RETRY_BUDGET_MS, **kwargs):
+    """
+    Call an idempotent read, again after a jittered backoff if it fails with a
+    retryable error, as long as the next try would start within budget_ms of
+    the first (a lane must not freeze for several read timeouts in a row).
+    func must open its own connection so each attempt starts clean (and goes
+    through the breaker, which stops the retries once it opens).
+    """
+    global _retries
+    started = time.monotonic()
+    for attempt in range(1, attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except Error as e:
+            # Connect failures are already counted by the breaker (as DatabaseUnavailable);
+            # a connection lost during the read is a failure it has not seen
+            if is_connection_error(e) and not isinstance(e, DatabaseUnavailable):
+                _breaker.record_failure()
+            if not is_retryable(e) or attempt == attempts:
+                raise
+            delay = backoff_delay(attempt)
+            if (time.monotonic() - started + delay) * 1000 > budget_ms:
+                raise
+            with _retry_lock:
+                _retries += 1
+            time.sleep(delay)
+
+
+def resilience_stats() -> dict:
+    """Breaker state and counters since start-up"""
+    return {
+        'state': _breaker.state,
+        'consecutive_failures': _breaker.failures,
+        'trips': _breaker.trips,
+        'recoveries': _breaker.recoveries,
+        'rejected': _breaker.rejected,
+        'read_retries': _retries,
+    }
@@ -0,0 +1,363 @@
+"""
+SQLiteBackend.py
+Embedded SQLite storage for a standalone lane, benchmarks and tests
+
+connect() returns a connection with the small part of the mysql.connector
+API the app uses (cursor(dictionary=True), commit/rollback, lastrowid,
+rowcount, start_transaction, is_connected), so controllers, services and
+the query instrumentation run unchanged:
+    - %s placeholders become ? and %% becomes % (Model builders keep the
+      MySQL "format" paramstyle; see Utilities/Dialect.py)
+    - dates and datetimes are stored as ISO text and read back as
+      datetime.date / datetime.datetime, as MySQL returns them
+    - sqlite3 errors are re-raised as mysql.connector errors, so existing
+      `except Error` / ER_DUP_ENTRY handling still applies
+
+The database runs in WAL mode (readers never block the writer) and writes
+take the lock up front (BEGIN IMMEDIATE) so concurrent writers queue for
+SQLITE_BUSY_TIMEOUT instead of failing on a lock upgrade. A new file gets
+the current schema plus ProjectSyPointRecords.txt, and every migration is
+recorded as applied.
+"""
+import datetime
+import decimal
+import os
+import re
+import sqlite3
+
+from mysql.connector import errorcode, errors
+
+from Utilities.Settings import SQLITE_PATH, SQLITE_BUSY_TIMEOUT
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RECORDS_FILE = os.path.join(_ROOT, "ProjectSyPointRecords.txt")
+
+_PLACEHOLDER = re.compile(r"%([s%])")
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{1,6})?$")
+
+sqlite3.register_adapter(datetime.datetime, lambda value: value.strftime("%Y-%m-%d %H:%M:%S"))
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+sqlite3.register_adapter(decimal.Decimal, float)
+
+# Current schema (mirrors projectsypoint_database_schema.txt)
+SQLITE_SCHEMA = """
+CREATE TABLE categories (
+    category_id INTEGER PRIMARY KEY,
+    category_name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE discount_types (
+    discount_type_id INTEGER PRIMARY KEY,
+    type_name VARCHAR(50) NOT NULL UNIQUE,
+    discount_percentage DECIMAL(5,2) NOT NULL DEFAULT 0
+);
+
+CREATE TABLE users (
+    user_id INTEGER PRIMARY KEY,
+    username VARCHAR(50) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('admin','cashier')),
+    shift TEXT NOT NULL CHECK (shift IN ('morning','afternoon','evening','night')),
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime'))
+);
+
+CREATE TABLE products (
+    product_id INTEGER PRIMARY KEY,
+    reference_number VARCHAR(50) NOT NULL UNIQUE,
+    product_name VARCHAR(200) NOT NULL,
+    price DECIMAL(10,2) NOT NULL,
+    category_id INT NOT NULL REFERENCES categories(category_id),
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime'))
+);
+
+CREATE TABLE terminals (
+    terminal_id INTEGER PRIMARY KEY,
+    terminal_code VARCHAR(50) NOT NULL UNIQUE,
+    display_name VARCHAR(100),
+    number_prefix VARCHAR(20),
+    is_active BOOLEAN DEFAULT TRUE,
+    hostname VARCHAR(100),
+    process_id INT,
+    current_user_id INT,
+    registered_at DATETIME NOT NULL,
+    last_heartbeat DATETIME
+);
+
+CREATE TABLE transactions (
+    transaction_id INTEGER PRIMARY KEY,
+    transaction_number VARCHAR(50) NOT NULL UNIQUE,
+    cashier_id INT NOT NULL REFERENCES users(user_id),
+    terminal_id INT,
+    transaction_date DATETIME NOT NULL DEFAULT (DATETIME('now', 'localtime')),
+    subtotal DECIMAL(10,2) NOT NULL,
+    tax_amount DECIMAL(10,2) NOT NULL DEFAULT 0,
+    discount_amount DECIMAL(10,2) DEFAULT 0,
+    final_total DECIMAL(10,2) NOT NULL,
+    discount_type_id INT REFERENCES discount_types(discount_type_id),
+    status TEXT DEFAULT 'completed' CHECK (status IN ('completed','voided')),
+    void_reason TEXT,
+    created_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (DATETIME('now', 'localtime'))
+);
+CREATE INDEX idx_transactions_date_status ON transactions (transaction_date, status);
+CREATE INDEX idx_transactions_terminal_date ON transactions (terminal_id, transaction_date);
+
+CREATE TABLE transaction_items (
+    transaction_item_id INTEGER PRIMARY KEY,
+    transaction_id INT NOT NULL,
+    transaction_date DATETIME NOT NULL,
+    product_id INT NOT NULL REFERENCES products(product_id),
+    product_name VARCHAR(200) NOT NULL,
+    quantity DECIMAL(10,2) NOT NULL,
+    unit_price DECIMAL(10,2) NOT NULL,
+    total_price DECIMAL(10,2) NOT NULL
+);
+CREATE INDEX idx_transaction_items_transaction ON transaction_items (transaction_id, transaction_date);
+
+CREATE TABLE transactions_archive AS SELECT * FROM transactions WHERE 0;
+CREATE TABLE transaction_items_archive AS SELECT * FROM transaction_items WHERE 0;
+CREATE VIEW transactions_all AS
+SELECT * FROM transactions UNION ALL SELECT * FROM transactions_archive;
+CREATE VIEW transaction_items_all AS
+SELECT * FROM transaction_items UNION ALL SELECT * FROM transaction_items_archive;
+
+CREATE TABLE payments (
+    payment_id INTEGER PRIMARY KEY,
+    transaction_id INT NOT NULL,
+    payment_method VARCHAR(20) NOT NULL,
+    amount DECIMAL(10,2) NOT NULL,
+    tendered DECIMAL(10,2) NOT NULL,
+    change_amount DECIMAL(10,2) NOT NULL DEFAULT 0,
+    payment_date DATETIME NOT NULL
+);
+CREATE INDEX idx_payments_transaction ON payments (transaction_id);
+CREATE INDEX idx_payments_method_date ON payments (payment_method, payment_date);
+CREATE INDEX idx_payments_date ON payments (payment_date);
+
+CREATE TABLE product_daily_sales (
+    sale_date DATE NOT NULL,
+    product_id INT NOT NULL REFERENCES products(product_id),
+    terminal_id INT NOT NULL DEFAULT 0,
+    product_name VARCHAR(200) NOT NULL,
+    quantity DECIMAL(12,2) NOT NULL DEFAULT 0,
+    revenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (sale_date, product_id, terminal_id)
+);
+
+CREATE TABLE sales_events (
+    event_id INTEGER PRIMARY KEY,
+    transaction_id INT NOT NULL,
+    cashier_id INT NOT NULL,
+    event_time DATETIME NOT NULL DEFAULT (DATETIME('now', 'localtime')),
+    final_total DECIMAL(10,2) NOT NULL,
+    items_count DECIMAL(10,2) NOT NULL
+);
+CREATE INDEX idx_sales_events_time ON sales_events (event_time);
+
+CREATE TABLE schema_migrations (
+    migration_id VARCHAR(100) PRIMARY KEY,
+    applied_at DATETIME NOT NULL
+);
+"""
+
+
+def _translate_error(error: sqlite3.Error) -> errors.Error:
+    """sqlite3 error -> the mysql.connector error the app already handles"""
+    message = str(error)
+    if isinstance(error, sqlite3.IntegrityError):
+        errno = errorcode.ER_DUP_ENTRY if "UNIQUE" in message or "PRIMARY KEY" in message else None
+        return errors.IntegrityError(msg=message, errno=errno)
+    if isinstance(error, sqlite3.OperationalError):
+        if "locked" in message or "busy" in message:
+            return errors.DatabaseError(msg=message, errno=errorcode.ER_LOCK_WAIT_TIMEOUT)
+        return errors.ProgrammingError(msg=message)
+    return errors.DatabaseError(msg=message)
+
+
+def _convert(value):
+    """ISO date / datetime text -> date / datetime, as mysql.connector returns them"""
+    if isinstance(value, str):
+        if _DATETIME.match(value):
+            return datetime.datetime.fromisoformat(value)
+        if _DATE.match(value):
+            return datetime.date.fromisoformat(value)
+    return value
+
+
+class SQLiteCursor:
+    """mysql.connector-style cursor over a sqlite3 cursor"""
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def column_names(self) -> tuple:
+        return tuple(column[0] for column in self._cursor.description or ())
+
+    @staticmethod
+    def _operation(operation: str, params) -> str:
+        # Like mysql.connector, placeholders are only processed when params are given
+        if params is None:
+            return operation
+        return _PLACEHOLDER.sub(lambda match: "?" if match.group(1) == "s" else "%", operation)
+
+    def execute(self, operation: str, params=None):
+        try:
+            if params is None:
+                self._cursor.execute(operation)
+            else:
+                self._cursor.execute(self._operation(operation, params), tuple(params))
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+
+    def executemany(self, operation: str, seq_params):
+        try:
+            self._cursor.executemany(self._operation(operation, ()),
+                                     [tuple(params) for params in seq_params])
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+
+    def _row(self, row):
+        if row is None:
+            return None
+        values = tuple(_convert(value) for value in row)
+        if self._dictionary:
+            return dict(zip(self.column_names, values))
+        return values
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1) -> list:
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self) -> list:
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """mysql.connector-style connection over a sqlite3 connection"""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def cursor(self, dictionary: bool = False, buffered: bool = None) -> SQLiteCursor:
+        # sqlite3 cursors already behave like buffered ones
+        return SQLiteCursor(self._connection.cursor(), dictionary)
+
+    def start_transaction(self, consistent_snapshot: bool = False, readonly: bool = False, **_):
+        """Open a transaction now (in WAL mode the first read pins the snapshot)"""
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+
+    def commit(self):
+        try:
+            self._connection.commit()
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def is_connected(self) -> bool:
+        try:
+            self._connection.execute("SELECT 1")
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+    def close(self):
+        self._connection.close()
+
+
+def database_path(path: str = None) -> str:
+    path = path or SQLITE_PATH
+    return path if os.path.isabs(path) or path == ":memory:" else os.path.join(_ROOT, path)
+
+
+def create_schema(connection: sqlite3.Connection, records_file: str = RECORDS_FILE):
+    """Create the current schema (and the sample records) unless it already exists"""
+    from Utilities.Migrations import MIGRATIONS
+
+    def exists():
+        return connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transactions'").fetchone()
+
+    if exists():
+        return
+    # Another lane may be creating it too; re-check under the write lock
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        if exists():
+            connection.rollback()
+            return
+        for statement in SQLITE_SCHEMA.split(";"):
+            if statement.strip():
+                connection.execute(statement)
+        if records_file and os.path.exists(records_file):
+            with open(records_file, encoding="utf-8") as records:
+                # First line is the file title, not SQL
+                script = records.read().split("\n", 1)[1]
+            for statement in script.split(";\n"):
+                if statement.strip():
+                    connection.execute(statement)
+        applied_at = datetime.datetime.now()
+        connection.executemany(
+            "INSERT INTO schema_migrations (migration_id, applied_at) VALUES (?, ?)",
+            [(migration_id, applied_at) for migration_id, _, _ in MIGRATIONS])
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def connect(path: str = None, **_) -> SQLiteConnection:
+    """
+    Open (creating on first use) the SQLite database at path (default SQLITE_PATH)
+    mysql.connector-only options such as allow_local_infile are ignored
+    """
+    path = database_path(path)
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        connection = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT,
+                                     isolation_level="IMMEDIATE", check_same_thread=False)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        create_schema(connection)
+    except sqlite3.Error as e:
+        raise _translate_error(e) from e
+    return SQLiteConnection(connection)
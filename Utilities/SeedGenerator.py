@@ -0,0 +1,309 @@
+"""
+SeedGenerator.py
+Bulk synthetic sales history for load testing reports and the dashboard
+
+Generates transactions, items, payments and product_daily_sales counters
+for a date range with realistic shapes:
+    - hour-of-day curve with lunch and after-work peaks
+    - weekday / December / year-over-year volume changes
+    - Zipf-skewed product popularity and geometric basket sizes
+    - PWD / Senior Citizen discounts, cash / GCash / split payments, voids
+Rows are written with multi-row INSERTs (executemany) or LOAD DATA LOCAL
+INFILE, a day-chunk per commit. Products, cashiers and discount types are
+read from the database, so seed ProjectSyPointRecords.txt first.
+
+Seeded transactions are numbered SEED-YYYYMMDD-<id>; use a scratch database.
+"""
+import datetime
+import math
+import os
+import random
+import tempfile
+import time
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.Dialect import sql
+from Utilities.Settings import SEED_BATCH_ROWS, TAX_RATE
+
+
+SEED_PREFIX = "SEED"
+
+# Relative volume per hour of day (store opens 07:00, closes 22:00)
+HOUR_WEIGHTS = {7: 2, 8: 4, 9: 5, 10: 6, 11: 9, 12: 11, 13: 9, 14: 6, 15: 5,
+                16: 6, 17: 9, 18: 11, 19: 9, 20: 6, 21: 3}
+# Monday..Sunday
+WEEKDAY_WEIGHTS = (0.90, 0.85, 0.90, 0.95, 1.15, 1.35, 1.25)
+MONTH_WEIGHTS = {1: 0.90, 11: 1.10, 12: 1.40}
+YEARLY_GROWTH = 0.08
+
+# Basket lines are 1 + geometric(BASKET_P), capped; quantities per line
+BASKET_P = 0.3
+MAX_BASKET_LINES = 20
+QUANTITY_CHOICES = (1, 1, 1, 1, 2, 2, 3)
+# Zipf exponent of product popularity (higher = more skewed)
+POPULARITY_SKEW = 1.1
+
+DISCOUNT_RATE = 0.08
+DISCOUNT_PERCENT = 0.20
+VOID_RATE = 0.01
+PAYMENT_MIX = (("Cash", 0.72), ("GCash", 0.22), ("Split", 0.06))
+
+# Cashier shift -> hours worked
+SHIFT_HOURS = {
+    "morning": range(6, 12),
+    "afternoon": range(12, 18),
+    "evening": range(18, 24),
+    "night": range(0, 6),
+}
+
+TRANSACTION_COLUMNS = ("transaction_id", "transaction_number", "cashier_id", "transaction_date",
+                       "subtotal", "tax_amount", "discount_amount", "final_total",
+                       "discount_type_id", "status", "void_reason")
+ITEM_COLUMNS = ("transaction_id", "product_id", "product_name", "quantity", "unit_price",
+                "total_price", "transaction_date")
+PAYMENT_COLUMNS = ("transaction_id", "payment_method", "amount", "tendered", "change_amount",
+                   "payment_date")
+COUNTER_COLUMNS = ("sale_date", "product_id", "product_name", "quantity", "revenue")
+
+
+def parse_count(text: str) -> int:
+    """'500k' / '10M' / '1500000' -> int"""
+    text = text.strip().lower().replace("_", "")
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+class SeedGenerator:
+    """Generates and bulk-loads synthetic history (see module docstring)"""
+
+    def __init__(self, seed: int = 1, method: str = "insert", batch_rows: int = SEED_BATCH_ROWS):
+        if method not in ("insert", "load"):
+            raise ValueError(f"Unknown load method: {method}")
+        if method == "load" and sql().name != "mysql":
+            raise ValueError("LOAD DATA is only available on the MySQL backend")
+        self.rng = random.Random(seed)
+        self.method = method
+        self.batch_rows = batch_rows
+
+        self.products = []          # (product_id, product_name, price)
+        self.product_weights = []   # cumulative, for rng.choices
+        self.cashiers = {}          # hour -> [cashier_id, ...]
+        self.discount_types = []    # discount_type_id list
+        self.next_id = 1
+
+    # ============================================================
+    # FIXTURE
+    # ============================================================
+
+    def load_fixture(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("SELECT product_id, product_name, price FROM products WHERE is_active = TRUE")
+        self.products = [(pid, name, float(price)) for pid, name, price in cursor.fetchall()]
+        cursor.execute("SELECT user_id, shift FROM users WHERE role = 'cashier' AND is_active = TRUE")
+        cashiers = cursor.fetchall()
+        cursor.execute("SELECT discount_type_id FROM discount_types")
+        self.discount_types = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT COALESCE(MAX(transaction_id), 0) FROM transactions")
+        self.next_id = cursor.fetchone()[0] + 1
+        cursor.close()
+
+        if not self.products or not cashiers:
+            raise RuntimeError("Seed products and cashiers first (ProjectSyPointRecords.txt)")
+
+        # Popularity follows a Zipf curve over a shuffled product order
+        order = self.products[:]
+        self.rng.shuffle(order)
+        self.products = order
+        total = 0.0
+        self.product_weights = []
+        for rank in range(1, len(order) + 1):
+            total += 1 / rank ** POPULARITY_SKEW
+            self.product_weights.append(total)
+
+        everyone = [user_id for user_id, _ in cashiers]
+        for hour in range(24):
+            on_shift = [user_id for user_id, shift in cashiers if hour in SHIFT_HOURS.get(shift, ())]
+            self.cashiers[hour] = on_shift or everyone
+
+    # ============================================================
+    # GENERATION
+    # ============================================================
+
+    @staticmethod
+    def day_weight(day: datetime.date, first_year: int) -> float:
+        return (WEEKDAY_WEIGHTS[day.weekday()] * MONTH_WEIGHTS.get(day.month, 1.0)
+                * (1 + YEARLY_GROWTH) ** (day.year - first_year))
+
+    def _basket_lines(self) -> int:
+        lines = 1 + int(math.log(1 - self.rng.random()) / math.log(1 - BASKET_P))
+        return min(lines, MAX_BASKET_LINES)
+
+    def generate_day(self, day: datetime.date, count: int, chunk: dict):
+        """Append `count` transactions on `day` to the row lists in chunk"""
+        rng = self.rng
+        hours = list(HOUR_WEIGHTS)
+        times = sorted(
+            datetime.datetime.combine(day, datetime.time(hour, rng.randrange(60), rng.randrange(60)))
+            for hour in rng.choices(hours, weights=list(HOUR_WEIGHTS.values()), k=count))
+        counters = chunk['counters']
+
+        for sold_at in times:
+            transaction_id = self.next_id
+            self.next_id += 1
+
+            lines = rng.choices(self.products, cum_weights=self.product_weights,
+                                k=self._basket_lines())
+            subtotal = 0.0
+            items = []
+            for product_id, name, price in lines:
+                qty = rng.choice(QUANTITY_CHOICES)
+                line_total = round(price * qty, 2)
+                subtotal += line_total
+                items.append((transaction_id, product_id, name, qty, price, line_total, sold_at))
+
+            discount_type_id = None
+            discount = 0.0
+            if self.discount_types and rng.random() < DISCOUNT_RATE:
+                discount_type_id = rng.choice(self.discount_types)
+                discount = round(subtotal * DISCOUNT_PERCENT, 2)
+            tax = round(subtotal * TAX_RATE, 2)
+            total = round(subtotal + tax - discount, 2)
+
+            voided = rng.random() < VOID_RATE
+            chunk['transactions'].append((
+                transaction_id, f"{SEED_PREFIX}-{day:%Y%m%d}-{transaction_id:09d}",
+                rng.choice(self.cashiers[sold_at.hour]), sold_at, round(subtotal, 2), tax,
+                discount, total, discount_type_id,
+                "voided" if voided else "completed", "Customer cancelled" if voided else None))
+            chunk['items'].extend(items)
+            if voided:
+                continue
+
+            chunk['payments'].extend(self._payments(transaction_id, total, sold_at))
+            for _, product_id, name, qty, _, line_total, _ in items:
+                counter = counters.get((day, product_id))
+                if counter is None:
+                    counters[(day, product_id)] = [name, qty, line_total]
+                else:
+                    counter[1] += qty
+                    counter[2] += line_total
+
+    def _payments(self, transaction_id: int, total: float, sold_at: datetime.datetime) -> list:
+        method = self.rng.choices([m for m, _ in PAYMENT_MIX], weights=[w for _, w in PAYMENT_MIX])[0]
+        if method == "GCash":
+            return [(transaction_id, "GCash", total, total, 0, sold_at)]
+        cash_due = total
+        rows = []
+        if method == "Split":
+            gcash = round(total * self.rng.uniform(0.2, 0.8), 2)
+            cash_due = round(total - gcash, 2)
+            rows.append((transaction_id, "GCash", gcash, gcash, 0, sold_at))
+        tendered = float(math.ceil(cash_due / 100) * 100) if self.rng.random() < 0.7 else cash_due
+        rows.append((transaction_id, "Cash", cash_due, tendered, round(tendered - cash_due, 2), sold_at))
+        return rows
+
+    # ============================================================
+    # LOADING
+    # ============================================================
+
+    def _write(self, conn, table: str, columns: tuple, rows: list, upsert: str = ""):
+        if not rows:
+            return
+        cursor = conn.cursor()
+        try:
+            if self.method == "load" and not upsert:
+                self._load_data(cursor, table, columns, rows)
+            else:
+                placeholders = ", ".join(["%s"] * len(columns))
+                query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}){upsert}"
+                for start in range(0, len(rows), self.batch_rows):
+                    cursor.executemany(query, rows[start:start + self.batch_rows])
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _tsv(value) -> str:
+        if value is None:
+            return "\\N"
+        if isinstance(value, str):
+            return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+        return str(value)
+
+    def _load_data(self, cursor, table: str, columns: tuple, rows: list):
+        handle, path = tempfile.mkstemp(suffix=f"_{table}.tsv")
+        try:
+            with os.fdopen(handle, "w", newline="", encoding="utf-8") as out:
+                for row in rows:
+                    out.write("\t".join(self._tsv(value) for value in row) + "\n")
+            cursor.execute(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE {table}
+                FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(columns)})
+            """, (path,))
+        finally:
+            os.remove(path)
+
+    def _flush(self, conn, chunk: dict):
+        self._write(conn, "transactions", TRANSACTION_COLUMNS, chunk['transactions'])
+        self._write(conn, "transaction_items", ITEM_COLUMNS, chunk['items'])
+        self._write(conn, "payments", PAYMENT_COLUMNS, chunk['payments'])
+        counters = [(day, product_id, name, qty, round(revenue, 2))
+                    for (day, product_id), (name, qty, revenue) in chunk['counters'].items()]
+        self._write(conn, "product_daily_sales", COUNTER_COLUMNS, counters,
+                    upsert=sql().upsert(("sale_date", "product_id", "terminal_id"),
+                                        add_columns=("quantity", "revenue")))
+        conn.commit()
+
+    def seed(self, items: int, start: datetime.date, end: datetime.date, progress=print) -> dict:
+        """
+        Add roughly `items` transaction items spread over [start, end]
+        Returns: {'transactions', 'items', 'seconds'}
+        """
+        days = [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+        weights = [self.day_weight(day, start.year) for day in days]
+        mean_lines = 1 / BASKET_P
+        per_weight = items / mean_lines / sum(weights)
+
+        conn = getConnection(allow_local_infile=True) if self.method == "load" else getConnection()
+        started = time.perf_counter()
+        totals = {'transactions': 0, 'items': 0}
+        try:
+            self.load_fixture(conn)
+            if sql().name == "mysql":
+                cursor = conn.cursor()
+                cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+                cursor.close()
+
+            chunk = {'transactions': [], 'items': [], 'payments': [], 'counters': {}}
+            for index, (day, weight) in enumerate(zip(days, weights)):
+                expected = weight * per_weight
+                count = int(expected) + (self.rng.random() < expected - int(expected))
+                self.generate_day(day, count, chunk)
+
+                if len(chunk['items']) >= self.batch_rows * 10 or index == len(days) - 1:
+                    totals['transactions'] += len(chunk['transactions'])
+                    totals['items'] += len(chunk['items'])
+                    self._flush(conn, chunk)
+                    chunk = {'transactions': [], 'items': [], 'payments': [], 'counters': {}}
+                    elapsed = time.perf_counter() - started
+                    progress(f"  {day}: {totals['items']:,} items, "
+                             f"{totals['items'] / elapsed:,.0f} items/s")
+        finally:
+            conn.close()
+
+        totals['seconds'] = time.perf_counter() - started
+        return totals
+
+
+def count_items() -> int:
+    """Transaction items currently in the database"""
+    conn = getConnection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM transaction_items")
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count
+    finally:
+        conn.close()
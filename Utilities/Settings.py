@@ -0,0 +1,118 @@
+"""
+Settings.py
+Application-wide settings - single source for values that were previously
+hardcoded in several views, controllers and queries
+Read once on import from the configuration (Utilities/Config.py: defaults,
+then sypoint.ini, then SYPOINT_* environment variables)
+"""
+import socket
+
+from Utilities.Config import load_config
+
+CONFIG = load_config()
+_get = CONFIG.get
+
+# VAT applied on top of the cart subtotal at checkout
+TAX_RATE = _get("store", "tax_rate")
+
+
+def tax_label() -> str:
+    """Label used on the order summary, payment popup and receipt, e.g. 'Tax (12%):'"""
+    return f"Tax ({TAX_RATE * 100:g}%):"
+
+
+def compute_tax(subtotal: float) -> float:
+    """Tax for a subtotal, rounded to centavos as stored on the transaction"""
+    return round(subtotal * TAX_RATE, 2)
+
+
+# Store name reported with every telemetry span
+STORE_CODE = _get("store", "code")
+
+
+# Receipt text files written after each sale
+RECEIPTS_FOLDER = _get("receipts", "folder")
+RECEIPT_WIDTH = _get("receipts", "width")
+
+
+# Query instrumentation (Utilities/QueryStats.py); paths are relative to the project root
+QUERY_INSTRUMENTATION = _get("features", "query_instrumentation")
+SLOW_QUERY_MS = _get("queries", "slow_query_ms")
+SLOW_QUERY_LOG = _get("queries", "slow_query_log")
+QUERY_STATS_REPORT = _get("queries", "stats_report")
+# Server-side prepared statements for the checkout path (Utilities/Statements.py)
+PREPARED_STATEMENTS = _get("features", "prepared_statements")
+
+
+# Storage backend: "mysql" (shared server) or "sqlite" (embedded file for a
+# standalone lane, benchmarks and tests)
+DB_BACKEND = _get("database", "backend")
+MYSQL_CONFIG = {
+    "host": _get("database", "host"),
+    "port": _get("database", "port"),
+    "user": _get("database", "user"),
+    "password": _get("database", "password"),
+    "database": _get("database", "name"),
+    "connection_timeout": _get("database", "connect_timeout"),
+}
+# Socket read/write timeouts, so a stalled server fails the call instead of hanging the lane
+for _option in ("read_timeout", "write_timeout"):
+    if _get("database", _option):
+        MYSQL_CONFIG[_option] = _get("database", _option)
+# Connections kept by getPooledConnection()'s pool
+DB_POOL_SIZE = _get("database", "pool_size")
+# Retries for idempotent reads and the connection circuit breaker (Utilities/Resilience.py)
+RETRY_ATTEMPTS = _get("resilience", "retry_attempts")
+RETRY_BASE_MS = _get("resilience", "retry_base_ms")
+RETRY_MAX_MS = _get("resilience", "retry_max_ms")
+RETRY_BUDGET_MS = _get("resilience", "retry_budget_ms")
+BREAKER_FAILURES = _get("resilience", "breaker_failures")
+BREAKER_RESET_SECONDS = _get("resilience", "breaker_reset_seconds")
+# Created with the schema and ProjectSyPointRecords.txt on first connect
+SQLITE_PATH = _get("database", "sqlite_path")
+# Seconds a writer waits for another lane's write lock before failing
+SQLITE_BUSY_TIMEOUT = _get("database", "sqlite_busy_timeout")
+
+# Empty monthly partitions kept ahead of today on transactions / transaction_items
+# (Utilities/Partitions.py; MySQL only)
+PARTITION_MONTHS_AHEAD = _get("partitions", "months_ahead")
+# Rows per statement in batched migration backfills / seed tool INSERTs
+BACKFILL_BATCH_SIZE = _get("batches", "backfill_batch_size")
+SEED_BATCH_ROWS = _get("batches", "seed_batch_rows")
+
+
+# Analytics (Utilities/AnalyticsService.py): seconds results for closed days /
+# today stay cached; with the cache switched off every call queries
+ANALYTICS_CACHE = _get("features", "analytics_cache")
+ANALYTICS_HISTORY_TTL = _get("cache", "history_ttl") if ANALYTICS_CACHE else 0
+ANALYTICS_OPEN_DAY_TTL = _get("cache", "open_day_ttl") if ANALYTICS_CACHE else 0
+DETAIL_PAGE_SIZE = _get("dashboard", "detail_page_size")
+# Admin dashboard live updates from the sales event outbox
+LIVE_DASHBOARD = _get("features", "live_dashboard")
+LIVE_POLL_INTERVAL_MS = _get("dashboard", "live_poll_ms")
+LIVE_GAP_SECONDS = _get("dashboard", "live_gap_seconds")
+LIVE_GAP_WINDOW = _get("dashboard", "live_gap_window")
+# Concurrent queries (and pooled connections) for a report package
+REPORT_WORKERS = _get("reports", "workers")
+
+
+# Performance telemetry (Utilities/Telemetry.py): span log and /metrics endpoint
+TELEMETRY = _get("features", "telemetry")
+TELEMETRY_JSONL = _get("telemetry", "jsonl_path")
+TELEMETRY_MAX_BYTES = _get("telemetry", "max_bytes")
+TELEMETRY_BACKUPS = _get("telemetry", "backups")
+TELEMETRY_METRICS_HOST = _get("telemetry", "metrics_host")
+TELEMETRY_METRICS_PORT = _get("telemetry", "metrics_port")
+
+
+# On-demand profiling of the GUI (Utilities/Profiler.py)
+PROFILE_FOLDER = _get("profiler", "folder")
+PROFILE_SECONDS = _get("profiler", "seconds")
+
+
+# Terminal identity (Utilities/Terminals.py): each process is one lane, named by
+# [terminal] code / SYPOINT_TERMINAL (default: this machine's host name)
+TERMINAL_CODE = _get("terminal", "code") or socket.gethostname()
+# Seconds between heartbeats, and of silence after which a terminal shows as offline
+TERMINAL_HEARTBEAT_SECONDS = _get("terminal", "heartbeat_seconds")
+TERMINAL_OFFLINE_SECONDS = _get("terminal", "offline_seconds")
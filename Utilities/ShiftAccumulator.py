@@ -0,0 +1,159 @@
+"""
+ShiftAccumulator.py
+In-memory running totals for one cashier's day, kept per login session
+
+TransactionController records every confirmed payment here, so the Shift
+Summary can be shown instantly without querying the database. Sales made
+elsewhere (e.g. an earlier login today) come in through reconcile(), which
+rebuilds the totals from the database in the background and re-applies any
+session sales the database result does not contain yet.
+"""
+import heapq
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+
+@dataclass
+class ShiftSale:
+    transaction_id: int
+    transaction_number: str
+    sold_at: datetime
+    final_total: float
+    items: list = field(default_factory=list)     # [(product_name, quantity), ...]
+    payments: list = field(default_factory=list)  # [(payment_method, amount), ...]
+    discount_type: str = None
+
+    @property
+    def payment_method(self) -> str:
+        """'Cash', 'GCash' or 'GCash + Cash' for split tenders"""
+        return " + ".join(dict.fromkeys(method for method, _ in self.payments)) or 'Cash'
+
+
+@dataclass
+class ShiftTotals:
+    total_sales: float = 0.0
+    items_sold: int = 0
+    transaction_count: int = 0
+    product_quantities: dict = field(default_factory=dict)  # product_name -> quantity
+    payment_methods: dict = field(default_factory=dict)     # method -> [tenders, total]
+    hourly: dict = field(default_factory=dict)              # hour -> [count, total]
+    transactions: list = field(default_factory=list)        # ShiftSale, oldest first
+
+    @property
+    def avg_sale(self) -> float:
+        return self.total_sales / self.transaction_count if self.transaction_count > 0 else 0
+
+    def apply(self, sale: ShiftSale):
+        quantity = sum(qty for _, qty in sale.items)
+        self.total_sales += sale.final_total
+        self.items_sold += quantity
+        self.transaction_count += 1
+
+        for name, qty in sale.items:
+            self.product_quantities[name] = self.product_quantities.get(name, 0) + qty
+
+        for method_name, amount in sale.payments:
+            method = self.payment_methods.setdefault(method_name, [0, 0.0])
+            method[0] += 1
+            method[1] += amount
+
+        hour = self.hourly.setdefault(sale.sold_at.hour, [0, 0.0])
+        hour[0] += 1
+        hour[1] += sale.final_total
+
+        self.transactions.append(sale)
+
+
+class ShiftAccumulator:
+    """Thread-safe running shift totals for one cashier and day"""
+
+    def __init__(self, cashier_id: int, day: date):
+        self.cashier_id = cashier_id
+        self.day = day
+        self.reconciled_at = None
+
+        self._lock = threading.Lock()
+        self._totals = ShiftTotals()
+        self._ids = set()
+        # Sales recorded by this session, re-applied over each reconcile result
+        self._session_sales = {}
+
+    @property
+    def shift_start(self) -> datetime:
+        return datetime.combine(self.day, datetime.min.time())
+
+    def record_sale(self, sale: ShiftSale):
+        """Add a confirmed sale (ignored if already counted)"""
+        with self._lock:
+            self._session_sales[sale.transaction_id] = sale
+            if sale.transaction_id not in self._ids:
+                self._ids.add(sale.transaction_id)
+                self._totals.apply(sale)
+
+    def reconcile(self, db_sales: list):
+        """Replace the totals with the database's view of the day (list of ShiftSale)"""
+        totals = ShiftTotals()
+        ids = set()
+        for sale in sorted(db_sales, key=lambda s: s.sold_at):
+            ids.add(sale.transaction_id)
+            totals.apply(sale)
+
+        with self._lock:
+            # Sales committed after the reconcile query ran are not in db_sales yet
+            for sale in self._session_sales.values():
+                if sale.transaction_id not in ids:
+                    ids.add(sale.transaction_id)
+                    totals.apply(sale)
+            self._totals = totals
+            self._ids = ids
+            self.reconciled_at = datetime.now()
+
+    # ============================================================
+    # READ ACCESS
+    # ============================================================
+
+    def totals(self) -> ShiftTotals:
+        """Current totals (treat as read-only)"""
+        with self._lock:
+            return self._totals
+
+    def top_products(self, limit: int = 5) -> list:
+        """[(product_name, quantity), ...] highest quantity first"""
+        with self._lock:
+            return heapq.nlargest(limit, self._totals.product_quantities.items(),
+                                  key=lambda item: item[1])
+
+    def recent_transactions(self) -> list:
+        """ShiftSale list, newest first"""
+        with self._lock:
+            return list(reversed(self._totals.transactions))
+
+
+def sales_from_rows(rows: list, payment_rows: list) -> list:
+    """
+    Build ShiftSale objects from ShiftSummaryModel rows:
+        rows         - get_shift_sales_lines_query, one row per transaction item
+        payment_rows - get_shift_payments_query, one row per tender
+    """
+    sales = {}
+    for row in rows:
+        sale = sales.get(row['transaction_id'])
+        if sale is None:
+            sale = ShiftSale(row['transaction_id'], row['transaction_number'],
+                             row['transaction_date'], float(row['final_total'] or 0),
+                             discount_type=row['discount_type'])
+            sales[row['transaction_id']] = sale
+        if row['product_name'] is not None:
+            sale.items.append((row['product_name'], int(row['quantity'])))
+
+    for row in payment_rows:
+        sale = sales.get(row['transaction_id'])
+        if sale is not None:
+            sale.payments.append((row['payment_method'], float(row['amount'])))
+
+    # Transactions recorded before the payments table existed were all cash
+    for sale in sales.values():
+        if not sale.payments:
+            sale.payments.append(('Cash', sale.final_total))
+    return list(sales.values())
@@ -0,0 +1,124 @@
+"""
+Statements.py
+Prepared-statement cache for the hot, repeated Model queries
+
+execute_statement() runs a Model query builder's (query, params) on a
+connection. On a pooled MySQL connection the statement is prepared on the
+server once and its cursor is kept per connection, keyed by the builder's
+name (e.g. "TransactionModel.get_product_query"); later calls only send the
+parameters. Unpooled connections are thrown away after a call or two, so
+they run a plain cursor, as does SQLite (sqlite3 already keeps compiled
+statements per connection). [features] prepared_statements = false runs
+every statement on a plain cursor.
+
+Prepares and executions are counted in QueryStats (the "Prep" and "Calls"
+columns of the query statistics summary).
+"""
+import threading
+import weakref
+from dataclasses import dataclass, field
+
+from mysql.connector import errorcode, Error
+
+from Utilities.QueryStats import InstrumentedCursor, get_query_stats
+from Utilities.Settings import PREPARED_STATEMENTS
+
+
+@dataclass
+class StatementResult:
+    """Everything a caller needs once the statement's cursor is reused"""
+    rows: list = field(default_factory=list)
+    lastrowid: int = None
+    rowcount: int = 0
+
+
+class _CachedStatement:
+    def __init__(self, sql: str, cursor):
+        self.sql = sql
+        self.cursor = cursor
+
+
+# Raw pooled connection -> {(builder name, dictionary): _CachedStatement}
+_statements = weakref.WeakKeyDictionary()
+_statements_lock = threading.Lock()
+
+
+def _pooled_connection(conn):
+    """The physical connection behind a pooled one, or None for unpooled/SQLite connections"""
+    # PooledMySQLConnection keeps the real connection in _cnx (None once returned to the pool)
+    return getattr(conn, "_cnx", None)
+
+
+def _statement_cache(raw) -> dict:
+    with _statements_lock:
+        cache = _statements.get(raw)
+        if cache is None:
+            cache = _statements[raw] = {}
+        return cache
+
+
+def _result(cursor, dictionary: bool) -> StatementResult:
+    rows = cursor.fetchall() if cursor.description else []
+    if dictionary and rows and not isinstance(rows[0], dict):
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in rows]
+    result = StatementResult(rows, cursor.lastrowid, cursor.rowcount)
+    flush = getattr(cursor, "flush", None)
+    if flush:
+        flush()
+    return result
+
+
+def _execute_prepared(raw, name: str, query: str, params, dictionary: bool) -> StatementResult:
+    cache = _statement_cache(raw)
+    key = (name, dictionary)
+    statement = cache.get(key)
+    if statement is None or statement.sql != query:
+        if statement is not None:
+            statement.cursor.close()
+        statement = cache[key] = _CachedStatement(
+            query, InstrumentedCursor(raw.cursor(prepared=True, dictionary=dictionary), raw))
+        get_query_stats().record_prepare(name)
+    # The cursor re-prepares when handed a different str object, even an equal one
+    statement.cursor.execute(statement.sql, params)
+    return _result(statement.cursor, dictionary)
+
+
+def forget_statements(conn):
+    """Drop the cached statements of a connection (after a reconnect or session reset)"""
+    raw = _pooled_connection(conn) or conn
+    with _statements_lock:
+        cache = _statements.pop(raw, {})
+    for statement in cache.values():
+        try:
+            statement.cursor.close()
+        except Error:
+            pass
+
+
+def execute_statement(conn, query_builder, *args, dictionary: bool = False,
+                      **kwargs) -> StatementResult:
+    """
+    Build a Model query and execute it, prepared and cached on pooled connections
+    query_builder: a Model *_query staticmethod; args/kwargs are passed to it
+    Returns: StatementResult with every row already fetched
+    """
+    query, params = query_builder(*args, **kwargs)
+    raw = _pooled_connection(conn) if PREPARED_STATEMENTS else None
+    if raw is None:
+        cursor = conn.cursor(dictionary=dictionary)
+        try:
+            cursor.execute(query, params)
+            return _result(cursor, dictionary)
+        finally:
+            cursor.close()
+
+    name = query_builder.__qualname__
+    try:
+        return _execute_prepared(raw, name, query, params, dictionary)
+    except Error as e:
+        # The server lost the statement (reconnect / session reset): prepare it again once
+        if e.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+            raise
+        forget_statements(conn)
+        return _execute_prepared(raw, name, query, params, dictionary)
@@ -0,0 +1,295 @@
+"""
+Telemetry.py
+Structured performance telemetry for the lanes
+
+Timed spans around the operations a cashier or admin waits on:
+
+    with span("checkout", items=len(cart_items)) as s:
+        ...
+        s.set(transaction_id=transaction_id)
+
+Every finished span is
+    - appended as one JSON line to TELEMETRY_JSONL (rotated at
+      TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS files kept; a worker process,
+      e.g. of the report scheduler, writes its own telemetry.<pid>.jsonl so
+      no two processes rotate the same file), e.g.
+      {"ts": "2026-10-19T09:14:03.512", "span": "checkout", "ms": 41.7,
+       "status": "ok", "store": "MAIN", "terminal": "LANE-01", "items": 3}
+    - added to an in-process latency histogram per span name, served in
+      Prometheus text format by start_metrics_server() on
+      TELEMETRY_METRICS_HOST:TELEMETRY_METRICS_PORT (/metrics), together with
+      the database circuit breaker counters (Utilities/Resilience.py)
+
+A span that raises is recorded with status "error" and the exception, then
+re-raised; fail() does the same for errors handled inside the block. With [features] telemetry = false spans cost one clock read.
+
+Errors a screen handles outside any span (shown in a message box, or
+skipped) are recorded with record_error("products_load", e): a JSON line
+with "event" instead of "span" and no duration, counted in
+sypoint_errors_total. With telemetry off they are printed instead.
+"""
+import datetime
+import functools
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Utilities.Resilience import resilience_stats
+from Utilities.Settings import (
+    STORE_CODE, TELEMETRY, TELEMETRY_BACKUPS, TELEMETRY_JSONL, TELEMETRY_MAX_BYTES,
+    TELEMETRY_METRICS_HOST, TELEMETRY_METRICS_PORT, TERMINAL_CODE
+)
+
+
+# Histogram bucket upper bounds (seconds), Prometheus style; +Inf is implied
+BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SpanStat:
+    """Cumulative latency histogram for one span name"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * len(BUCKETS_SECONDS)
+
+    def add(self, seconds: float, failed: bool):
+        self.count += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        for index, bound in enumerate(BUCKETS_SECONDS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+
+
+class Span:
+    """One timed operation; set() adds attributes to its record, fail() marks it failed"""
+
+    def __init__(self, telemetry, name: str, attributes: dict):
+        self.telemetry = telemetry
+        self.name = name
+        self.attributes = attributes
+        self.started = 0.0
+        self.failed = False
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def fail(self, error):
+        """Record an error the code handled itself (no exception left the block)"""
+        self.failed = True
+        self.attributes['error'] = str(error)
+
+    def __enter__(self):
+        for listener in self.telemetry.listeners:
+            listener.span_started(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        if exc_type is not None:
+            self.attributes['error'] = f"{exc_type.__name__}: {exc}"
+        ok = exc_type is None and not self.failed
+        self.telemetry.record(self.name, elapsed, ok, self.attributes)
+        for listener in self.telemetry.listeners:
+            listener.span_finished(self, ok)
+        return False
+
+
+class Telemetry:
+    """Span sink: JSONL file plus per-name histograms"""
+
+    def __init__(self, enabled: bool = TELEMETRY, jsonl_path: str = TELEMETRY_JSONL):
+        self.enabled = enabled
+        self.jsonl_path = jsonl_path and os.path.join(_ROOT, jsonl_path)
+        self.labels = {'store': STORE_CODE, 'terminal': TERMINAL_CODE}
+        self.spans = {}
+        self.errors = {}  # record_error() name -> count
+        # Objects with span_started(span) / span_finished(span, ok), called on the
+        # span's thread even when telemetry is off (Utilities/Profiler.py)
+        self.listeners = []
+        self._logger = None
+        self._logger_pid = None  # process that opened _logger (forked workers reopen)
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **attributes) -> Span:
+        return Span(self, name, attributes)
+
+    def timed(self, name: str):
+        """Decorator: run the function inside a span"""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name: str, seconds: float, ok: bool, attributes: dict):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.spans.setdefault(name, SpanStat()).add(seconds, not ok)
+        if self.jsonl_path:
+            record = {'ts': datetime.datetime.now().isoformat(timespec="milliseconds"),
+                      'span': name, 'ms': round(seconds * 1000, 2),
+                      'status': "ok" if ok else "error", **self.labels, **attributes}
+            self._jsonl().info(json.dumps(record, default=str))
+
+    def record_error(self, name: str, error, **attributes):
+        """An error handled outside a span (e.g. a screen that shows it in a message box)"""
+        if not self.enabled:
+            print(f"[{name}] {error}")
+            return
+        with self._lock:
+            self.errors[name] = self.errors.get(name, 0) + 1
+        if self.jsonl_path:
+            record = {'ts': datetime.datetime.now().isoformat(timespec="milliseconds"),
+                      'event': name, 'status': "error", **self.labels, **attributes,
+                      'error': f"{type(error).__name__}: {error}"}
+            self._jsonl().info(json.dumps(record, default=str))
+
+    def _jsonl(self) -> logging.Logger:
+        """Rotating JSONL writer, opened on the first span (per process)"""
+        pid = os.getpid()
+        if self._logger is None or self._logger_pid != pid:
+            with self._lock:
+                if self._logger is None or self._logger_pid != pid:
+                    path, name = self.jsonl_path, "sypoint.telemetry"
+                    if multiprocessing.parent_process() is not None:
+                        # Worker process: its own file (and logger - a forked
+                        # worker inherits the parent's handler)
+                        root, extension = os.path.splitext(path)
+                        path, name = f"{root}.{pid}{extension}", f"{name}.{pid}"
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    handler = logging.handlers.RotatingFileHandler(
+                        path, maxBytes=TELEMETRY_MAX_BYTES,
+                        backupCount=TELEMETRY_BACKUPS, encoding="utf-8")
+                    handler.setFormatter(logging.Formatter("%(message)s"))
+                    logger = logging.getLogger(name)
+                    logger.setLevel(logging.INFO)
+                    logger.propagate = False
+                    logger.addHandler(handler)
+                    self._logger, self._logger_pid = logger, pid
+        return self._logger
+
+    # ============================================================
+    # PROMETHEUS EXPOSITION
+    # ============================================================
+
+    def format_prometheus(self) -> str:
+        """Span histograms and circuit breaker counters in Prometheus text format"""
+        base = ",".join(f'{key}="{_escape(value)}"' for key, value in self.labels.items())
+        with self._lock:
+            spans = {name: (stat.count, stat.errors, stat.total_seconds, list(stat.buckets))
+                     for name, stat in sorted(self.spans.items())}
+            errors = sorted(self.errors.items())
+
+        lines = ["# HELP sypoint_span_duration_seconds Time spent in a lane operation",
+                 "# TYPE sypoint_span_duration_seconds histogram"]
+        for name, (count, _, total, buckets) in spans.items():
+            labels = f'{base},span="{_escape(name)}"'
+            for bound, calls in zip(BUCKETS_SECONDS, buckets):
+                lines.append(f'sypoint_span_duration_seconds_bucket{{{labels},le="{bound:g}"}} {calls}')
+            lines.append(f'sypoint_span_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"sypoint_span_duration_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"sypoint_span_duration_seconds_count{{{labels}}} {count}")
+
+        lines += ["# HELP sypoint_span_errors_total Lane operations that raised",
+                  "# TYPE sypoint_span_errors_total counter"]
+        for name, (_, errors, _, _) in spans.items():
+            lines.append(f'sypoint_span_errors_total{{{base},span="{_escape(name)}"}} {errors}')
+
+        lines += ["# HELP sypoint_errors_total Errors handled outside a span, by where they happened",
+                  "# TYPE sypoint_errors_total counter"]
+        for name, count in errors:
+            lines.append(f'sypoint_errors_total{{{base},event="{_escape(name)}"}} {count}')
+
+        circuit = resilience_stats()
+        lines += [
+            "# HELP sypoint_db_circuit_open 1 while the database circuit breaker is open",
+            "# TYPE sypoint_db_circuit_open gauge",
+            f"sypoint_db_circuit_open{{{base}}} {int(circuit['state'] != 'closed')}",
+        ]
+        for key, help_text in (('trips', "Times the database circuit opened"),
+                               ('recoveries', "Times the database circuit closed again"),
+                               ('rejected', "Database calls failed fast by the open circuit"),
+                               ('read_retries', "Reads retried after a transient error")):
+            lines += [f"# HELP sypoint_db_circuit_{key}_total {help_text}",
+                      f"# TYPE sypoint_db_circuit_{key}_total counter",
+                      f"sypoint_db_circuit_{key}_total{{{base}}} {circuit[key]}"]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """Process-wide telemetry shared by every screen and service"""
+    return _telemetry
+
+
+def span(name: str, **attributes) -> Span:
+    """Time a block: with span("receipt"): ..."""
+    return _telemetry.span(name, **attributes)
+
+
+def timed(name: str):
+    """Decorator timing every call of a function as a span"""
+    return _telemetry.timed(name)
+
+
+def record_error(name: str, error, **attributes):
+    """Record a handled error: record_error("products_load", e)"""
+    _telemetry.record_error(name, error, **attributes)
+
+
+# ============================================================
+# METRICS ENDPOINT
+# ============================================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = _telemetry.format_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass  # Scrapes are not worth a console line each
+
+
+def start_metrics_server(host: str = TELEMETRY_METRICS_HOST,
+                         port: int = TELEMETRY_METRICS_PORT) -> ThreadingHTTPServer:
+    """
+    Serve /metrics from a daemon thread (port 0 in the config = off)
+    Returns: the server, or None when disabled or the port is taken
+    """
+    if not TELEMETRY or not port:
+        return None
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        print(f"[Telemetry] Metrics endpoint not started on {host}:{port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
@@ -0,0 +1,157 @@
+"""
+Terminals.py
+Terminal registry - which lane (till) a process is, and whether it is alive
+
+Each process registers itself once under TERMINAL_CODE (SYPOINT_TERMINAL,
+default the host name) and gets a terminal_id plus its configuration:
+    display_name   - shown in the terminal list
+    number_prefix  - transaction number prefix (default T<terminal_id>), so
+                     numbers from different lanes can never collide
+    is_active      - a disabled terminal may not sell; every checkout re-reads
+                     it, so disabling a running lane takes effect at its next sale
+A background thread then writes a heartbeat (and the signed-in user) to the
+terminal's own row every TERMINAL_HEARTBEAT_SECONDS. Checkouts stamp
+terminal_id on the transaction and add to the terminal's own
+product_daily_sales rows (Utilities/CheckoutService.py).
+"""
+import datetime
+import os
+import socket
+import threading
+from dataclasses import dataclass
+
+from mysql.connector import Error
+
+from Utilities.DatabaseConnection import getConnection, getPooledConnection
+from Utilities.Settings import TERMINAL_CODE, TERMINAL_HEARTBEAT_SECONDS, TERMINAL_OFFLINE_SECONDS
+from Utilities.Statements import execute_statement
+from Model.TerminalModel import TerminalModel
+
+
+@dataclass
+class Terminal:
+    """A registered terminal and its configuration"""
+    terminal_id: int
+    terminal_code: str
+    display_name: str
+    number_prefix: str
+    is_active: bool
+    user_id: int = None
+
+
+class TerminalDisabled(Exception):
+    """An administrator has disabled the terminal; it may not sell"""
+
+    def __init__(self, terminal: Terminal):
+        super().__init__(f"Terminal {terminal.display_name} has been disabled. "
+                         "Ask an administrator to enable it.")
+        self.terminal = terminal
+
+
+_current = None
+_heartbeat = None
+
+
+def register_terminal(terminal_code: str = TERMINAL_CODE, conn=None) -> Terminal:
+    """
+    Register a terminal (first run) or refresh where it runs, and load its configuration
+    Returns: Terminal
+    """
+    own_connection = conn is None
+    if own_connection:
+        conn = getConnection()
+    try:
+        execute_statement(conn, TerminalModel.register_terminal_query,
+                          terminal_code, socket.gethostname(), os.getpid())
+        conn.commit()
+        row = execute_statement(conn, TerminalModel.get_terminal_query, terminal_code,
+                                dictionary=True).rows[0]
+    finally:
+        if own_connection:
+            conn.close()
+
+    return Terminal(
+        terminal_id=row['terminal_id'],
+        terminal_code=row['terminal_code'],
+        display_name=row['display_name'] or row['terminal_code'],
+        number_prefix=row['number_prefix'] or f"T{row['terminal_id']:03d}",
+        is_active=bool(row['is_active']),
+    )
+
+
+def beat(terminal: Terminal, conn=None):
+    """Write one heartbeat for a terminal"""
+    own_connection = conn is None
+    if own_connection:
+        conn = getPooledConnection()
+    try:
+        execute_statement(conn, TerminalModel.heartbeat_query, terminal.terminal_id,
+                          terminal.user_id)
+        conn.commit()
+    finally:
+        if own_connection:
+            conn.close()
+
+
+class TerminalHeartbeat(threading.Thread):
+    """Daemon thread beating for a terminal every `interval` seconds until stop()"""
+
+    def __init__(self, terminal: Terminal, interval: float = TERMINAL_HEARTBEAT_SECONDS):
+        super().__init__(name=f"heartbeat-{terminal.terminal_code}", daemon=True)
+        self.terminal = terminal
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                beat(self.terminal)
+            except Error as e:
+                print(f"[Terminals] Heartbeat failed for {self.terminal.terminal_code}: {e}")
+
+    def stop(self):
+        self._stopped.set()
+
+
+def start_terminal(terminal_code: str = TERMINAL_CODE) -> Terminal:
+    """
+    Register this process's terminal and start its heartbeat
+    Returns: Terminal, or None when the database is unreachable
+    """
+    global _current, _heartbeat
+    try:
+        _current = register_terminal(terminal_code)
+    except Error as e:
+        print(f"[Terminals] Could not register terminal {terminal_code}: {e}")
+        return None
+    _heartbeat = TerminalHeartbeat(_current)
+    _heartbeat.start()
+    return _current
+
+
+def current_terminal() -> Terminal:
+    """This process's terminal (None until start_terminal())"""
+    return _current
+
+
+def set_terminal_user(user_id: int = None):
+    """Record who is signed in at this terminal (sent with the next heartbeat)"""
+    if _current is not None:
+        _current.user_id = user_id
+
+
+def get_terminals(conn=None) -> list:
+    """Every registered terminal (dicts) with an 'online' flag from its last heartbeat"""
+    own_connection = conn is None
+    if own_connection:
+        conn = getConnection()
+    try:
+        rows = execute_statement(conn, TerminalModel.get_terminals_query, dictionary=True).rows
+    finally:
+        if own_connection:
+            conn.close()
+
+    cutoff = datetime.datetime.now() - datetime.timedelta(seconds=TERMINAL_OFFLINE_SECONDS)
+    for row in rows:
+        row['online'] = bool(row['last_heartbeat'] and row['last_heartbeat'] >= cutoff)
+    return rows
@@ -0,0 +1,99 @@
+"""
+TimeSeries.py
+Date bucketing and downsampling helpers for the sales charts
+Buckets are 'day', 'week' (weeks start on Monday, like MySQL WEEKDAY()) or 'month'
+"""
+import datetime
+from datetime import date
+
+
+BUCKETS = ("day", "week", "month")
+
+# Above this many points a series is downsampled with LTTB before plotting
+MAX_CHART_POINTS = 150
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """First day of the bucket that contains day"""
+    if bucket == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_starts(start_date: date, end_date: date, bucket: str) -> list:
+    """Every bucket start from start_date's bucket to end_date's bucket, in order"""
+    first = bucket_start(start_date, bucket)
+    last = bucket_start(end_date, bucket)
+    if bucket == "month":
+        months = (last.year - first.year) * 12 + last.month - first.month
+        return [date(first.year + (first.month - 1 + i) // 12, (first.month - 1 + i) % 12 + 1, 1)
+                for i in range(months + 1)]
+    step = 7 if bucket == "week" else 1
+    return [first + datetime.timedelta(days=i)
+            for i in range(0, (last - first).days + 1, step)]
+
+
+def bucket_for_range(start_date: date, end_date: date) -> str:
+    """
+    Finest bucket worth fetching for the span
+    Up to a few hundred points are fine: lttb() trims them to MAX_CHART_POINTS
+    """
+    days = (end_date - start_date).days + 1
+    if days <= 366:
+        return "day"
+    if days <= 3 * 366:
+        return "week"
+    return "month"
+
+
+def bucket_label(start: date, bucket: str, multi_year: bool = False) -> str:
+    """Short x-axis label for a bucket"""
+    if bucket == "month":
+        return start.strftime('%b %Y')
+    if bucket == "week":
+        return start.strftime('Wk %m/%d/%y' if multi_year else 'Wk %m/%d')
+    return start.strftime('%m/%d/%y' if multi_year else '%m/%d')
+
+
+def lttb(values: list, threshold: int = MAX_CHART_POINTS) -> list:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    Picks threshold indices that keep the visual shape of the series (peaks and
+    dips survive, unlike plain averaging); the first and last points are kept.
+    Returns: sorted list of indices into values
+    """
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    indices = [0]
+    every = (count - 2) / (threshold - 2)
+    selected = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle corner
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, count)
+        next_x = (next_start + next_end - 1) / 2
+        next_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        point_x, point_y = selected, values[selected]
+
+        best_area = -1
+        best = start
+        for j in range(start, end):
+            area = abs((point_x - next_x) * (values[j] - point_y)
+                       - (point_x - j) * (next_y - point_y))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        indices.append(best)
+        selected = best
+
+    indices.append(count - 1)
+    return indices
@@ -2,15 +2,13 @@
 AdminDashboardView.py - FIXED
 Admin Dashboard View with non-editable KPI detail tables
 """
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QGridLayout, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView,
-    QDialog, QScrollArea
+    QDialog, QScrollArea, QDateEdit
 )
 from PyQt6.QtGui import QFont, QPixmap, QCursor
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 
 
 class AdminDashboardView(QWidget):
@@ -19,7 +17,6 @@ class AdminDashboardView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - Admin Dashboard")
 
         # Main layout
@@ -60,7 +57,11 @@ class AdminDashboardView(QWidget):
             "Last 7 Days",
             "Last 30 Days",
             "This Month",
-            "Last Month"
+            "Last Month",
+            "This Year",
+            "Last 12 Months",
+            "Last 3 Years",
+            "Custom Range"
         ])
         self.chartFilterCombo.setFixedHeight(35)
         self.chartFilterCombo.setFixedWidth(150)
@@ -85,6 +86,13 @@ class AdminDashboardView(QWidget):
 
         headerLayout.addWidget(self.chartFilterCombo)
 
+        # Custom range dates (shown only for "Custom Range")
+        self.chartFromDateEdit = self._create_chart_date_edit(QDate.currentDate().addDays(-89))
+        self.chartToDateEdit = self._create_chart_date_edit(QDate.currentDate())
+        headerLayout.addWidget(self.chartFromDateEdit)
+        headerLayout.addWidget(self.chartToDateEdit)
+        self.set_custom_range_visible(False)
+
         contentLayout.addLayout(headerLayout)
 
         # KPI Cards Grid (Clickable)
@@ -114,11 +122,15 @@ class AdminDashboardView(QWidget):
         chartTitle.setStyleSheet("color: #1a1a1a;")
         chartLayout.addWidget(chartTitle)
 
-        # Matplotlib canvas
+        # Matplotlib canvas (imported here so importing this module stays cheap)
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from View.AdminGUI.SalesTrendChart import SalesTrendChart
         self.figure = Figure(figsize=(10, 4))
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setStyleSheet("background-color: white;")
         chartLayout.addWidget(self.canvas)
+        self.salesChart = SalesTrendChart(self.figure, self.canvas)
 
         contentLayout.addWidget(chartFrame)
         contentLayout.addStretch()
@@ -265,6 +277,30 @@ class AdminDashboardView(QWidget):
         layout.addStretch()
         return card
 
+    def _create_chart_date_edit(self, date: QDate):
+        """Date picker for the custom chart range"""
+        dateEdit = QDateEdit()
+        dateEdit.setDate(date)
+        dateEdit.setCalendarPopup(True)
+        dateEdit.setFixedHeight(35)
+        dateEdit.setFixedWidth(120)
+        dateEdit.setStyleSheet("""
+            QDateEdit {
+                background-color: white;
+                border: 2px solid #d0d0d0;
+                border-radius: 5px;
+                padding-left: 10px;
+                font-size: 12px;
+                color: black;
+            }
+        """)
+        return dateEdit
+
+    def set_custom_range_visible(self, visible: bool):
+        """Show or hide the custom chart range pickers"""
+        self.chartFromDateEdit.setVisible(visible)
+        self.chartToDateEdit.setVisible(visible)
+
     def update_kpi(self, card_name: str, value: str):
         """Update KPI card value"""
         card = getattr(self, f"{card_name}Card", None)
@@ -274,21 +310,12 @@ class AdminDashboardView(QWidget):
                 lbl.setText(value)
 
     def plot_sales_chart(self, dates: list, sales: list, title: str = "Sales Trend"):
-        """Plot sales line chart"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        """Plot sales line chart (artists are reused; repeated filters are blitted)"""
+        self.salesChart.set_series(dates, sales, title)
 
-        ax.plot(dates, sales, marker='o', linewidth=2, color='#1a4d2e', markersize=6)
-        ax.fill_between(dates, sales, alpha=0.2, color='#1a4d2e')
-
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
-        ax.set_xlabel('Date', fontsize=11)
-        ax.set_ylabel('Sales (PHP)', fontsize=11)
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.tick_params(axis='x', rotation=45)
-
-        self.figure.tight_layout()
-        self.canvas.draw()
+    def update_last_sales_point(self, value: float):
+        """Update today's point in place after a live sale"""
+        self.salesChart.update_last_point(value)
 
 
 class KPIDetailDialog(QDialog):
@@ -325,6 +352,39 @@ class KPIDetailDialog(QDialog):
         """)
         layout.addWidget(self.detailTable)
 
+        # Paging + close
+        footer = QHBoxLayout()
+        pageButtonStyle = """
+            QPushButton {
+                background-color: #f4d03f; color: #1a1a1a; border-radius: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background-color: #f7dc6f; }
+            QPushButton:disabled { background-color: #d0d0d0; color: #888888; }
+        """
+
+        self.prevPageButton = QPushButton("◀ Previous")
+        self.prevPageButton.setFixedHeight(40)
+        self.prevPageButton.setFixedWidth(120)
+        self.prevPageButton.setStyleSheet(pageButtonStyle)
+        self.prevPageButton.setEnabled(False)
+        footer.addWidget(self.prevPageButton)
+
+        self.pageLabel = QLabel("Page 1")
+        self.pageLabel.setFont(QFont("Arial", 11))
+        self.pageLabel.setStyleSheet("color: #666666;")
+        self.pageLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        footer.addWidget(self.pageLabel)
+
+        self.nextPageButton = QPushButton("Next ▶")
+        self.nextPageButton.setFixedHeight(40)
+        self.nextPageButton.setFixedWidth(120)
+        self.nextPageButton.setStyleSheet(pageButtonStyle)
+        self.nextPageButton.setEnabled(False)
+        footer.addWidget(self.nextPageButton)
+
+        footer.addStretch()
+
         # Close button
         closeBtn = QPushButton("Close")
         closeBtn.setFixedHeight(40)
@@ -337,7 +397,8 @@ class KPIDetailDialog(QDialog):
             QPushButton:hover { background-color: #234d35; }
         """)
         closeBtn.clicked.connect(self.close)
-        layout.addWidget(closeBtn, alignment=Qt.AlignmentFlag.AlignRight)
+        footer.addWidget(closeBtn)
+        layout.addLayout(footer)
 
     def populate_table(self, columns: list, data: list):
         """
@@ -354,4 +415,11 @@ class KPIDetailDialog(QDialog):
                 item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 # FIXED: Remove the ItemIsEditable flag to make items non-editable
                 item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.detailTable.setItem(r, c, item)
\ No newline at end of file
+                self.detailTable.setItem(r, c, item)
+
+    def set_page_state(self, page: int, has_previous: bool, has_next: bool):
+        """Update the page label and enable the paging buttons"""
+        self.pageLabel.setText(f"Page {page}")
+        self.prevPageButton.setEnabled(has_previous)
+        self.nextPageButton.setEnabled(has_next)
+        self.detailTable.scrollToTop()
@@ -13,7 +13,6 @@ class AdminProductsView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - Product Management")
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor("#f5f0e8"))
@@ -14,7 +14,6 @@ class AdminReportsView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - Sales Reports")
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor("#f5f0e8"))
@@ -172,7 +171,12 @@ class AdminReportsView(QWidget):
             "Shift Summary Report",
             "Cashier Performance Report",
             "Product Sales Report",
-            "Discount Usage Report"
+            "Discount Usage Report",
+            "Hourly Sales Report",
+            "Category Performance Report",
+            "Top Selling Products Report",
+            "Payment Method Report",
+            "All Reports (Package)"
         ])
         self.reportTypeCombo.setFixedHeight(40)
         self.reportTypeCombo.setStyleSheet("""
@@ -331,6 +335,33 @@ class AdminReportsView(QWidget):
 
         layout.addWidget(self.toDateEdit)
 
+        # Comparison period
+        compareLabel = QLabel("Compare With:")
+        compareLabel.setFont(QFont("Arial", 10))
+        compareLabel.setStyleSheet("color: #666666;")
+        layout.addWidget(compareLabel)
+
+        self.compareCombo = QComboBox()
+        self.compareCombo.addItems([
+            "None",
+            "Previous Period",
+            "Same Period Last Year"
+        ])
+        self.compareCombo.setFixedHeight(40)
+        self.compareCombo.setStyleSheet("""
+            QComboBox {
+                background-color: #f5f0e8; border: 2px solid #d0d0d0;
+                border-radius: 5px; padding-left: 10px; font-size: 12px;
+                color: #333333;
+            }
+            QComboBox QAbstractItemView {
+                background-color: white;
+                color: #333333;
+                selection-background-color: #f4d03f;
+            }
+        """)
+        layout.addWidget(self.compareCombo)
+
         layout.addSpacing(20)
 
         # Generate Button
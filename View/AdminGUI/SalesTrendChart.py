@@ -0,0 +1,161 @@
+"""
+SalesTrendChart.py
+Sales trend line chart for the Admin Dashboard
+Keeps its matplotlib artists alive between updates instead of clearing the
+figure: filter changes update line/fill data in place, and small updates
+(a new sale on today's point) are blitted over a cached background.
+Only uses matplotlib, so it can also be driven headless (benchmarks).
+"""
+from collections import OrderedDict
+
+
+class SalesTrendChart:
+    """Persistent line + fill chart drawn on an existing Figure/canvas"""
+
+    LINE_COLOR = '#1a4d2e'
+    # Cached backgrounds kept (each is a full-figure pixel buffer); the
+    # dashboard lives for the whole session, so least recently used are dropped
+    MAX_BACKGROUNDS = 8
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+
+        self.ax = figure.add_subplot(111)
+        self.ax.set_xlabel('Date', fontsize=11)
+        self.ax.set_ylabel('Sales (PHP)', fontsize=11)
+        self.ax.grid(True, alpha=0.3, linestyle='--')
+        self.ax.tick_params(axis='x', rotation=45)
+
+        # Animated artists are skipped by canvas.draw() and drawn by us, so the
+        # background captured after a full draw contains everything else
+        self.line, = self.ax.plot([], [], marker='o', linewidth=2,
+                                  color=self.LINE_COLOR, markersize=6, animated=True)
+        self.fill = self.ax.fill_between([0, 1], [0, 0], alpha=0.2,
+                                         color=self.LINE_COLOR, animated=True)
+
+        self.key = None
+        self.labels = []
+        self.values = []
+
+        # key -> background pixels, valid only for the same size/limits/labels (LRU)
+        self._backgrounds = OrderedDict()
+        self._layout_label_width = None
+
+        canvas.mpl_connect('draw_event', self._on_draw)
+        canvas.mpl_connect('resize_event', self._on_resize)
+
+    # ============================================================
+    # PUBLIC API
+    # ============================================================
+
+    def set_series(self, labels: list, values: list, title: str = "Sales Trend"):
+        """Show a new series (e.g. after a filter change)"""
+        self.labels = list(labels)
+        self.values = [float(v) for v in values]
+        self._update_artist_data()
+
+        self.key = (title, tuple(self.labels), self._ylim_for(self.values))
+        background = self._cached_background()
+        if background is not None:
+            # Same axes as a previous render: reuse its background
+            self._apply_axes(title)
+            self._blit(background)
+            return
+
+        self._apply_axes(title)
+        # tight_layout is costly; only redo it when the tick labels get wider/narrower
+        label_width = max((len(str(label)) for label in self.labels), default=0)
+        if label_width != self._layout_label_width:
+            self.figure.tight_layout()
+            self._layout_label_width = label_width
+        self.canvas.draw()
+
+    def update_last_point(self, value: float):
+        """Change the newest point (today) - blitted when the y-limits still fit"""
+        if not self.values:
+            return
+        self.values[-1] = float(value)
+        self._update_artist_data()
+
+        background = self._cached_background()
+        if background is not None and value <= self.ax.get_ylim()[1]:
+            self._blit(background)
+        else:
+            title, labels, _ = self.key
+            self.key = (title, labels, self._ylim_for(self.values))
+            self._apply_axes(title)
+            self.canvas.draw()
+
+    def clear_cache(self):
+        """Forget cached backgrounds (size or style changed)"""
+        self._backgrounds.clear()
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    @staticmethod
+    def _ylim_for(values: list):
+        top = max(values) if values else 0
+        return 0, (top * 1.1 if top > 0 else 1)
+
+    def _background_key(self):
+        width, height = self.canvas.get_width_height()
+        return self.key, width, height
+
+    def _apply_axes(self, title: str):
+        _, labels, ylim = self.key
+        count = len(labels)
+        self.ax.set_xlim(-0.5, max(count - 0.5, 0.5))
+        self.ax.set_ylim(*ylim)
+
+        # Thin out tick labels on long series so they stay readable
+        step = max(1, count // 15)
+        ticks = list(range(0, count, step))
+        self.ax.set_xticks(ticks)
+        self.ax.set_xticklabels([labels[i] for i in ticks])
+        self.ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
+
+    def _update_artist_data(self):
+        xs = list(range(len(self.values)))
+        self.line.set_data(xs, self.values)
+        self.line.set_marker('o' if len(xs) <= 60 else '')
+
+        if xs:
+            verts = [(xs[0], 0)] + list(zip(xs, self.values)) + [(xs[-1], 0)]
+        else:
+            verts = [(0, 0)]
+        self.fill.set_verts([verts])
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.fill)
+        self.ax.draw_artist(self.line)
+
+    def _cached_background(self):
+        key = self._background_key()
+        background = self._backgrounds.get(key)
+        if background is not None:
+            self._backgrounds.move_to_end(key)
+        return background
+
+    def _blit(self, background):
+        self.canvas.restore_region(background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        """After every full draw: cache the static background, then draw the data"""
+        if self.key is not None:
+            key = self._background_key()
+            self._backgrounds[key] = self.canvas.copy_from_bbox(self.figure.bbox)
+            self._backgrounds.move_to_end(key)
+            while len(self._backgrounds) > self.MAX_BACKGROUNDS:
+                self._backgrounds.popitem(last=False)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        # Fires before the resize redraw, so the new layout lands in that draw
+        self.clear_cache()
+        if self.key is not None:
+            self.figure.tight_layout()
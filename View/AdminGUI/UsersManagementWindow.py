@@ -13,7 +13,6 @@ class AdminUsersView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - User Management")
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor("#f5f0e8"))
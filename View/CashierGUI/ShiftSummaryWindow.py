@@ -12,7 +12,6 @@ class ShiftSummaryView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - Shift Summary")
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor("#f5f0e8"))
@@ -2,9 +2,11 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QTableWidget, QTableWidgetItem, QHeaderView, QLineEdit, QSpinBox,
-    QComboBox, QDialog
+    QComboBox, QDialog, QCheckBox
 )
 from PyQt6.QtGui import QFont, QPixmap, QColor
+from Utilities.Settings import compute_tax, tax_label
+from Utilities.Payments import PAYMENT_METHODS, allocate_tenders, describe_methods
 
 
 class TransactionView(QWidget):
@@ -13,7 +15,6 @@ class TransactionView(QWidget):
     def __init__(self, current_user: dict = None):
         super().__init__()
         self.current_user = current_user or {}
-        self.showMaximized()
         self.setWindowTitle("SyPoint POS - Transaction")
         palette = self.palette()
         palette.setColor(self.backgroundRole(), QColor("#f5f0e8"))
@@ -354,7 +355,7 @@ class TransactionView(QWidget):
         layout.addWidget(divider1)
 
         self.subtotalLabel = self._create_summary_row("Subtotal:", "PHP 0.00")
-        self.taxLabel = self._create_summary_row("Tax (12%):", "PHP 0.00")
+        self.taxLabel = self._create_summary_row(tax_label(), "PHP 0.00")
         self.discountLabel = self._create_summary_row("Discount:", "PHP 0.00")
         layout.addLayout(self.subtotalLabel)
         layout.addLayout(self.taxLabel)
@@ -421,7 +422,7 @@ class TransactionView(QWidget):
     def update_summary(self):
         """Update order summary panel"""
         subtotal = sum(item['subtotal'] for item in self.cart_items)
-        tax = subtotal * 0.12
+        tax = compute_tax(subtotal)
         discount = 0.0
         total = subtotal + tax - discount
 
@@ -469,7 +470,7 @@ class TransactionView(QWidget):
     def get_current_total(self):
         """Get current total (subtotal + tax)"""
         subtotal = sum(item['subtotal'] for item in self.cart_items)
-        return subtotal + (subtotal * 0.12)
+        return subtotal + compute_tax(subtotal)
 
 
 class VoidTransactionDialog(QDialog):
@@ -557,7 +558,7 @@ class PaymentPopup(QWidget):
 
     def __init__(self, base_total: float, parent=None):
         super().__init__(parent)
-        self.setFixedSize(500, 650)
+        self.setFixedSize(500, 730)
         self.setWindowTitle("Process Payment")
         self.setWindowModality(Qt.WindowModality.ApplicationModal)
         self.setStyleSheet("background-color: #f5f0e8;")
@@ -609,7 +610,7 @@ class PaymentPopup(QWidget):
         methodRow.addWidget(methodLabel)
 
         self.paymentMethodComboBox = QComboBox()
-        self.paymentMethodComboBox.addItems(["Cash", "GCash"])
+        self.paymentMethodComboBox.addItems(PAYMENT_METHODS)
         self.paymentMethodComboBox.setFixedHeight(35)
         self.paymentMethodComboBox.setStyleSheet("""
             QComboBox {
@@ -638,6 +639,39 @@ class PaymentPopup(QWidget):
         amountRow.addWidget(self.amountReceivedInput)
         detailsLayout.addLayout(amountRow)
 
+        # Split payment (second tender, e.g. part GCash, rest cash)
+        self.splitPaymentCheckBox = QCheckBox("Split payment")
+        self.splitPaymentCheckBox.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        detailsLayout.addWidget(self.splitPaymentCheckBox)
+
+        splitRow = QHBoxLayout()
+        self.secondMethodComboBox = QComboBox()
+        self.secondMethodComboBox.addItems(PAYMENT_METHODS)
+        self.secondMethodComboBox.setCurrentIndex(1)
+        self.secondMethodComboBox.setFixedHeight(35)
+        self.secondMethodComboBox.setStyleSheet("""
+            QComboBox {
+                background-color: #f5f0e8; border: 2px solid #d0d0d0;
+                border-radius: 5px; padding-left: 10px;
+            }
+        """)
+        splitRow.addWidget(self.secondMethodComboBox)
+
+        self.secondAmountInput = QLineEdit()
+        self.secondAmountInput.setPlaceholderText("0.00")
+        self.secondAmountInput.setFixedHeight(35)
+        self.secondAmountInput.setStyleSheet("""
+            QLineEdit {
+                background-color: #f5f0e8; border: 2px solid #d0d0d0;
+                border-radius: 5px; padding-left: 10px;
+            }
+        """)
+        splitRow.addWidget(self.secondAmountInput)
+        detailsLayout.addLayout(splitRow)
+
+        self.secondMethodComboBox.setVisible(False)
+        self.secondAmountInput.setVisible(False)
+
         mainLayout.addWidget(detailsFrame)
 
         # Summary Frame
@@ -648,7 +682,7 @@ class PaymentPopup(QWidget):
         summaryLayout.setSpacing(10)
 
         self.subtotalLabel = self._create_summary_row("Subtotal:", f"PHP {base_total:.2f}", summaryLayout)
-        self.taxLabel = self._create_summary_row("Tax (12%):", "PHP 0.00", summaryLayout)
+        self.taxLabel = self._create_summary_row(tax_label(), "PHP 0.00", summaryLayout)
         self.discountLabel = self._create_summary_row("Discount:", "PHP 0.00", summaryLayout)
 
         divider = QFrame()
@@ -700,6 +734,10 @@ class PaymentPopup(QWidget):
         # Connect signals
         self.discountComboBox.currentTextChanged.connect(self.update_summary)
         self.amountReceivedInput.textChanged.connect(self.update_summary)
+        self.paymentMethodComboBox.currentTextChanged.connect(self.update_summary)
+        self.splitPaymentCheckBox.toggled.connect(self._toggle_split_payment)
+        self.secondMethodComboBox.currentTextChanged.connect(self.update_summary)
+        self.secondAmountInput.textChanged.connect(self.update_summary)
 
         # Initial calculation
         self.update_summary()
@@ -739,18 +777,45 @@ class PaymentPopup(QWidget):
 
         return row
 
-    def update_summary(self):
-        """Update payment summary with real-time calculations"""
+    def _toggle_split_payment(self, checked: bool):
+        """Show or hide the second tender"""
+        self.secondMethodComboBox.setVisible(checked)
+        self.secondAmountInput.setVisible(checked)
+        self.update_summary()
+
+    @staticmethod
+    def _amount(line_edit: QLineEdit) -> float:
+        try:
+            return float(line_edit.text().strip() or 0)
+        except ValueError:
+            return 0.0
+
+    def _tenders(self) -> list:
+        """[(method, amount tendered), ...] as entered"""
+        tenders = [(self.paymentMethodComboBox.currentText(), self._amount(self.amountReceivedInput))]
+        if self.splitPaymentCheckBox.isChecked():
+            tenders.append((self.secondMethodComboBox.currentText(),
+                            self._amount(self.secondAmountInput)))
+        return tenders
+
+    def _totals(self):
+        """(subtotal, tax, discount, total) for the current cart and discount"""
         cart_items = self.parent().get_cart_items() if self.parent() else []
         subtotal = sum(item['subtotal'] for item in cart_items)
-        tax = subtotal * 0.12
+        tax = compute_tax(subtotal)
         discount_rate = self.discount_rates[self.discountComboBox.currentText()]
         discount = subtotal * discount_rate
-        total = subtotal + tax - discount
+        return subtotal, tax, discount, subtotal + tax - discount
 
-        tendered_text = self.amountReceivedInput.text().strip()
-        tendered = float(tendered_text) if tendered_text else 0.0
-        change = max(0.0, tendered - total)
+    def update_summary(self):
+        """Update payment summary with real-time calculations"""
+        subtotal, tax, discount, total = self._totals()
+
+        try:
+            _, change = allocate_tenders(total, self._tenders())
+            valid = True
+        except ValueError:
+            change, valid = 0.0, False
 
         self.subtotalValue.setText(f"PHP {subtotal:.2f}")
         self.taxValue.setText(f"PHP {tax:.2f}")
@@ -758,27 +823,27 @@ class PaymentPopup(QWidget):
         self.totalValue.setText(f"PHP {total:.2f}")
         self.changeValue.setText(f"PHP {change:.2f}")
 
-        self.confirmButton.setEnabled(tendered >= total)
+        self.confirmButton.setEnabled(valid)
 
     def get_payment_data(self):
-        """Return all calculated payment details"""
-        cart_items = self.parent().get_cart_items() if self.parent() else []
-        subtotal = sum(item['subtotal'] for item in cart_items)
-        tax = subtotal * 0.12
-        discount_rate = self.discount_rates[self.discountComboBox.currentText()]
-        discount = subtotal * discount_rate
-        total = subtotal + tax - discount
-        tendered = float(self.amountReceivedInput.text() or 0)
-        change = max(0, tendered - total)
+        """
+        Return all calculated payment details
+        'payments' holds one entry per tender (method, amount, tendered, change)
+        Raises: ValueError if the tenders do not cover the total
+        """
+        subtotal, tax, discount, total = self._totals()
+        tenders = self._tenders()
+        payments, change = allocate_tenders(total, tenders)
 
         return {
             'subtotal': subtotal,
             'tax': tax,
             'discount': discount,
             'total': total,
-            'tendered': tendered,
+            'tendered': sum(payment['tendered'] for payment in payments),
             'change': change,
-            'method': self.paymentMethodComboBox.currentText(),
+            'method': describe_methods(payments),
+            'payments': payments,
             'discount_type': self.discountComboBox.currentText()
         }
 
@@ -0,0 +1,47 @@
+"""
+SessionWindow.py
+Single top-level window for a logged-in session
+Every screen's view is a page of one QStackedWidget, so switching screens
+only changes the visible page instead of closing and rebuilding windows
+A banner above the pages shows while the database is unreachable
+"""
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QStackedWidget, QLabel
+
+
+class SessionWindow(QWidget):
+    """Top-level window that stacks the session's screens"""
+
+    # Emitted from any thread (circuit breaker listeners); shown on the GUI thread
+    offline_changed = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("SyPoint POS")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self.offlineBanner = QLabel("OFFLINE - database unreachable. Showing saved figures; "
+                                    "sales cannot be completed until the connection is back.")
+        self.offlineBanner.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.offlineBanner.setStyleSheet("background-color: #d32f2f; color: white; "
+                                         "font-weight: bold; padding: 6px;")
+        self.offlineBanner.hide()
+        layout.addWidget(self.offlineBanner)
+
+        self.stack = QStackedWidget()
+        layout.addWidget(self.stack)
+
+        self.offline_changed.connect(self.offlineBanner.setVisible)
+
+    def show_page(self, view: QWidget):
+        """Add the view as a page if needed and bring it to the front"""
+        if self.stack.indexOf(view) == -1:
+            self.stack.addWidget(view)
+        self.stack.setCurrentWidget(view)
+        self.setWindowTitle(view.windowTitle())
+
+        if not self.isVisible():
+            self.showMaximized()